@@ -0,0 +1,183 @@
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+# Sushy asyncio Redfish Authentication Modes
+
+import logging
+
+from sushy import auth
+from sushy import exceptions
+
+LOG = logging.getLogger(__name__)
+
+
+class AuthBase(auth.AuthBase):
+    """Base class for authentication mechanisms of the asyncio client."""
+
+    async def authenticate(self):
+        """Perform authentication.
+
+        :raises: RuntimeError
+        """
+        if self._root_resource is None or self._connector is None:
+            raise RuntimeError('_root_resource / _connector is missing. '
+                               'Forgot to call set_context()?')
+        await self._do_authenticate()
+
+    async def refresh_session(self):
+        """Method to refresh a session to a Redfish controller."""
+
+    async def close(self):
+        """Shutdown Redfish authentication object
+
+        Undoes whatever should be undone to cancel authenticated session.
+        """
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exception_type, exception_value, traceback):
+        await self.close()
+
+
+class BasicAuth(AuthBase):
+    """Basic Authentication class for the asyncio client."""
+
+    async def _do_authenticate(self):
+        """Attempts to establish a Basic Authentication Session."""
+        LOG.debug('Setting basic authentication connector information.')
+        self._connector.set_http_basic_auth(self._username, self._password)
+
+    def can_refresh_session(self):
+        """Method to assert if session based refresh can be done."""
+        return False
+
+
+class SessionAuth(AuthBase):
+    """Session Authentication class for the asyncio client."""
+
+    def __init__(self, username=None, password=None):
+        """A class representing a Session Authentication object.
+
+        :param username: User account with admin/server-profile access
+             privilege.
+        :param password: User account password.
+        """
+        self._session_key = None
+        self._session_resource_id = None
+        self._session_auth_previously_successful = False
+        super(SessionAuth, self).__init__(username, password)
+
+    def get_session_key(self):
+        """Returns the session key."""
+        return self._session_key
+
+    def get_session_resource_id(self):
+        """Returns the session resource id."""
+        return self._session_resource_id
+
+    async def _do_authenticate(self):
+        """Establish a redfish session.
+
+        :raises: MissingXAuthToken
+        :raises: ConnectionError
+        :raises: AccessError
+        :raises: HTTPError
+        """
+        auth_token, session_uri = await self._root_resource.create_session(
+            self._username, self._password)
+        self._session_key = auth_token
+        self._session_resource_id = session_uri
+        self._session_auth_previously_successful = True
+        self._connector.set_http_session_auth(auth_token)
+
+    def can_refresh_session(self):
+        """Method to assert if session based refresh can be done."""
+        return (self._session_key is not None
+                and self._session_resource_id is not None)
+
+    async def refresh_session(self):
+        """Method to refresh a session to a Redfish controller.
+
+        :raises: MissingXAuthToken
+        :raises: ConnectionError
+        :raises: AccessError
+        :raises: HTTPError
+        """
+        self.reset_session_attrs()
+        await self._do_authenticate()
+
+    async def close(self):
+        """Close the Redfish Session."""
+        if self._session_resource_id is not None:
+            try:
+                await self._connector.delete(self._session_resource_id)
+            except (exceptions.AccessError,
+                    exceptions.ServerSideError) as exc:
+                LOG.warning('Received exception "%(exception)s" while '
+                            'attempting to delete the active session: '
+                            '%(session_id)s',
+                            {'exception': exc,
+                             'session_id': self._session_resource_id})
+            self.reset_session_attrs()
+
+    def reset_session_attrs(self):
+        """Reset active session related attributes."""
+        self._session_key = None
+        self._session_resource_id = None
+        self._connector.clear_auth()
+
+
+class SessionOrBasicAuth(SessionAuth):
+    """Session authentication falling back to Basic one if unavailable."""
+
+    def __init__(self, username=None, password=None):
+        super(SessionOrBasicAuth, self).__init__(username, password)
+        self.basic_auth = BasicAuth(username=username, password=password)
+
+    async def _fallback_to_basic_authentication(self):
+        """Fallback to basic authentication."""
+        self.reset_session_attrs()
+        self.basic_auth.set_context(self._root_resource, self._connector)
+        await self.basic_auth.authenticate()
+
+    async def _do_authenticate(self):
+        """Establish a RedfishSession, or fallback to Basic authentication.
+
+        See :py:class:`sushy.auth.SessionOrBasicAuth` for the rationale of
+        the fallback rules.
+        """
+        try:
+            await super(SessionOrBasicAuth, self)._do_authenticate()
+        except exceptions.AccessError as e:
+            if (not self.can_refresh_session()
+                    and not self._session_auth_previously_successful):
+                LOG.warning('Falling back to "Basic" authentication as '
+                            'we have been unable to authenticate to the '
+                            'BMC. Exception: %(exception)s.',
+                            {'exception': e})
+                await self._fallback_to_basic_authentication()
+            else:
+                raise
+        except exceptions.ConnectionError:
+            raise
+        except exceptions.SushyError as e:
+            LOG.debug('Received exception "%(exception)s" while '
+                      'attempting to establish a session. '
+                      'Falling back to basic authentication.',
+                      {'exception': e})
+            await self._fallback_to_basic_authentication()
+
+    async def refresh_session(self):
+        """Method to refresh a session to a Redfish controller."""
+        if self.can_refresh_session():
+            await super(SessionOrBasicAuth, self).refresh_session()
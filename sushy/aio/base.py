@@ -0,0 +1,234 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import asyncio
+import logging
+
+from sushy.resources import base
+
+LOG = logging.getLogger(__name__)
+
+_ASYNC_CLASSES = {}
+
+
+class ResourceMixin(object):
+    """Turns a resource class into its asyncio counterpart.
+
+    The mixin replaces the I/O performing parts of
+    :py:class:`sushy.resources.base.ResourceBase` with coroutines while
+    keeping the ``Field`` definitions of the original class. Construction
+    never performs I/O, use :py:meth:`refresh` (or :py:meth:`create`) to
+    fetch the resource.
+
+    Only field access is supported on the resulting objects. Sub-resource
+    properties and actions of the synchronous classes perform blocking
+    I/O and must not be used with an asyncio connector.
+    """
+
+    def __init__(self, connector, path='', redfish_version=None,
+                 registries=None, json_doc=None, root=None):
+        """A class representing the base of any asyncio Redfish resource
+
+        :param connector: A :py:class:`sushy.aio.connector.Connector`
+        :param path: sub-URI path to the resource.
+        :param redfish_version: The version of Redfish. Used to construct
+            the object according to schema of the given version.
+        :param registries: Dict of Redfish Message Registry objects to be
+            used in any resource that needs registries to parse messages
+        :param json_doc: parsed JSON document in form of Python types.
+        :param root: Sushy root object. Empty for Sushy root itself.
+        """
+        self._conn = connector
+        self._path = path
+        self._json = None
+        self._headers = None
+        self._headers_write_count = None
+        self._parse_context = None
+        self.redfish_version = redfish_version
+        self._registries = registries
+        self._is_stale = True
+        self._prefetched_docs = None
+        self._reader = None
+        self._root = root
+        if json_doc is not None:
+            self._apply_json(json_doc)
+
+    @classmethod
+    async def create(cls, connector, path='', **kwargs):
+        """Instantiate and fetch the resource.
+
+        :param connector: A :py:class:`sushy.aio.connector.Connector`
+        :param path: sub-URI path to the resource.
+        :param kwargs: Other constructor arguments.
+        :returns: the refreshed resource.
+        """
+        resource = cls(connector, path, **kwargs)
+        await resource.refresh()
+        return resource
+
+    def _apply_json(self, json_doc):
+        self._json = json_doc
+        self._parse_context = self._get_parse_context()
+        attributes = self._parse_attributes(json_doc)
+        LOG.debug('Received representation of %(type)s %(path)s: %(json)s',
+                  {'type': self.__class__.__name__,
+                   'path': self._path,
+                   'json': (attributes if self._log_resource_body
+                            else '<stripped>')})
+        self._is_stale = False
+
+    async def _get_json(self, path):
+        response = await self._conn.get(path=path)
+        try:
+            json_doc = response.json() if response.content else {}
+        except ValueError as exc:
+            LOG.error("Unable to parse JSON in response. %(exc)s. The "
+                      "server returned:\n%(data)s",
+                      {'exc': exc, 'data': response.content})
+            raise
+        return response, json_doc
+
+    async def refresh(self, force=True, json_doc=None):
+        """Refresh the resource
+
+        :param force: if set to False, will only refresh if the resource is
+            marked as stale.
+        :param json_doc: parsed JSON document in form of Python types.
+        :raises: ResourceNotFoundError
+        :raises: ConnectionError
+        :raises: HTTPError
+        """
+        if not self._is_stale and not force:
+            return
+
+        if json_doc:
+            self._headers = None
+        else:
+            response, json_doc = await self._get_json(self._path)
+            self._set_headers(response.headers)
+
+        self._apply_json(json_doc)
+
+    async def refresh_fields(self, *names):
+        """Refresh only the given fields of the resource
+
+        See :py:meth:`sushy.resources.base.ResourceBase.refresh_fields`.
+
+        :param names: names of the fields to refresh, e.g. ``power_state``.
+        :raises: ValueError if a name is not a field of the resource.
+        :raises: ResourceNotFoundError
+        :raises: ConnectionError
+        :raises: HTTPError
+        """
+        fields, properties, query = self._prepare_refresh_fields(names)
+        path = self._path if query is None else '%s?%s' % (self._path, query)
+        _response, json_doc = await self._get_json(path)
+        self._update_fields(names, fields, properties, json_doc)
+
+    def _get_headers(self, revalidate=False):
+        """Returns the HTTP headers received on the last refresh.
+
+        :param revalidate: not supported by the asyncio resources, use
+            ``await resource.refresh()`` instead.
+        :returns: dict of HTTP headers, empty if not known.
+        """
+        if revalidate:
+            raise ValueError('revalidate is not supported by asyncio '
+                             'resources, await refresh() instead')
+        return self._headers if self._headers is not None else {}
+
+    def invalidate(self, force_refresh=False):
+        """Mark the resource as stale, prompting refresh() before getting used.
+
+        :param force_refresh: not supported by the asyncio resources, use
+            ``await resource.refresh()`` instead.
+        """
+        if force_refresh:
+            raise ValueError('force_refresh is not supported by asyncio '
+                             'resources, await refresh() instead')
+        self._is_stale = True
+
+    def clone_resource(self, new_resource, path=''):
+        """Instantiate given resource using existing BMC connection context"""
+        return get_resource_class(new_resource)(
+            self._conn, path or self.path,
+            redfish_version=self.redfish_version,
+            root=self.root)
+
+
+class ResourceCollectionMixin(ResourceMixin):
+    """asyncio counterpart of the resource collections."""
+
+    _members = None
+
+    async def refresh(self, force=True, json_doc=None):
+        if force or self._is_stale:
+            self._members = None
+        await super(ResourceCollectionMixin, self).refresh(
+            force=force, json_doc=json_doc)
+
+    async def get_member(self, identity):
+        """Given the identity return a ``_resource_type`` object
+
+        :param identity: The identity of the ``_resource_type``
+        :returns: The refreshed asyncio ``_resource_type`` object
+        :raises: ResourceNotFoundError
+        """
+        return await get_resource_class(self._resource_type).create(
+            self._conn, identity, redfish_version=self.redfish_version,
+            registries=self.registries, root=self.root)
+
+    async def get_members(self):
+        """Return a list of ``_resource_type`` objects present in collection
+
+        All members are fetched concurrently. The result is cached until
+        the collection is refreshed, stale members are re-fetched on the
+        subsequent calls.
+
+        :returns: A list of ``_resource_type`` objects
+        """
+        if self._members is None:
+            self._members = list(await asyncio.gather(
+                *(self.get_member(id_) for id_ in self.members_identities)))
+        else:
+            await asyncio.gather(
+                *(member.refresh(force=False) for member in self._members))
+        return self._members
+
+
+def get_resource_class(resource_class):
+    """Get the asyncio counterpart of a resource class.
+
+    The returned class shares the ``Field`` definitions of the original one.
+
+    :param resource_class: a subclass of
+        :py:class:`sushy.resources.base.ResourceBase`.
+    :returns: a subclass of ``resource_class`` with asyncio I/O.
+    """
+    if issubclass(resource_class, ResourceMixin):
+        return resource_class
+
+    try:
+        return _ASYNC_CLASSES[resource_class]
+    except KeyError:
+        pass
+
+    if issubclass(resource_class, base.ResourceLinksBase):
+        mixin = ResourceCollectionMixin
+    else:
+        mixin = ResourceMixin
+
+    async_class = type(resource_class.__name__, (mixin, resource_class),
+                       {'__module__': resource_class.__module__,
+                        '__qualname__': resource_class.__qualname__})
+    _ASYNC_CLASSES[resource_class] = async_class
+    return async_class
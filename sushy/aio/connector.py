@@ -0,0 +1,389 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import asyncio
+import base64
+import json
+import logging
+import os
+import ssl
+from urllib import parse as urlparse
+
+import aiohttp
+from requests import structures
+
+from sushy import connector as sushy_connector
+from sushy import exceptions
+from sushy import utils
+
+LOG = logging.getLogger(__name__)
+
+
+class Response(object):
+    """Buffered HTTP response.
+
+    Mimics the parts of ``requests.Response`` that sushy relies upon, so
+    that :py:func:`sushy.exceptions.raise_for_response` and the resource
+    parsing code can be shared with the synchronous connector.
+    """
+
+    def __init__(self, status_code, headers, content, url):
+        self.status_code = status_code
+        self.headers = structures.CaseInsensitiveDict(headers or {})
+        self.content = content or b''
+        self.url = url
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        """Decode the JSON body.
+
+        :raises: ValueError if the body is not valid JSON
+        """
+        return json.loads(self.content)
+
+
+class Connector(object):
+    """asyncio counterpart of :py:class:`sushy.connector.Connector`.
+
+    All HTTP methods are coroutines. A single event loop can drive any
+    number of these connectors concurrently without a thread per BMC.
+    """
+
+    def __init__(
+            self, url, verify=True, response_callback=None,
+            server_side_retries=0, server_side_retries_delay=0,
+            connection_limit=4):
+        """Create an asyncio connector.
+
+        :param url: The base URL to the Redfish controller.
+        :param verify: Either a boolean value or a path to a CA_BUNDLE
+            file or directory with certificates of trusted CAs.
+        :param response_callback: Optional callable invoked with every
+            :py:class:`Response` received.
+        :param server_side_retries: Number of times to retry GET requests in
+            case of server side errors.
+        :param server_side_retries_delay: Time in seconds between retries.
+        :param connection_limit: Maximum number of simultaneous connections
+            opened to this BMC.
+        """
+        self._url = url
+        self._verify = verify
+        self._response_callback = response_callback
+        self._auth = None
+        self._server_side_retries = server_side_retries
+        self._server_side_retries_delay = server_side_retries_delay
+        self._connection_limit = connection_limit
+        self._session = None
+        self._headers = {}
+        self._sessions_uri = None
+
+    def _get_ssl_context(self):
+        if self._verify is False:
+            return False
+        if isinstance(self._verify, str):
+            if os.path.isdir(self._verify):
+                return ssl.create_default_context(capath=self._verify)
+            return ssl.create_default_context(cafile=self._verify)
+        return None
+
+    def _get_session(self):
+        # NOTE: the aiohttp session must be created from within the running
+        # event loop, so it is only built on the first request.
+        if self._session is None or self._session.closed:
+            # NOTE(etingof): field studies reveal that some BMCs choke at
+            # long-running persistent HTTP connections (or TCP connections).
+            # Mirror the synchronous connector and close every connection
+            # we have used.
+            tcp_connector = aiohttp.TCPConnector(
+                ssl=self._get_ssl_context(), force_close=True,
+                limit=self._connection_limit)
+            self._session = aiohttp.ClientSession(connector=tcp_connector)
+        return self._session
+
+    def set_auth(self, auth):
+        """Sets the authentication mechanism for our connector."""
+        self._auth = auth
+
+    def set_http_basic_auth(self, username, password):
+        """Sets the http basic authentication information."""
+        credentials = '%s:%s' % (username or '', password or '')
+        self._headers.pop('X-Auth-Token', None)
+        self._headers['Authorization'] = 'Basic ' + base64.b64encode(
+            credentials.encode('utf-8')).decode('ascii')
+
+    def set_http_session_auth(self, session_auth_token):
+        """Sets the session authentication information."""
+        self._headers.pop('Authorization', None)
+        self._headers['X-Auth-Token'] = session_auth_token
+
+    def clear_auth(self):
+        """Drops any basic or session authentication information."""
+        self._headers.pop('Authorization', None)
+        self._headers.pop('X-Auth-Token', None)
+
+    async def close(self):
+        """Close this connector and the associated HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    check_retry_on_exception = staticmethod(
+        sushy_connector.Connector.check_retry_on_exception)
+
+    async def _op(self, method, path='', data=None, headers=None,
+                  timeout=60, server_side_retries_left=None,
+                  allow_reauth=True, **extra_request_kwargs):
+        """Generic RESTful request handler.
+
+        :param method: The HTTP method to be used, e.g: GET, POST,
+            PUT, PATCH, etc...
+        :param path: The sub-URI or absolute URL path to the resource.
+        :param data: Optional JSON data.
+        :param headers: Optional dictionary of headers. Use None value
+                        to remove a default header.
+        :param timeout: Max time in seconds to wait for the request.
+        :param server_side_retries_left: Remaining retries. If not provided
+            will use limit provided by instance's server_side_retries
+        :param allow_reauth: Whether to allow refreshing the authentication
+            token.
+        :param extra_request_kwargs: Optional keyword arguments to pass
+            on to the aiohttp request.
+        :returns: A :py:class:`Response` object.
+        :raises: ConnectionError
+        :raises: HTTPError
+        """
+        if server_side_retries_left is None:
+            server_side_retries_left = self._server_side_retries
+
+        url = path if urlparse.urlparse(path).netloc else urlparse.urljoin(
+            self._url, path)
+        headers = dict(self._headers, **(headers or {}))
+        lc_headers = [k.lower() for k in headers]
+        if data is not None and 'content-type' not in lc_headers:
+            headers['Content-Type'] = 'application/json'
+        if 'odata-version' not in lc_headers:
+            headers['OData-Version'] = '4.0'
+        # NOTE(TheJulia): See the synchronous connector, compression
+        # changes the ETag behavior of some BMCs.
+        if 'accept-encoding' not in lc_headers:
+            headers['Accept-Encoding'] = 'identity'
+        # Allow removing default headers
+        headers = {k: v for k, v in headers.items() if v is not None}
+
+        LOG.debug('HTTP request: %(method)s %(url)s; headers: %(headers)s; '
+                  'body: %(data)s; timeout: %(timeout)s; '
+                  'request arguments: %(extra)s;',
+                  {'method': method, 'url': url,
+                   'headers': utils.sanitize(headers),
+                   'data': utils.sanitize(data),
+                   'timeout': timeout, 'extra': extra_request_kwargs})
+        try:
+            async with self._get_session().request(
+                    method, url, json=data, headers=headers,
+                    timeout=aiohttp.ClientTimeout(total=timeout),
+                    **extra_request_kwargs) as resp:
+                response = Response(resp.status, resp.headers,
+                                    await resp.read(), url)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise exceptions.ConnectionError(url=url, error=e)
+
+        if self._response_callback:
+            self._response_callback(response)
+
+        retry_kwargs = dict(extra_request_kwargs, data=data, timeout=timeout)
+
+        try:
+            exceptions.raise_for_response(method, url, response)
+        except exceptions.AccessError as e:
+            if (method == 'POST'
+                    and self._sessions_uri is not None
+                    and self._sessions_uri in url):
+                LOG.error('Authentication to the session service failed. '
+                          'Please check credentials and try again.')
+                raise
+            if not allow_reauth or self._auth is None:
+                LOG.error("Authentication error detected. Cannot proceed: "
+                          "%s", e.message)
+                raise
+            if 'Authorization' in self._headers:
+                LOG.warning('We have encountered an AccessError when '
+                            'using \'basic\' authentication. %(err)s',
+                            {'err': str(e)})
+                raise
+            try:
+                if self._auth.can_refresh_session():
+                    await self._auth.refresh_session()
+                else:
+                    LOG.warning('Session authentication appears to have '
+                                'been lost at some point in time. '
+                                'Attempting to re-authenticate.')
+                    await self._auth.authenticate()
+            except exceptions.AccessError as refresh_exc:
+                LOG.error("A failure occurred while attempting to refresh "
+                          "the session. Error: %s", refresh_exc.message)
+                raise
+            LOG.debug("Authentication refreshed successfully, "
+                      "retrying the call.")
+            # NOTE: drop the stale token, it is re-added from self._headers
+            headers.pop('X-Auth-Token', None)
+            return await self._op(
+                method, path, headers=headers,
+                server_side_retries_left=server_side_retries_left,
+                allow_reauth=False, **retry_kwargs)
+        except exceptions.ServerSideError as e:
+            if ((method.lower() == 'get'
+                 or self.check_retry_on_exception(e.message))
+                    and server_side_retries_left > 0):
+                LOG.warning('Got server side error %s in response to a '
+                            'request, retrying after %d seconds. Retries '
+                            'left %d.',
+                            e, self._server_side_retries_delay,
+                            server_side_retries_left)
+                await asyncio.sleep(self._server_side_retries_delay)
+                return await self._op(
+                    method, path, headers=headers,
+                    server_side_retries_left=server_side_retries_left - 1,
+                    **retry_kwargs)
+            raise
+        except exceptions.BadRequestError as e:
+            if (method.lower() != 'get'
+                    and self.check_retry_on_exception(e.message)
+                    and server_side_retries_left > 0):
+                LOG.warning('Server has indicated a BadRequest for %s but '
+                            'the response payload is a known retriable '
+                            'condition and we will retry in %d seconds. '
+                            'Retries left  %d.',
+                            e, self._server_side_retries_delay,
+                            server_side_retries_left)
+                await asyncio.sleep(self._server_side_retries_delay)
+                return await self._op(
+                    method, path, headers=headers,
+                    server_side_retries_left=server_side_retries_left - 1,
+                    **retry_kwargs)
+            raise
+        except exceptions.NotAcceptableError as e:
+            # NOTE(dtantsur): some HPE Gen 10 Plus machines do not allow
+            # identity encoding when fetching registries.
+            if (method.lower() == 'get'
+                    and headers.get('Accept-Encoding') == 'identity'):
+                LOG.warning('Server has indicated a NotAcceptable for %s, '
+                            'retrying without identity encoding', e)
+                headers = dict(headers, **{'Accept-Encoding': None})
+                return await self._op(
+                    method, path, headers=headers,
+                    server_side_retries_left=server_side_retries_left,
+                    **retry_kwargs)
+            raise
+
+        LOG.debug('HTTP response for %(method)s %(url)s: '
+                  'status code: %(code)s',
+                  {'method': method, 'url': url,
+                   'code': response.status_code})
+
+        return response
+
+    async def get(self, path='', data=None, headers=None, timeout=60,
+                  **extra_request_kwargs):
+        """HTTP GET method.
+
+        :param path: Optional sub-URI path to the resource.
+        :param data: Optional JSON data.
+        :param headers: Optional dictionary of headers.
+        :param timeout: Max time in seconds to wait for the request.
+        :param extra_request_kwargs: Optional keyword arguments to pass
+            on to the aiohttp request.
+        :returns: A :py:class:`Response` object.
+        :raises: ConnectionError
+        :raises: HTTPError
+        """
+        return await self._op('GET', path, data=data, headers=headers,
+                              timeout=timeout, **extra_request_kwargs)
+
+    async def post(self, path='', data=None, headers=None, timeout=60,
+                   **extra_request_kwargs):
+        """HTTP POST method.
+
+        :param path: Optional sub-URI path to the resource.
+        :param data: Optional JSON data.
+        :param headers: Optional dictionary of headers.
+        :param timeout: Max time in seconds to wait for the request.
+        :param extra_request_kwargs: Optional keyword arguments to pass
+            on to the aiohttp request.
+        :returns: A :py:class:`Response` object.
+        :raises: ConnectionError
+        :raises: HTTPError
+        """
+        return await self._op('POST', path, data=data, headers=headers,
+                              timeout=timeout, **extra_request_kwargs)
+
+    async def patch(self, path='', data=None, headers=None, etag=None,
+                    timeout=60, **extra_request_kwargs):
+        """HTTP PATCH method.
+
+        :param path: Optional sub-URI path to the resource.
+        :param data: Optional JSON data.
+        :param headers: Optional dictionary of headers.
+        :param etag: Optional eTag string.
+        :param timeout: Max time in seconds to wait for the request.
+        :param extra_request_kwargs: Optional keyword arguments to pass
+            on to the aiohttp request.
+        :returns: A :py:class:`Response` object.
+        :raises: ConnectionError
+        :raises: HTTPError
+        """
+        if etag is not None:
+            headers = dict(headers or {}, **{'If-Match': etag})
+        return await self._op('PATCH', path, data=data, headers=headers,
+                              timeout=timeout, **extra_request_kwargs)
+
+    async def put(self, path='', data=None, headers=None, timeout=60,
+                  **extra_request_kwargs):
+        """HTTP PUT method.
+
+        :param path: Optional sub-URI path to the resource.
+        :param data: Optional JSON data.
+        :param headers: Optional dictionary of headers.
+        :param timeout: Max time in seconds to wait for the request.
+        :param extra_request_kwargs: Optional keyword arguments to pass
+            on to the aiohttp request.
+        :returns: A :py:class:`Response` object.
+        :raises: ConnectionError
+        :raises: HTTPError
+        """
+        return await self._op('PUT', path, data=data, headers=headers,
+                              timeout=timeout, **extra_request_kwargs)
+
+    async def delete(self, path='', data=None, headers=None, timeout=60,
+                     **extra_request_kwargs):
+        """HTTP DELETE method.
+
+        :param path: Optional sub-URI path to the resource.
+        :param data: Optional JSON data.
+        :param headers: Optional dictionary of headers.
+        :param timeout: Max time in seconds to wait for the request.
+        :param extra_request_kwargs: Optional keyword arguments to pass
+            on to the aiohttp request.
+        :returns: A :py:class:`Response` object.
+        :raises: ConnectionError
+        :raises: HTTPError
+        """
+        return await self._op('DELETE', path, data=data, headers=headers,
+                              timeout=timeout, **extra_request_kwargs)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_args):
+        await self.close()
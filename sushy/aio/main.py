@@ -0,0 +1,308 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import logging
+import os
+
+from sushy.aio import auth as aio_auth
+from sushy.aio import base as aio_base
+from sushy.aio import connector as aio_connector
+from sushy import exceptions
+from sushy import main
+from sushy.resources.chassis import chassis
+from sushy.resources.eventservice import eventservice
+from sushy.resources.fabric import fabric
+from sushy.resources.manager import manager
+from sushy.resources.sessionservice import sessionservice
+from sushy.resources.system import system
+from sushy.resources.updateservice import updateservice
+
+LOG = logging.getLogger(__name__)
+
+
+class Sushy(aio_base.ResourceMixin, main.Sushy):
+    """asyncio counterpart of :py:class:`sushy.main.Sushy`.
+
+    Construction does not perform any I/O, either await :py:meth:`connect`
+    or use the object as an asynchronous context manager:
+
+    .. code-block:: python
+
+      async with sushy.aio.Sushy('https://bmc', username='foo',
+                                 password='bar') as root:
+          systems = await root.get_system_collection()
+          for system in await systems.get_members():
+              print(system.power_state)
+    """
+
+    def __init__(self, base_url, username=None, password=None,
+                 root_prefix='/redfish/v1/', verify=True,
+                 auth=None, connector=None, language='en',
+                 server_side_retries=10, server_side_retries_delay=3):
+        """A class representing an asyncio RootService
+
+        :param base_url: The base URL to the Redfish controller. It
+            should include scheme and authority portion of the URL. For
+            example: https://mgmt.vendor.com
+        :param username: User account with admin/server-profile access
+            privilege
+        :param password: User account password
+        :param root_prefix: The default URL prefix. This part includes
+            the root service and version. Defaults to /redfish/v1
+        :param verify: Either a boolean value, a path to a CA_BUNDLE
+            file or directory with certificates of trusted CAs.
+        :param auth: An authentication mechanism from
+            :py:mod:`sushy.aio.auth` to utilize.
+        :param connector: A user-defined
+            :py:class:`sushy.aio.connector.Connector`. Defaults to None.
+        :param language: RFC 5646 language code for Message Registries.
+            Defaults to 'en'.
+        :param server_side_retries: Number of times to retry GET requests in
+            case of server side errors. Defaults to 10.
+        :param server_side_retries_delay: Time in seconds between retries of
+            GET requests in case of server side errors. Defaults to 3.
+        """
+        self._root_prefix = root_prefix
+        if (auth is not None and (password is not None
+                                  or username is not None)):
+            msg = ('Username or Password were provided to Sushy '
+                   'when an authentication mechanism was specified.')
+            raise ValueError(msg)
+        if auth is None:
+            auth = aio_auth.SessionOrBasicAuth(username=username,
+                                               password=password)
+        self._auth = auth
+
+        super(Sushy, self).__init__(
+            connector or aio_connector.Connector(
+                base_url, verify=verify,
+                server_side_retries=server_side_retries,
+                server_side_retries_delay=server_side_retries_delay),
+            path=self._root_prefix)
+        self._language = language
+        self._base_url = base_url
+
+    def __del__(self):
+        # NOTE: closing the session requires the event loop, it is up to the
+        # caller to await close().
+        pass
+
+    async def connect(self):
+        """Fetch the service root and authenticate.
+
+        :raises: ConnectionError
+        :raises: HTTPError
+        """
+        await self.refresh()
+        self._auth.set_context(self, self._conn)
+        await self._auth.authenticate()
+
+    async def close(self):
+        """Close the Redfish session and the underlying connector."""
+        try:
+            await self._auth.close()
+        except Exception as ex:
+            LOG.warning('Ignoring error while closing Redfish session '
+                        'with %s: %s', self._base_url, ex)
+        await self._conn.close()
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *_args):
+        await self.close()
+
+    async def create_session(self, username=None, password=None):
+        """Creates a session without invoking SessionService.
+
+        :param username: The username to utilize to create a session with the
+                         remote endpoint.
+        :param password: The password to utilize to create a session with the
+                         remote endpoint.
+        :returns: A session key and uri in the form of a tuple
+        :raises: MissingXAuthToken
+        :raises: ConnectionError
+        :raises: AccessError
+        :raises: HTTPError
+        """
+        self._conn.clear_auth()
+        try:
+            session_service_path = self.get_sessions_path()
+        except exceptions.MissingAttributeError:
+            session_service_path = os.path.join(self._path,
+                                                'SessionService/Sessions')
+            LOG.warning('Could not discover the Session service path, '
+                        'falling back to %s.',
+                        session_service_path)
+            self._conn._sessions_uri = (self._root_prefix
+                                        + 'SessionService/Sessions')
+
+        data = {'UserName': username, 'Password': password}
+        LOG.debug("Requesting new session from %s.",
+                  session_service_path)
+        rsp = await self._conn.post(session_service_path, data=data)
+        session_key = rsp.headers.get('X-Auth-Token')
+        if session_key is None:
+            raise exceptions.MissingXAuthToken(
+                method='POST', url=session_service_path, response=rsp)
+
+        session_uri = rsp.headers.get('Location')
+        if session_uri is None:
+            try:
+                session_uri = rsp.json().get("@odata.id")
+            except ValueError:
+                pass
+
+        if session_uri is None:
+            LOG.warning("Received X-Auth-Token but NO session uri.")
+
+        return session_key, session_uri
+
+    async def _get_resource(self, resource_class, path, attribute):
+        if not path:
+            raise exceptions.MissingAttributeError(
+                attribute=attribute, resource=self._path)
+
+        return await aio_base.get_resource_class(resource_class).create(
+            self._conn, path, redfish_version=self.redfish_version,
+            root=self)
+
+    @staticmethod
+    def _get_default_member(collection, entity):
+        members = collection.members_identities
+        if len(members) != 1:
+            raise exceptions.UnknownDefaultError(
+                entity=entity,
+                error='%s count is not exactly one' % entity)
+        return members[0]
+
+    async def get_system_collection(self):
+        """Get the SystemCollection object
+
+        :raises: MissingAttributeError, if the collection attribute is
+            not found
+        :returns: an asyncio SystemCollection object
+        """
+        return await self._get_resource(system.SystemCollection,
+                                        self._systems_path,
+                                        'Systems/@odata.id')
+
+    async def get_system(self, identity=None):
+        """Given the identity return a System object
+
+        :param identity: The identity of the System resource. If not given,
+            sushy will default to the single available System or fail
+            if there appear to be more or less then one System listed.
+        :raises: `UnknownDefaultError` if default system can't be determined.
+        :returns: an asyncio System object
+        """
+        if identity is None:
+            identity = self._get_default_member(
+                await self.get_system_collection(), 'ComputerSystem')
+        return await self._get_resource(system.System, identity, 'Id')
+
+    async def get_chassis_collection(self):
+        """Get the ChassisCollection object
+
+        :raises: MissingAttributeError, if the collection attribute is
+            not found
+        :returns: an asyncio ChassisCollection object
+        """
+        return await self._get_resource(chassis.ChassisCollection,
+                                        self._chassis_path,
+                                        'Chassis/@odata.id')
+
+    async def get_chassis(self, identity=None):
+        """Given the identity return a Chassis object
+
+        :param identity: The identity of the Chassis resource. If not given,
+            sushy will default to the single available chassis or fail
+            if there appear to be more or less then one Chassis listed.
+        :raises: `UnknownDefaultError` if default chassis can't be
+            determined.
+        :returns: an asyncio Chassis object
+        """
+        if identity is None:
+            identity = self._get_default_member(
+                await self.get_chassis_collection(), 'Chassis')
+        return await self._get_resource(chassis.Chassis, identity, 'Id')
+
+    async def get_manager_collection(self):
+        """Get the ManagerCollection object
+
+        :raises: MissingAttributeError, if the collection attribute is
+            not found
+        :returns: an asyncio ManagerCollection object
+        """
+        return await self._get_resource(manager.ManagerCollection,
+                                        self._managers_path,
+                                        'Managers/@odata.id')
+
+    async def get_manager(self, identity=None):
+        """Given the identity return a Manager object
+
+        :param identity: The identity of the Manager resource. If not given,
+            sushy will default to the single available Manager or fail
+            if there appear to be more or less then one Manager listed.
+        :raises: `UnknownDefaultError` if default manager can't be
+            determined.
+        :returns: an asyncio Manager object
+        """
+        if identity is None:
+            identity = self._get_default_member(
+                await self.get_manager_collection(), 'Manager')
+        return await self._get_resource(manager.Manager, identity, 'Id')
+
+    async def get_fabric_collection(self):
+        """Get the FabricCollection object
+
+        :returns: an asyncio FabricCollection object
+        """
+        return await self._get_resource(fabric.FabricCollection,
+                                        self._fabrics_path,
+                                        'Fabrics/@odata.id')
+
+    async def get_fabric(self, identity):
+        """Given the identity return a Fabric object
+
+        :param identity: The identity of the Fabric resource
+        :returns: an asyncio Fabric object
+        """
+        return await self._get_resource(fabric.Fabric, identity, 'Id')
+
+    async def get_session_service(self):
+        """Get the SessionService object
+
+        :returns: an asyncio SessionService object
+        """
+        return await self._get_resource(sessionservice.SessionService,
+                                        self._session_service_path,
+                                        'SessionService/@odata.id')
+
+    async def get_update_service(self):
+        """Get the UpdateService object
+
+        :returns: an asyncio UpdateService object
+        """
+        return await self._get_resource(updateservice.UpdateService,
+                                        self._update_service_path,
+                                        'UpdateService/@odata.id')
+
+    async def get_event_service(self):
+        """Get the EventService object
+
+        :returns: an asyncio EventService object
+        """
+        return await self._get_resource(eventservice.EventService,
+                                        self._event_service_path,
+                                        'EventService/@odata.id')
@@ -16,6 +16,7 @@ import abc
 import logging
 
 from sushy import exceptions
+from sushy import session_store as sushy_session_store
 
 LOG = logging.getLogger(__name__)
 
@@ -115,19 +116,30 @@ class SessionAuth(AuthBase):
        This is a class used to encapsulate a redfish session.
     """
 
-    def __init__(self, username=None, password=None):
+    def __init__(self, username=None, password=None, session_store=None):
         """A class representing a Session Authentication object.
 
         :param username: User account with admin/server-profile access
              privilege.
         :param password: User account password.
+        :param session_store: A `sushy.session_store.SessionStore` to reuse
+            sessions from. A stored session is used without checking it
+            first; it is replaced by a new session once the service rejects
+            it. Sessions are not deleted on close when stored, so that they
+            can be reused later. Defaults to None.
         """
+        self._session_store = session_store
+        """Our store of sessions to reuse"""
         self._session_key = None
         """Our Sessions Key"""
         self._session_resource_id = None
         """Our Sessions Unique Resource ID or URL"""
         self._session_auth_previously_successful = False
         """Our reminder for tracking if session auth has previously worked."""
+        self._session_in_store = False
+        """Whether our session is kept in the session store"""
+        self._rejected_session_key = None
+        """Our last stored session key rejected by the service"""
 
         super(SessionAuth, self).__init__(username,
                                           password)
@@ -154,6 +166,15 @@ class SessionAuth(AuthBase):
         :raises: AccessError
         :raises: HTTPError
         """
+        if self._session_in_store:
+            # NOTE: authenticating again means that the stored session has
+            # been rejected and could not be refreshed, e.g. because its
+            # session URI is unknown, so it must not be reused.
+            self._discard_stored_session()
+            self.reset_session_attrs()
+        elif self._reuse_stored_session():
+            return
+
         auth_token = None
 
         auth_token, session_uri = self._root_resource.create_session(
@@ -161,12 +182,47 @@ class SessionAuth(AuthBase):
         # Record the session authentication data.
         self._session_key = auth_token
         self._session_resource_id = session_uri
+        if self._session_store is not None:
+            self._session_store.put(self._get_store_key(), auth_token,
+                                    session_uri)
+            self._session_in_store = True
         # Set flag so we know we've previously successfully achieved
         # session authentication in order to lockout possible fallback during
         # session refresh/renegotiation.
         self._session_auth_previously_successful = True
         self._connector.set_http_session_auth(auth_token)
 
+    def _get_store_key(self):
+        return sushy_session_store.get_session_key(
+            getattr(self._connector, '_url', None), self._username,
+            self._password)
+
+    def _reuse_stored_session(self):
+        if self._session_store is None:
+            return False
+
+        stored = self._session_store.get(self._get_store_key())
+        if stored is None or stored[0] == self._rejected_session_key:
+            return False
+
+        LOG.debug('Reusing a stored session %s', stored[1])
+        self._session_key, self._session_resource_id = stored
+        # NOTE: the session is validated by the first request, which
+        # refreshes it through refresh_session if rejected.
+        self._session_auth_previously_successful = True
+        self._session_in_store = True
+        self._connector.set_http_session_auth(self._session_key)
+        return True
+
+    def _discard_stored_session(self):
+        """Remove our session, rejected by the service, from the store."""
+        if self._session_store is not None and self._session_key is not None:
+            # NOTE: the session has been rejected, never reuse it again
+            self._session_store.delete(self._get_store_key(),
+                                       token=self._session_key)
+            self._rejected_session_key = self._session_key
+        self._session_in_store = False
+
     def can_refresh_session(self):
         """Method to assert if session based refresh can be done."""
         return (self._session_key is not None
@@ -184,6 +240,7 @@ class SessionAuth(AuthBase):
         :raises: AccessError
         :raises: HTTPError
         """
+        self._discard_stored_session()
         self.reset_session_attrs()
         self._do_authenticate()
 
@@ -191,9 +248,13 @@ class SessionAuth(AuthBase):
         """Close the Redfish Session.
 
         Attempts to close an established RedfishSession by
-        deleting it from the remote Redfish controller.
+        deleting it from the remote Redfish controller. Sessions kept in
+        a session store are left open for reuse.
         """
-        if self._session_resource_id is not None:
+        if (self._session_store is not None
+                and self._session_resource_id is not None):
+            self.reset_session_attrs()
+        elif self._session_resource_id is not None:
             try:
                 self._connector.delete(self._session_resource_id)
             except (exceptions.AccessError,
@@ -209,6 +270,7 @@ class SessionAuth(AuthBase):
         """Reset active session related attributes."""
         self._session_key = None
         self._session_resource_id = None
+        self._session_in_store = False
         # Requests session object data is merged with user submitted data
         # per https://requests.readthedocs.io/en/master/user/advanced/
         # so we need to clear data explicitly set on the session too.
@@ -223,8 +285,9 @@ class SessionAuth(AuthBase):
 
 class SessionOrBasicAuth(SessionAuth):
 
-    def __init__(self, username=None, password=None):
-        super(SessionOrBasicAuth, self).__init__(username, password)
+    def __init__(self, username=None, password=None, session_store=None):
+        super(SessionOrBasicAuth, self).__init__(
+            username, password, session_store=session_store)
         self.basic_auth = BasicAuth(username=username, password=password)
 
     def _fallback_to_basic_authentication(self):
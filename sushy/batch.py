@@ -0,0 +1,300 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Running an operation on many Redfish services at once."""
+
+import collections
+from concurrent import futures
+import hashlib
+import hmac
+import logging
+import secrets
+import threading
+import time
+
+from sushy import main
+
+LOG = logging.getLogger(__name__)
+
+_CREDENTIALS_SECRET = secrets.token_bytes(32)
+"""Secret of the process to fingerprint the passwords in host keys with"""
+
+
+class BatchTarget(object):
+    """A Redfish service and system to run a batch operation on"""
+
+    def __init__(self, base_url, username=None, password=None, verify=True,
+                 system_id=None, **sushy_kwargs):
+        """Create the target.
+
+        :param base_url: The base URL to the Redfish controller.
+        :param username: User account with admin/server-profile access
+            privilege.
+        :param password: User account password.
+        :param verify: Either a boolean value or a path to a CA_BUNDLE file
+            or directory, see `sushy.Sushy`.
+        :param system_id: Identity of the system to use, None for the only
+            system of the service.
+        :param sushy_kwargs: Other arguments to create `sushy.Sushy` with.
+        """
+        self.base_url = base_url
+        self.username = username
+        self.password = password
+        self.verify = verify
+        self.system_id = system_id
+        self.sushy_kwargs = sushy_kwargs
+
+    @property
+    def host_key(self):
+        """Key of the targets sharing a client, thus a connector
+
+        Targets with different credentials do not share a client, the
+        password is only part of the key as an HMAC.
+        """
+        fingerprint = hmac.new(_CREDENTIALS_SECRET,
+                               (self.password or '').encode('utf-8'),
+                               hashlib.sha256).hexdigest()
+        return (self.base_url, self.username, fingerprint, self.verify)
+
+    def __repr__(self):
+        return '<BatchTarget %s %s>' % (self.base_url, self.system_id or '')
+
+
+class BatchResult(object):
+    """Result of a batch operation for one target"""
+
+    def __init__(self, target, result=None, error=None, started_at=None,
+                 duration=None):
+        self._target = target
+        self._result = result
+        self._error = error
+        self._started_at = started_at
+        self._duration = duration
+
+    @property
+    def target(self):
+        """The :class:`.BatchTarget`"""
+        return self._target
+
+    @property
+    def result(self):
+        """Value returned by the operation"""
+        return self._result
+
+    @property
+    def error(self):
+        """Exception raised by the operation or when connecting, if any"""
+        return self._error
+
+    @property
+    def succeeded(self):
+        """Whether the operation succeeded"""
+        return self._error is None
+
+    @property
+    def started_at(self):
+        """Time the operation started at, in seconds since the epoch"""
+        return self._started_at
+
+    @property
+    def duration(self):
+        """Seconds the operation, or connecting if it failed, took"""
+        return self._duration
+
+    def __repr__(self):
+        return '<BatchResult %s %s in %.3fs>' % (
+            self._target, 'OK' if self.succeeded else repr(self._error),
+            self._duration or 0)
+
+
+class _RateLimiter(object):
+
+    def __init__(self, max_rate):
+        self._interval = 1.0 / max_rate
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self._interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def _create_client(target):
+    return main.Sushy(target.base_url, username=target.username,
+                      password=target.password, verify=target.verify,
+                      **target.sushy_kwargs)
+
+
+class BatchExecutor(object):
+    """Runs an operation on many Redfish services with bounded concurrency.
+
+    One `sushy.Sushy` client, thus one connector, is created per host and
+    reused for all targets of the host and across runs until `close`.
+    """
+
+    def __init__(self, max_workers=32, max_per_host=1, max_rate=None,
+                 max_rate_per_host=None, client_factory=None):
+        """Create the executor.
+
+        :param max_workers: Maximum number of operations run concurrently.
+        :param max_per_host: Maximum number of operations run concurrently
+            on the same host. Operations on the same host share one client,
+            so values above 1 use a `sushy.Sushy` object, which is not
+            thread safe, from several threads at once; only use them with
+            operations which do not share resources.
+        :param max_rate: Maximum number of operations started per second,
+            None for no limit.
+        :param max_rate_per_host: Maximum number of operations started per
+            second on the same host, None for no limit.
+        :param client_factory: Callable creating a client from a
+            `BatchTarget`. Defaults to creating `sushy.Sushy`.
+        """
+        if max_workers < 1 or max_per_host < 1:
+            raise ValueError('max_workers and max_per_host must be positive')
+
+        self._max_workers = max_workers
+        self._max_per_host = max_per_host
+        self._rate_limiter = _RateLimiter(max_rate) if max_rate else None
+        self._max_rate_per_host = max_rate_per_host
+        self._client_factory = client_factory or _create_client
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the clients, deleting their Redfish sessions."""
+        with self._lock:
+            hosts, self._hosts = self._hosts, {}
+
+        for host in hosts.values():
+            client = host['client']
+            close = getattr(client, 'close', None)
+            if not callable(close):
+                continue
+            try:
+                close()
+            except Exception as exc:
+                LOG.warning('Cannot close the client of %(client)s: '
+                            '%(error)s', {'client': client, 'error': exc})
+
+    def _get_host(self, target):
+        with self._lock:
+            host = self._hosts.get(target.host_key)
+            if host is None:
+                host = self._hosts[target.host_key] = {
+                    'lock': threading.Lock(),
+                    'client': None,
+                    'rate_limiter': (_RateLimiter(self._max_rate_per_host)
+                                     if self._max_rate_per_host else None),
+                }
+            return host
+
+    def _get_client(self, target):
+        host = self._get_host(target)
+        with host['lock']:
+            if host['client'] is None:
+                LOG.debug('Connecting to %s', target.base_url)
+                host['client'] = self._client_factory(target)
+            return host['client'], host['rate_limiter']
+
+    def _run_one(self, target, operation):
+        started_at = time.time()
+        start = time.monotonic()
+        try:
+            client, host_rate_limiter = self._get_client(target)
+            if self._rate_limiter is not None:
+                self._rate_limiter.wait()
+            if host_rate_limiter is not None:
+                host_rate_limiter.wait()
+
+            started_at = time.time()
+            start = time.monotonic()
+            result = operation(client, target)
+        except Exception as exc:
+            LOG.debug('Batch operation failed for %(target)s: %(error)s',
+                      {'target': target, 'error': exc})
+            return BatchResult(target, error=exc, started_at=started_at,
+                               duration=time.monotonic() - start)
+
+        return BatchResult(target, result=result, started_at=started_at,
+                           duration=time.monotonic() - start)
+
+    def run(self, targets, operation):
+        """Run an operation on all targets.
+
+        :param targets: Iterable of `BatchTarget`.
+        :param operation: Callable accepting the `sushy.Sushy` client and
+            the `BatchTarget`, e.g. created by `reset_system`.
+        :returns: List of `BatchResult` in the order of the targets.
+        """
+        targets = list(targets)
+        results = [None] * len(targets)
+        if not targets:
+            return results
+
+        lanes = collections.OrderedDict()
+        for index, target in enumerate(targets):
+            lanes.setdefault(target.host_key, collections.deque()).append(
+                index)
+
+        # NOTE: a lane runs the targets of one host one after another; every
+        # host gets up to max_per_host lanes and the pool runs up to
+        # max_workers lanes at a time, thus no worker waits for a busy host.
+        def _run_lane(queue):
+            while True:
+                try:
+                    index = queue.popleft()
+                except IndexError:
+                    return
+                results[index] = self._run_one(targets[index], operation)
+
+        with futures.ThreadPoolExecutor(
+                max_workers=min(self._max_workers, len(targets)),
+                thread_name_prefix='sushy-batch') as pool:
+            for queue in lanes.values():
+                for _i in range(min(self._max_per_host, len(queue))):
+                    pool.submit(_run_lane, queue)
+
+        return results
+
+
+def reset_system(reset_type):
+    """Create an operation resetting the system of every target.
+
+    :param reset_type: The type of reset, see `System.reset_system`.
+    :returns: A callable to pass to `BatchExecutor.run`.
+    """
+    def _reset_system(client, target):
+        client.get_system(target.system_id).reset_system(reset_type)
+
+    return _reset_system
+
+
+def set_system_boot_options(**kwargs):
+    """Create an operation setting the boot options of every target.
+
+    :param kwargs: Arguments of `System.set_system_boot_options`.
+    :returns: A callable to pass to `BatchExecutor.run`.
+    """
+    def _set_system_boot_options(client, target):
+        client.get_system(target.system_id).set_system_boot_options(**kwargs)
+
+    return _set_system_boot_options
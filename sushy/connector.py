@@ -16,8 +16,10 @@
 from http import client as http_client
 import logging
 import re
+import threading
 import time
 from urllib import parse as urlparse
+import weakref
 
 import requests
 from urllib3.exceptions import InsecureRequestWarning
@@ -28,13 +30,67 @@ from sushy import utils
 
 LOG = logging.getLogger(__name__)
 
+# Methods which are safe to re-send after the connection got reset
+_IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+
+
+def _is_connection_reset(exc):
+    """Check whether an exception was caused by a reset connection.
+
+    :param exc: an exception raised by the requests library.
+    :returns: True if the peer reset or closed the connection.
+    """
+    seen = set()
+    pending = [exc]
+    while pending:
+        exc = pending.pop()
+        if exc is None or id(exc) in seen:
+            continue
+        seen.add(id(exc))
+        if isinstance(exc, (ConnectionResetError, BrokenPipeError,
+                            http_client.RemoteDisconnected)):
+            return True
+        if isinstance(exc, BaseException):
+            pending.extend(exc.args)
+            pending.append(exc.__cause__)
+            pending.append(exc.__context__)
+    return False
+
 
 class Connector(object):
 
     def __init__(
             self, url, username=None, password=None, verify=True,
             response_callback=None, server_side_retries=0,
-            server_side_retries_delay=0):
+            server_side_retries_delay=0, keep_alive=False,
+            keep_alive_pool_size=requests.adapters.DEFAULT_POOLSIZE,
+            keep_alive_idle_timeout=None, keep_alive_max_requests=None):
+        """A class representing a connection to a Redfish service
+
+        :param url: The base URL of the Redfish service.
+        :param username: Deprecated, use :py:meth:`set_auth`.
+        :param password: Deprecated, use :py:meth:`set_auth`.
+        :param verify: Either a boolean value, a path to a CA_BUNDLE
+            file or directory with certificates of trusted CAs.
+        :param response_callback: A callable invoked with every response.
+        :param server_side_retries: Number of times to retry requests in
+            case of server side errors.
+        :param server_side_retries_delay: Time in seconds between retries
+            in case of server side errors.
+        :param keep_alive: Whether to reuse HTTP connections between
+            requests. By default every connection is closed after a single
+            request since some BMCs do not cope with persistent connections.
+            If the server resets a reused connection, the connector falls
+            back to closing connections for the rest of its lifetime.
+        :param keep_alive_pool_size: Maximum number of idle connections
+            kept open when ``keep_alive`` is enabled.
+        :param keep_alive_idle_timeout: Time in seconds after which the
+            kept open connections are dropped if no request has been made.
+            Defaults to None, which means no limit.
+        :param keep_alive_max_requests: Maximum number of requests made
+            before the kept open connections are dropped and re-established.
+            Defaults to None, which means no limit.
+        """
         self._url = url
         self._verify = verify
         self._session = requests.Session()
@@ -46,11 +102,23 @@ class Connector(object):
         # NOTE(TheJulia): In order to help prevent recursive post operations
         # by allowing us to understand that we should stop authentication.
         self._sessions_uri = None
-        # NOTE(etingof): field studies reveal that some BMCs choke at
-        # long-running persistent HTTP connections (or TCP connections).
-        # By default, we ask HTTP server to shut down HTTP connection we've
-        # just used.
-        self._session.headers['Connection'] = 'close'
+        self._keep_alive = keep_alive
+        self._keep_alive_idle_timeout = keep_alive_idle_timeout
+        self._keep_alive_max_requests = keep_alive_max_requests
+        self._keep_alive_lock = threading.Lock()
+        self._keep_alive_requests = 0
+        self._keep_alive_last_used = None
+        self._write_count = 0
+        if keep_alive:
+            for prefix in ('http://', 'https://'):
+                self._session.mount(prefix, requests.adapters.HTTPAdapter(
+                    pool_maxsize=keep_alive_pool_size))
+        else:
+            # NOTE(etingof): field studies reveal that some BMCs choke at
+            # long-running persistent HTTP connections (or TCP connections).
+            # By default, we ask HTTP server to shut down HTTP connection
+            # we've just used.
+            self._session.headers['Connection'] = 'close'
 
         if username or password:
             LOG.warning('Passing username and password to Connector is '
@@ -66,6 +134,15 @@ class Connector(object):
             requests.packages.urllib3.disable_warnings(
                 category=InsecureRequestWarning)
 
+    @property
+    def write_count(self):
+        """Number of requests other than GET sent so far.
+
+        Resources use it to know whether the headers, e.g. the ETag, they
+        received may have changed since.
+        """
+        return self._write_count
+
     def set_auth(self, auth):
         """Sets the authentication mechanism for our connector."""
         self._auth = auth
@@ -83,6 +160,35 @@ class Connector(object):
         """Close this connector and the associated HTTP session."""
         self._session.close()
 
+    def _recycle_connections(self):
+        """Drop kept open connections that exceeded their limits."""
+        with self._keep_alive_lock:
+            now = time.monotonic()
+            expired = (
+                (self._keep_alive_idle_timeout is not None
+                 and self._keep_alive_last_used is not None
+                 and (now - self._keep_alive_last_used
+                      > self._keep_alive_idle_timeout))
+                or (self._keep_alive_max_requests is not None
+                    and (self._keep_alive_requests
+                         >= self._keep_alive_max_requests)))
+            if expired:
+                LOG.debug('Dropping persistent connections to %s', self._url)
+                self._session.close()
+                self._keep_alive_requests = 0
+            self._keep_alive_requests += 1
+            self._keep_alive_last_used = now
+
+    def _disable_keep_alive(self, error):
+        """Fall back to closing the connection after every request."""
+        LOG.warning('Persistent connection to %(url)s has been reset, '
+                    'falling back to closing connections after every '
+                    'request. Error: %(error)s',
+                    {'url': self._url, 'error': error})
+        self._keep_alive = False
+        self._session.headers['Connection'] = 'close'
+        self._session.close()
+
     def check_retry_on_exception(self, exception_msg):
         """Checks whether retry on exception is required."""
         retry = False
@@ -127,6 +233,8 @@ class Connector(object):
         """
         if server_side_retries_left is None:
             server_side_retries_left = self._server_side_retries
+        if method != 'GET':
+            self._write_count += 1
 
         url = path if urlparse.urlparse(path).netloc else urlparse.urljoin(
             self._url, path)
@@ -159,6 +267,8 @@ class Connector(object):
                    'data': utils.sanitize(data),
                    'blocking': blocking, 'timeout': timeout,
                    'session': extra_session_req_kwargs})
+        if self._keep_alive:
+            self._recycle_connections()
         try:
             response = self._session.request(method, url, json=data,
                                              headers=headers,
@@ -166,6 +276,18 @@ class Connector(object):
                                              timeout=timeout,
                                              **extra_session_req_kwargs)
         except requests.exceptions.RequestException as e:
+            if self._keep_alive and _is_connection_reset(e):
+                self._disable_keep_alive(e)
+                # NOTE: a reused connection may have been closed by the
+                # server before our request reached it, so it is retried
+                # on a fresh connection when that is safe to do.
+                if method.upper() in _IDEMPOTENT_METHODS:
+                    return self._op(
+                        method, path, data=data, headers=headers,
+                        blocking=blocking, timeout=timeout,
+                        server_side_retries_left=server_side_retries_left,
+                        allow_reauth=allow_reauth,
+                        **extra_session_req_kwargs)
             # Capture any general exception by looking for the parent
             # class of exceptions in the requests library.
             # Specifically this will cover cases such as transport
@@ -493,3 +615,80 @@ class Connector(object):
 
     def __exit__(self, *_args):
         self.close()
+
+
+class _SharedConnection(object):
+
+    def __init__(self, connector, auth):
+        self.connector = connector
+        self.auth = auth
+        self.references = 0
+        self.authenticated = False
+        self.users = weakref.WeakSet()
+        self.lock = threading.Lock()
+
+
+class ConnectorRegistry(object):
+    """Connectors shared by Sushy objects talking to the same service.
+
+    Every entry holds a connector together with the authentication object
+    using it, so that Sushy objects sharing the connector also share the
+    Redfish session. Entries are reference counted and closed when the last
+    Sushy object using them releases them.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key, create):
+        """Get a shared connection, creating it if needed.
+
+        :param key: hashable key identifying the service and the user,
+            e.g. the base URL, the verify argument and the credentials.
+        :param create: callable returning a tuple of a new connector and
+            a new authentication object.
+        :returns: the shared connection with ``connector``, ``auth``,
+            ``lock``, ``authenticated`` and ``users`` attributes.
+            Authentication must be done with ``lock`` held and marked with
+            ``authenticated``, ``users`` is a weak set of the objects using
+            the connection for the caller to maintain.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _SharedConnection(*create())
+            entry.references += 1
+            return entry
+
+    def release(self, key):
+        """Release a shared connection.
+
+        When the last reference is released, the authentication object, thus
+        the Redfish session, and the connector are closed.
+
+        :param key: the key the connection was acquired with.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry.references -= 1
+            if entry.references > 0:
+                return
+            del self._entries[key]
+
+        try:
+            entry.auth.close()
+        except Exception as ex:
+            LOG.warning('Ignoring error while closing shared Redfish '
+                        'session: %s', ex)
+        entry.connector.close()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+shared_connectors = ConnectorRegistry()
+"""Connectors shared by all Sushy objects of the process"""
@@ -58,6 +58,21 @@ class InvalidParameterValueError(SushyError):
                'Valid values are: %(valid_values)s')
 
 
+class InvalidAttributesError(SushyError):
+    message = ('Invalid attribute values for the resource %(resource)s: '
+               '%(errors)s')
+
+    errors = None
+    """Dict of the invalid attribute names and the reasons."""
+
+    def __init__(self, resource, errors):
+        self.errors = errors
+        super(InvalidAttributesError, self).__init__(
+            resource=resource,
+            errors='; '.join('%s: %s' % (name, reason)
+                             for name, reason in sorted(errors.items())))
+
+
 class ArchiveParsingError(SushyError):
     message = 'Failed parsing archive "%(path)s": %(error)s'
 
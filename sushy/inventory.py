@@ -0,0 +1,230 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Crawling the resources of Redfish services for a complete inventory."""
+
+import collections
+from concurrent import futures
+import logging
+
+from sushy.resources import base
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_START = ('Systems', 'Chassis', 'Managers', 'UpdateService')
+"""Properties of the service root linking to the subtrees to crawl"""
+
+DEFAULT_EXCLUDE = ('LogServices',)
+"""Path segments of the resources not to crawl, e.g. with many log entries"""
+
+
+def _normalize_path(path):
+    return path.rstrip('/')
+
+
+def _iter_links(json_doc):
+    """Iterate over the paths of the resources referenced by a document."""
+    pending = [json_doc]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, list):
+            pending.extend(reversed(value))
+        elif isinstance(value, dict):
+            path = value.get('@odata.id')
+            # NOTE: JSON pointers (containing '#') address parts of another
+            # resource.
+            if (value is not json_doc and isinstance(path, str)
+                    and '#' not in path):
+                yield path
+            pending.extend(reversed(list(value.values())))
+
+
+class InventoryItem(object):
+    """A resource found by `InventoryCrawler`"""
+
+    def __init__(self, root, path, json_doc=None, error=None):
+        self._root = root
+        self._path = path
+        self._json = json_doc
+        self._error = error
+
+    @property
+    def root(self):
+        """The `sushy.Sushy` object of the service"""
+        return self._root
+
+    @property
+    def path(self):
+        """Path of the resource"""
+        return self._path
+
+    @property
+    def json(self):
+        """Parsed JSON document of the resource, None on error"""
+        return self._json
+
+    @property
+    def error(self):
+        """Exception raised when fetching the resource, if any"""
+        return self._error
+
+    @property
+    def resource_type(self):
+        """Type of the resource, e.g. ``Processor``, if known"""
+        odata_type = (self._json or {}).get('@odata.type')
+        if not isinstance(odata_type, str):
+            return None
+        return odata_type.lstrip('#').split('.', 1)[0]
+
+    def __repr__(self):
+        return '<InventoryItem %s %s>' % (
+            self._path, self.resource_type or repr(self._error))
+
+
+class _Service(object):
+
+    def __init__(self, root, prefixes):
+        self.root = root
+        self.prefixes = prefixes
+        self.queue = collections.deque()
+        self.seen = set()
+        self.running = 0
+
+
+class InventoryCrawler(object):
+    """Crawls the resources of Redfish services breadth-first.
+
+    Resources are fetched concurrently, with a limit per service, every
+    resource is fetched once, and resources embedded in other documents,
+    e.g. members of collections expanded by the service, are not fetched
+    again.
+    """
+
+    def __init__(self, max_workers=16, max_per_host=4, start=DEFAULT_START,
+                 exclude=DEFAULT_EXCLUDE):
+        """Create the crawler.
+
+        :param max_workers: Maximum number of resources fetched concurrently.
+        :param max_per_host: Maximum number of resources fetched concurrently
+            from the same service.
+        :param start: Properties of the service root linking to the resources
+            to crawl. Only resources below the paths of these resources are
+            crawled.
+        :param exclude: Path segments of the resources not to crawl.
+        """
+        if max_workers < 1 or max_per_host < 1:
+            raise ValueError('max_workers and max_per_host must be positive')
+
+        self._max_workers = max_workers
+        self._max_per_host = max_per_host
+        self._start = tuple(start)
+        self._exclude = frozenset(exclude)
+
+    def _get_start_paths(self, root):
+        paths = []
+        for name in self._start:
+            link = (root.json or {}).get(name)
+            path = link.get('@odata.id') if isinstance(link, dict) else None
+            if isinstance(path, str):
+                paths.append(_normalize_path(path))
+        return paths
+
+    def _add(self, service, path):
+        path = _normalize_path(path)
+        if path in service.seen:
+            return False
+        if not any(path == prefix or path.startswith(prefix + '/')
+                   for prefix in service.prefixes):
+            return False
+        if self._exclude.intersection(path.split('/')):
+            return False
+        service.seen.add(path)
+        return True
+
+    @staticmethod
+    def _fetch(service, path):
+        response = service.root._conn.get(path=path)
+        return response.json() if response.content else {}
+
+    def crawl(self, roots):
+        """Crawl the resources of services.
+
+        :param roots: Iterable of `sushy.Sushy` objects of the services.
+        :returns: a generator of `InventoryItem`, yielded as the resources
+            arrive. Resources which cannot be fetched are yielded with an
+            error and are not crawled further.
+        """
+        services = []
+        for root in roots:
+            service = _Service(root, self._get_start_paths(root))
+            for path in service.prefixes:
+                if self._add(service, path):
+                    service.queue.append(path)
+            services.append(service)
+
+        running = {}
+        pool = futures.ThreadPoolExecutor(max_workers=self._max_workers,
+                                          thread_name_prefix='sushy-crawl')
+        try:
+            while True:
+                # NOTE: services are served in turns, so that a large service
+                # does not hold the workers until it is crawled completely.
+                submitted = True
+                while submitted and len(running) < self._max_workers:
+                    submitted = False
+                    for service in services:
+                        if (service.queue
+                                and service.running < self._max_per_host
+                                and len(running) < self._max_workers):
+                            path = service.queue.popleft()
+                            future = pool.submit(self._fetch, service, path)
+                            running[future] = (service, path)
+                            service.running += 1
+                            submitted = True
+
+                if not running:
+                    break
+
+                done, _pending = futures.wait(
+                    running, return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    service, path = running.pop(future)
+                    service.running -= 1
+                    yield from self._process(service, path, future)
+        finally:
+            # NOTE: when the caller stops iterating, the queued fetches are
+            # abandoned.
+            for future in running:
+                future.cancel()
+            pool.shutdown(wait=False)
+
+    def _process(self, service, path, future):
+        try:
+            json_doc = future.result()
+        except Exception as exc:
+            LOG.debug('Cannot fetch %(path)s while crawling: %(error)s',
+                      {'path': path, 'error': exc})
+            yield InventoryItem(service.root, path, error=exc)
+            return
+
+        documents = [(path, json_doc)]
+        embedded = {}
+        base.collect_expanded_resources(json_doc, embedded)
+        for embedded_path, embedded_doc in embedded.items():
+            if self._add(service, embedded_path):
+                documents.append((embedded_path, embedded_doc))
+
+        for doc_path, doc in documents:
+            for link in _iter_links(doc):
+                if self._add(service, link):
+                    service.queue.append(_normalize_path(link))
+            yield InventoryItem(service.root, doc_path, json_doc=doc)
@@ -13,8 +13,11 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 import collections
+import hashlib
+import json
 import logging
 import os
+import weakref
 
 try:
     from importlib import resources
@@ -38,6 +41,8 @@ from sushy.resources.fabric import fabric
 from sushy.resources.manager import manager
 from sushy.resources.registry import message_registry
 from sushy.resources.registry import message_registry_file
+from sushy.resources.registry import registry_cache
+from sushy.resources.registry import registry_index
 from sushy.resources.sessionservice import session
 from sushy.resources.sessionservice import sessionservice
 from sushy.resources.system import system
@@ -50,6 +55,75 @@ LOG = logging.getLogger(__name__)
 
 STANDARD_REGISTRY_PATH = 'standard_registries'
 
+STANDARD_REGISTRY_INDEX = 'standard_registries_index.json'
+"""All standard registries combined, see build-standard-registries-index"""
+
+_attribute_registry_files = set()
+"""Keys of the provided registry files known to hold attribute registries"""
+
+
+class _StandardMessageRegistry(message_registry.MessageRegistry):
+
+    # NOTE: the standard registries are validated when the index is built,
+    # only parse the fields that are actually used.
+    _lazy_fields = True
+
+
+class _StandardRegistryDocument(dict):
+    """Document of a standard registry read on demand.
+
+    It starts with the summary of the registry from the index, i.e. all
+    properties but the messages. The packaged file of the registry is only
+    read when a property missing from the summary is looked up.
+    """
+
+    def __init__(self, summary, path):
+        super(_StandardRegistryDocument, self).__init__(summary)
+        self._path = path
+        self._complete = False
+
+    def __missing__(self, key):
+        if self._complete:
+            raise KeyError(key)
+
+        self._complete = True
+        ref = resources.files(__package__).joinpath(self._path)
+        with ref.open(encoding='utf-8') as fp:
+            self.update(json.load(fp))
+        return self[key]
+
+
+def _detach_registry(registry):
+    """Rebuild a registry without the connector it has been loaded with.
+
+    Registries shared within the process must not keep the connector of
+    the Sushy object which loaded them, nor be refreshed from its service.
+
+    :param registry: the registry object.
+    :returns: the rebuilt registry.
+    """
+    if not isinstance(registry, base.ResourceBase):
+        return registry
+    return type(registry)(None, path=registry.path, json_doc=registry.json,
+                          redfish_version=registry.redfish_version)
+
+
+def _load_standard_registry_index():
+    """Load the index of the packaged standard registries
+
+    :returns: dict of registry summaries, i.e. the registry documents
+        without their messages, keyed by the file name or an empty dict if
+        the index cannot be loaded.
+    """
+    ref = resources.files(__package__).joinpath(STANDARD_REGISTRY_INDEX)
+    try:
+        with ref.open(encoding='utf-8') as fp:
+            return json.load(fp)['Registries']
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        LOG.warning('Cannot load the index of standard registries: '
+                    '%(error)s', {'error': exc})
+        return {}
+
 
 class ProtocolFeaturesSupportedField(base.CompositeField):
 
@@ -104,6 +178,11 @@ class LazyRegistries(collections.abc.MutableMapping):
         registries = self.registries
         return len(registries)
 
+    @property
+    def registry_index(self):
+        """The index of the registries if they maintain one."""
+        return registry_index.get_index(self.registries)
+
     @property
     def registries(self):
         if self._registries is None:
@@ -126,6 +205,9 @@ class Sushy(base.ResourceBase):
     product = base.Field('Product')
     """The product associated with this Redfish service"""
 
+    vendor = base.Field('Vendor')
+    """The vendor or manufacturer associated with this Redfish service"""
+
     protocol_features_supported = ProtocolFeaturesSupportedField(
         'ProtocolFeaturesSupported')
     """The information about protocol features supported by the service"""
@@ -166,7 +248,10 @@ class Sushy(base.ResourceBase):
                  auth=None, connector=None,
                  public_connector=None,
                  language='en', server_side_retries=10,
-                 server_side_retries_delay=3):
+                 server_side_retries_delay=3, member_fetch_workers=None,
+                 expand_levels=None, lazy_fields=False,
+                 registry_cache_dir=None, share_connection=False,
+                 session_store=None):
         """A class representing a RootService
 
         :param base_url: The base URL to the Redfish controller. It
@@ -193,32 +278,142 @@ class Sushy(base.ResourceBase):
             case of server side errors. Defaults to 10.
         :param server_side_retries_delay: Time in seconds between retries of
             GET requests in case of server side errors. Defaults to 3.
+        :param member_fetch_workers: Maximum number of collection members
+            fetched concurrently by ``get_members``. Defaults to None, in
+            which case members are fetched one after another.
+        :param expand_levels: Number of levels of subordinate resources to
+            fetch together with collections using the OData ``$expand``
+            query, if supported by the service. Defaults to None, in which
+            case every resource is fetched separately.
+        :param lazy_fields: Whether resource fields are loaded on first
+            access instead of on every refresh. Errors in the fields, such
+            as missing required ones, are then raised on access. Defaults
+            to False.
+        :param registry_cache_dir: Directory to cache the registries
+            provided by the service in. The cache can be shared by Sushy
+            objects and processes talking to services of the same vendor and
+            product. Defaults to None, which disables the cache.
+        :param share_connection: Whether to share the connector, thus its
+            connection pool, and the Redfish session with other Sushy
+            objects of the process created with the same base URL, verify
+            argument and credentials or authentication object. Ignored when
+            a connector is provided. Defaults to False.
+        :param session_store: A `sushy.session_store.SessionStore` to reuse
+            Redfish sessions from instead of creating a new session every
+            time, e.g. `sushy.session_store.FileSessionStore` to share them
+            between processes. Sessions are not deleted when stored. Ignored
+            when an authentication mechanism is provided. Defaults to None.
         """
         self._root_prefix = root_prefix
+        self._member_fetch_workers = member_fetch_workers
+        self._expand_levels = expand_levels
+        self._lazy_fields = lazy_fields
+        self._platform_identity = None
+        self._registry_cache = (
+            registry_cache.RegistryCache(registry_cache_dir)
+            if registry_cache_dir else None)
         if (auth is not None and (password is not None
                                   or username is not None)):
             msg = ('Username or Password were provided to Sushy '
                    'when an authentication mechanism was specified.')
             raise ValueError(msg)
+        self._shared_connection = None
+        self._shared_connection_key = None
+        if share_connection and connector is None:
+            key = (base_url, verify,
+                   self._get_auth_identity(auth, username, password))
+
+            def _create():
+                return (
+                    sushy_connector.Connector(
+                        base_url, verify=verify,
+                        server_side_retries=server_side_retries,
+                        server_side_retries_delay=server_side_retries_delay),
+                    auth or sushy_auth.SessionOrBasicAuth(
+                        username=username, password=password,
+                        session_store=session_store))
+
+            self._shared_connection = (
+                sushy_connector.shared_connectors.acquire(key, _create))
+            self._shared_connection_key = key
+            connector = self._shared_connection.connector
+            auth = self._shared_connection.auth
+
         if auth is None:
             auth = sushy_auth.SessionOrBasicAuth(username=username,
-                                                 password=password)
+                                                 password=password,
+                                                 session_store=session_store)
         self._auth = auth
 
-        super(Sushy, self).__init__(
-            connector or sushy_connector.Connector(
-                base_url, verify=verify,
-                server_side_retries=server_side_retries,
-                server_side_retries_delay=server_side_retries_delay),
-            path=self._root_prefix)
-        self._public_connector = public_connector or requests
-        self._language = language
-        self._base_url = base_url
-        self._auth.set_context(self, self._conn)
-        self._auth.authenticate()
+        try:
+            super(Sushy, self).__init__(
+                connector or sushy_connector.Connector(
+                    base_url, verify=verify,
+                    server_side_retries=server_side_retries,
+                    server_side_retries_delay=server_side_retries_delay),
+                path=self._root_prefix)
+            self._public_connector = public_connector or requests
+            self._language = language
+            self._base_url = base_url
+            if self._shared_connection is None:
+                self._auth.set_context(self, self._conn)
+                self._auth.authenticate()
+            else:
+                self._authenticate_shared_connection()
+        except Exception:
+            if self._shared_connection is not None:
+                # NOTE: do not close the session used by other Sushy objects
+                self._auth = None
+                self._release_shared_connection()
+            raise
+
+    @staticmethod
+    def _get_auth_identity(auth, username, password):
+        if auth is not None:
+            # NOTE: the shared connection keeps the authentication object
+            # alive, thus its id is not reused while the connection is shared
+            return ('auth', id(auth))
+        digest = (hashlib.sha256(password.encode('utf-8')).hexdigest()
+                  if password is not None else None)
+        return ('user', username, digest)
+
+    def _authenticate_shared_connection(self):
+        shared = self._shared_connection
+        with shared.lock:
+            shared.users.add(self)
+            if not shared.authenticated:
+                # NOTE: the authentication object outlives this Sushy object
+                # when shared, thus it only keeps a weak reference to it.
+                self._auth.set_context(weakref.proxy(self), self._conn)
+                self._auth.authenticate()
+                shared.authenticated = True
+
+    def _release_shared_connection(self):
+        shared = self._shared_connection
+        self._shared_connection = None
+        with shared.lock:
+            shared.users.discard(self)
+            # NOTE: the authentication object may refer to this Sushy object
+            # for refreshing the session, hand it over to a remaining one.
+            for other in list(shared.users):
+                shared.auth.set_context(weakref.proxy(other),
+                                        shared.connector)
+                break
+        sushy_connector.shared_connectors.release(
+            self._shared_connection_key)
+
+    def close(self):
+        """Close the Redfish session.
+
+        When the connection is shared, it is only released, the session and
+        the connector are closed once no Sushy object uses them anymore.
+        """
+        if getattr(self, '_shared_connection', None) is not None:
+            self._auth = None
+            self._release_shared_connection()
+            return
 
-    def __del__(self):
-        if self._auth:
+        if getattr(self, '_auth', None):
             try:
                 self._auth.close()
 
@@ -227,6 +422,9 @@ class Sushy(base.ResourceBase):
                             'with %s: %s', self._base_url, ex)
             self._auth = None
 
+    def __del__(self):
+        self.close()
+
     def _parse_attributes(self, json_doc):
         """Parse the attributes of a resource.
 
@@ -237,6 +435,39 @@ class Sushy(base.ResourceBase):
         super(Sushy, self)._parse_attributes(json_doc)
         self.redfish_version = json_doc.get('RedfishVersion')
 
+    @property
+    def _select_supported(self):
+        """Whether the service supports the ``$select`` query."""
+        features = self.protocol_features_supported
+        return bool(features and features.select_query)
+
+    @property
+    def _expand_query(self):
+        """The ``$expand`` query to use when fetching collections.
+
+        :returns: the query string or None if expanding is disabled or not
+            supported by the service.
+        """
+        if not self._expand_levels:
+            return None
+
+        features = self.protocol_features_supported
+        support = features.expand_query if features else None
+        if isinstance(support, dict):
+            # Expanding only subordinate resources requires NoLinks
+            if not support.get('NoLinks'):
+                return None
+            levels = self._expand_levels
+            if support.get('MaxLevels'):
+                levels = min(levels, support['MaxLevels'])
+            if levels > 1 and support.get('Levels'):
+                return '$expand=.($levels=%d)' % levels
+            return '$expand=.'
+        elif support is True:
+            return '$expand=.($levels=%d)' % self._expand_levels
+
+        return None
+
     def get_system_collection(self):
         """Get the SystemCollection object
 
@@ -572,20 +803,121 @@ class Sushy(base.ResourceBase):
     def _get_standard_message_registry_collection(self):
         """Load packaged standard message registries
 
+        The registries are listed in the precompiled index and created from
+        their summary in it. Each registry only reads its packaged file and
+        parses its fields when they are used, e.g. on the first lookup of
+        one of its messages.
+
         :returns: list of MessageRegistry
         """
-
-        return [
-            message_registry.MessageRegistry(
-                None,
-                os.path.join(STANDARD_REGISTRY_PATH, json_file.name),
-                reader=base.JsonPackagedFileReader(__package__),
-            )
-            for json_file in resources.files(__package__)
-            .joinpath(STANDARD_REGISTRY_PATH)
-            .iterdir()
-            if json_file.is_file()
-        ]
+        summaries = _load_standard_registry_index()
+        if summaries:
+            names = sorted(summaries)
+        else:
+            names = sorted(
+                json_file.name for json_file in (
+                    resources.files(__package__)
+                    .joinpath(STANDARD_REGISTRY_PATH).iterdir())
+                if json_file.is_file())
+
+        standard = []
+        for name in names:
+            key = ('standard', name)
+            registry = registry_cache.get_interned_registry(key)
+            if registry is None:
+                path = os.path.join(STANDARD_REGISTRY_PATH, name)
+                reader = base.JsonPackagedFileReader(__package__)
+                if name in summaries:
+                    registry = _StandardMessageRegistry(
+                        None, path, reader=reader,
+                        json_doc=_StandardRegistryDocument(summaries[name],
+                                                           path))
+                else:
+                    registry = message_registry.MessageRegistry(
+                        None, path, reader=reader)
+
+                registry = registry_cache.intern_registry(key, registry)
+            standard.append(registry)
+
+        return standard
+
+    def _get_platform_identity(self):
+        """Identify the models and firmware versions of the service
+
+        Attribute registries provided by a service, e.g. of the BIOS, may
+        differ between models and firmware versions while keeping the same
+        identity, thus they are only shared between services of the same
+        platform. The platform is identified on first use only, since it
+        requires fetching all systems and managers.
+
+        :returns: tuple of strings or None if it cannot be determined.
+        """
+        if self._platform_identity is None:
+            try:
+                identity = []
+                for getter, kind, props in (
+                        (self.get_system_collection, 'system',
+                         ('Model', 'BiosVersion')),
+                        (self.get_manager_collection, 'manager',
+                         ('Model', 'FirmwareVersion'))):
+                    for member in getter().get_members():
+                        identity.append('/'.join(
+                            [kind] + [str((member.json or {}).get(prop, ''))
+                                      for prop in props]))
+                self._platform_identity = tuple(sorted(identity))
+            except exceptions.SushyError as exc:
+                LOG.debug('Cannot identify the platform of %(url)s, provided '
+                          'attribute registries are not shared: %(error)s',
+                          {'url': self._base_url, 'error': exc})
+                self._platform_identity = False
+
+        return self._platform_identity or None
+
+    def _get_provided_registry(self, registry_file):
+        """Load a registry provided by the Redfish service
+
+        Registries are shared by all Sushy objects of the process talking
+        to the same kind of service, thus they are only loaded once.
+        Attribute registries are only shared between services of the same
+        platform, see `_get_platform_identity`.
+
+        :param registry_file: MessageRegistryFile object
+        :returns: a MessageRegistry, an AttributeRegistry or None
+        """
+        key = (registry_file.identity, registry_file.registry,
+               self._language, self.vendor, self.product,
+               self.redfish_version)
+        message_key = ('provided', 'MessageRegistry') + key
+        registry = registry_cache.get_interned_registry(message_key)
+        if registry is not None:
+            return registry
+
+        # Check for Message and Attribute registries
+        if key not in _attribute_registry_files:
+            registry = registry_file.get_message_registry(
+                self._language, self._public_connector)
+            if registry:
+                return registry_cache.intern_registry(
+                    message_key, _detach_registry(registry))
+
+        # NOTE: the platform is only identified once the registry turns out
+        # not to be a message registry, it costs requests to the service.
+        platform = self._get_platform_identity()
+        attribute_key = (('provided', 'AttributeRegistry') + key + platform
+                         if platform is not None else None)
+        if attribute_key is not None:
+            registry = registry_cache.get_interned_registry(attribute_key)
+            if registry is not None:
+                return registry
+
+        registry = registry_file.get_attribute_registry(
+            self._language, self._public_connector)
+        if registry:
+            _attribute_registry_files.add(key)
+            if attribute_key is not None:
+                registry = registry_cache.intern_registry(
+                    attribute_key, _detach_registry(registry))
+        return registry
 
     @property
     @utils.cache_it
@@ -600,7 +932,8 @@ class Sushy(base.ResourceBase):
         :returns: dict of combined registries keyed by both the
             registry name (Registry_name.Major_version.Minor_version) and the
             registry file identity, with the value being the actual
-            registry itself.
+            registry itself. The dict maintains an index for lookups by
+            identity, language and message identifier.
         """
         standard = self._get_standard_message_registry_collection()
 
@@ -614,15 +947,7 @@ class Sushy(base.ResourceBase):
         if registry_col:
             provided = registry_col.get_members()
             for r in provided:
-
-                # Check for Message and Attribute registries
-                registry = r.get_message_registry(
-                    self._language,
-                    self._public_connector)
-                if not registry:
-                    registry = r.get_attribute_registry(
-                        self._language,
-                        self._public_connector)
+                registry = self._get_provided_registry(r)
                 if registry:
                     endpoint_registries[r.registry] = registry
                     endpoint_registries.setdefault(r.identity, registry)
@@ -635,7 +960,7 @@ class Sushy(base.ResourceBase):
         else:
             LOG.debug('No registries are available for %s', self.identity)
 
-        return registries
+        return registry_index.RegistryDict(registries)
 
     @property
     def lazy_registries(self):
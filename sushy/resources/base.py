@@ -15,8 +15,8 @@
 
 import abc
 import collections
-import copy
 import enum
+from http import client as http_client
 import io
 import json
 import logging
@@ -32,6 +32,7 @@ except ImportError:
 from sushy import exceptions
 from sushy.resources import constants
 from sushy.resources import oem
+from sushy.resources.registry import registry_index
 from sushy import utils
 
 
@@ -67,6 +68,27 @@ class Field(object):
         self._required = required
         self._default = default
         self._adapter = adapter
+        self._name = None
+
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    def __get__(self, instance, owner):
+        """Load the field on first access in the lazy mode.
+
+        This is a non-data descriptor: once the field is loaded, its value
+        is stored on the instance and this method is not called any more.
+        Outside of the lazy mode the field definition itself is returned.
+        """
+        json_doc = (instance.__dict__.get('_lazy_json')
+                    if instance is not None else None)
+        if json_doc is None:
+            return self
+
+        value = self._load(json_doc, instance)
+        if self._name is not None:
+            instance.__dict__[self._name] = value
+        return value
 
     def _get_item(self, dct, key_or_callable, **context):
         if not callable(key_or_callable):
@@ -85,7 +107,8 @@ class Field(object):
         :param body: parsed JSON body.
         :param resource: ResourceBase instance for which the field is loaded.
         :param nested_in: parent resource path (for error reporting only),
-            must be a list of strings or None.
+            must be a list of strings, a chain built by the parent fields
+            or None.
         :raises: MissingAttributeError if a required field is missing
             and not defaulted.
         :raises: MalformedAttributeError on invalid field value or type.
@@ -100,7 +123,7 @@ class Field(object):
 
         except KeyError:
             if self._required:
-                path = (nested_in or []) + self._path
+                path = _nested_path(nested_in, self._path)
 
                 if self._default is None:
                     raise exceptions.MissingAttributeError(
@@ -122,23 +145,120 @@ class Field(object):
             return self._adapter(item)
 
         except (UnicodeError, ValueError, TypeError) as exc:
-            path = (nested_in or []) + self._path
+            path = _nested_path(nested_in, self._path)
             raise exceptions.MalformedAttributeError(
                 attribute='/'.join(path),
                 resource=resource.path,
                 error=exc)
 
+    def _new_record(self):
+        """Create an empty value of this field consisting of sub-fields.
+
+        The value is an instance of a compact subclass of the field class,
+        see `_get_record_class`, referring back to this field definition.
+        """
+        record_cls = _get_record_class(self.__class__)
+        record = record_cls.__new__(record_cls)
+        record._sushy_field = self
+        return record
+
+
+def _nested_path(nested_in, path):
+    """Build the full path of a nested field for error reporting.
+
+    :param nested_in: parent path as passed to ``Field._load``. Fields
+        consisting of sub-fields pass a chain of ``(parent, path)`` tuples
+        to avoid building lists that are only needed on errors.
+    :param path: path of the field itself.
+    :returns: a list of path items.
+    """
+    parents = []
+    while isinstance(nested_in, tuple):
+        nested_in, parent_path = nested_in
+        parents[:0] = parent_path
+    return list(nested_in or []) + parents + path
+
+
+_FIELD_TABLE_ATTR = '_sushy_field_table'
+
+
+def _get_field_table(cls):
+    """Get the fields declared on a class and its bases.
+
+    The table is computed once per class and cached on it.
+
+    :param cls: ResourceBase or Field subclass.
+    :returns: tuple of tuples (key, field)
+    """
+    table = cls.__dict__.get(_FIELD_TABLE_ATTR)
+    if table is None:
+        table = []
+        for attr in dir(cls):
+            field = getattr(cls, attr)
+            if isinstance(field, Field):
+                table.append((attr, field))
+        table = tuple(table)
+        setattr(cls, _FIELD_TABLE_ATTR, table)
+    return table
+
+
+_RECORD_CLASS_ATTR = '_sushy_record_class'
+
+
+class _FieldRecordMixin(object):
+    """Fallback attribute access of the values of fields.
+
+    Anything but the sub-fields, e.g. the path or any attribute set by the
+    constructor of the field, is taken from the field definition.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name):
+        if name == '_sushy_field':
+            raise AttributeError(name)
+        return getattr(self._sushy_field, name)
+
+
+def _get_record_class(cls):
+    """Get the compact class of the values of a field class.
+
+    Values of fields consisting of sub-fields (e.g. every element of
+    a `ListField`) used to be copies of the field definition, each with its
+    own ``__dict__``. Instead they are instances of a subclass of the field
+    class keeping the sub-fields in slots, so that they still behave like
+    the field class, including its methods and ``isinstance`` checks.
+
+    Field classes storing other attributes on their values list them in
+    a ``_record_slots`` tuple.
+
+    The class is created once per field class and cached on it.
+
+    :param cls: CompositeField, ListField or DictionaryField subclass.
+    :returns: the subclass of cls.
+    """
+    record_cls = cls.__dict__.get(_RECORD_CLASS_ATTR)
+    if record_cls is None:
+        table = _get_field_table(cls)
+        record_cls = type(cls.__name__, (_FieldRecordMixin, cls), {
+            '__slots__': (tuple(attr for attr, _field in table)
+                          + tuple(getattr(cls, '_record_slots', ()))
+                          + ('_sushy_field',)),
+            '__module__': cls.__module__,
+            '__qualname__': cls.__qualname__,
+            '_subfields': dict(table),
+        })
+        setattr(cls, _RECORD_CLASS_ATTR, record_cls)
+    return record_cls
+
 
 def _collect_fields(resource):
     """Collect fields from the JSON.
 
     :param resource: ResourceBase or CompositeField instance.
-    :returns: generator of tuples (key, field)
+    :returns: tuple of tuples (key, field)
     """
-    for attr in dir(resource.__class__):
-        field = getattr(resource.__class__, attr)
-        if isinstance(field, Field):
-            yield (attr, field)
+    return _get_field_table(resource.__class__)
 
 
 class CompositeField(collections.abc.Mapping, Field, metaclass=abc.ABCMeta):
@@ -156,15 +276,15 @@ class CompositeField(collections.abc.Mapping, Field, metaclass=abc.ABCMeta):
         :param nested_in: parent resource name (for error reporting only).
         :returns: a new object with sub-fields attached to it.
         """
-        nested_in = (nested_in or []) + self._path
         value = super(CompositeField, self)._load(body, resource)
         if value is None:
             return None
 
+        nested_in = (nested_in, self._path)
         # We need a new instance, as this method is called a singleton instance
         # that is attached to a class (not instance) of a resource or another
         # CompositeField. We don't want to end up modifying this instance.
-        instance = copy.copy(self)
+        instance = self._new_record()
         for attr, field in self._subfields.items():
             # Hide the Field object behind the real value
             setattr(instance, attr, field._load(value, resource, nested_in))
@@ -202,15 +322,15 @@ class ListField(Field):
         :param nested_in: parent resource name (for error reporting only).
         :returns: a new list object containing subfields.
         """
-        nested_in = (nested_in or []) + self._path
         values = super(ListField, self)._load(body, resource)
         if values is None:
             return None
 
+        nested_in = (nested_in, self._path)
         # Initialize the list that will contain each field instance
         instances = []
         for value in values:
-            instance = copy.copy(self)
+            instance = self._new_record()
             for attr, field in self._subfields.items():
                 # Hide the Field object behind the real value
                 setattr(instance, attr, field._load(value,
@@ -244,14 +364,14 @@ class DictionaryField(Field):
         :param nested_in: parent resource name (for error reporting only).
         :returns: a new dictionary object containing subfields.
         """
-        nested_in = (nested_in or []) + self._path
         values = super(DictionaryField, self)._load(body, resource)
         if values is None:
             return None
 
+        nested_in = (nested_in, self._path)
         instances = {}
         for key, value in values.items():
-            instance_value = copy.copy(self)
+            instance_value = self._new_record()
             for attr, field in self._subfields.items():
                 # Hide the Field object behind the real value
                 setattr(instance_value, attr, field._load(value,
@@ -341,7 +461,6 @@ class MappedListField(Field):
         :param nested_in: parent resource name (for error reporting only).
         :returns: a new list object containing the mapped values.
         """
-        nested_in = (nested_in or []) + self._path
         values = super(MappedListField, self)._load(body, resource)
 
         if values is None:
@@ -381,6 +500,40 @@ class MessageListField(ListField):
     """
 
 
+class _AttributeValues(collections.abc.Mapping):
+    """Attribute/value pairs of a parsed resource, built on first use.
+
+    Walking over all the parsed values is about as expensive as parsing,
+    so it is only done if the values are actually used, e.g. logged.
+    """
+
+    def __init__(self, resource, attrs):
+        self._resource = resource
+        self._attrs = attrs
+        self._values = None
+
+    def _get_values(self):
+        if self._values is None:
+            self._values = {
+                attr: self._resource._get_value(getattr(self._resource, attr))
+                for attr in self._attrs}
+        return self._values
+
+    def __getitem__(self, key):
+        return self._get_values()[key]
+
+    def __iter__(self):
+        return iter(self._get_values())
+
+    def __len__(self):
+        return len(self._attrs)
+
+    def __repr__(self):
+        return repr(self._get_values())
+
+    __str__ = __repr__
+
+
 class FieldData(object):
     """Contains data to be used when constructing Fields"""
 
@@ -425,9 +578,19 @@ class AbstractDataReader(object, metaclass=abc.ABCMeta):
 class JsonDataReader(AbstractDataReader):
     """Gets the data from HTTP response given by path"""
 
-    def get_data(self):
-        """Gets JSON file from URI directly"""
-        data = self._conn.get(path=self._path)
+    def get_data(self, query=None, headers=None):
+        """Gets JSON file from URI directly
+
+        :param query: Optional OData query string, e.g. ``$expand=.``
+        :param headers: Optional dictionary of request headers.
+        """
+        path = self._path
+        if query:
+            path = '%s?%s' % (path, query)
+        if headers:
+            data = self._conn.get(path=path, headers=headers)
+        else:
+            data = self._conn.get(path=path)
         try:
             json_data = data.json() if data.content else {}
         except Exception as exc:
@@ -497,6 +660,31 @@ class JsonPackagedFileReader(AbstractDataReader):
             return FieldData(None, None, json_data)
 
 
+def collect_expanded_resources(json_doc, store):
+    """Collect the expanded resources nested in a JSON document.
+
+    Every nested object which looks like a complete Redfish resource, as
+    opposed to a mere reference, is put into ``store`` keyed by its path.
+    The top level document itself is not collected.
+
+    :param json_doc: parsed JSON document in form of Python types.
+    :param store: dictionary to put the expanded resources into.
+    """
+    pending = list(json_doc.values()) if isinstance(json_doc, dict) else []
+    while pending:
+        value = pending.pop()
+        if isinstance(value, list):
+            pending.extend(value)
+        elif isinstance(value, dict):
+            path = value.get('@odata.id')
+            # NOTE: references only carry @odata.id, and JSON pointers
+            # (containing '#') address parts of another resource.
+            if (isinstance(path, str) and '#' not in path
+                    and '@odata.type' in value and len(value) > 2):
+                store[path.rstrip('/')] = value
+            pending.extend(value.values())
+
+
 def get_reader(connector, path, reader=None):
     """Create and configure the reader.
 
@@ -525,6 +713,12 @@ class ResourceBase(object, metaclass=abc.ABCMeta):
     _log_resource_body = True
     """Whether to log the whole resource body in debug mode."""
 
+    _lazy_fields = None
+    """Whether to load fields on first access instead of on refresh.
+
+    None means following the ``lazy_fields`` setting of the Sushy root object.
+    """
+
     def __init__(self,
                  connector,
                  path='',
@@ -550,12 +744,19 @@ class ResourceBase(object, metaclass=abc.ABCMeta):
         self._conn = connector
         self._path = path
         self._json = None
+        self._headers = None
+        self._headers_write_count = None
+        # What the document has been parsed with, see _get_parse_context
+        self._parse_context = None
         self.redfish_version = redfish_version
         self._registries = registries
         # Note(deray): Indicates if the resource holds stale data or not.
         # Starting off with True and eventually gets set to False when
         # attribute values are fetched.
         self._is_stale = True
+        # Documents prefetched along with this resource, e.g. by a collection
+        # loaded with $expand, to load its sub-resources from.
+        self._prefetched_docs = None
 
         self._reader = get_reader(connector, path, reader)
         self._root = root
@@ -586,20 +787,16 @@ class ResourceBase(object, metaclass=abc.ABCMeta):
 
         return val
 
-    def _get_registry(self, identity, language='en', description='registry'):
-        """Get a registry with the given identity.
+    @staticmethod
+    def _find_registry(registries, identity, language, description):
+        """Find a registry in registries that are not indexed.
 
+        :param registries: mapping of registries.
         :param identity: The registry identity.
-        :param language: RFC 5646 language code for Message Registries.
-            Indicates language of registry to be used. Defaults to 'en'.
+        :param language: RFC 5646 language code.
         :param description: Human-readable description to use in logging.
         :returns: the corresponding registry object or None.
         """
-        registries = self._registries
-        if not registries:
-            LOG.info('No %s is available', description)
-            return None
-
         for key, registry in registries.items():
             if (registry
                     and identity in (key, registry.identity)):
@@ -618,6 +815,29 @@ class ResourceBase(object, metaclass=abc.ABCMeta):
 
                 return registry
 
+    def _get_registry(self, identity, language='en', description='registry'):
+        """Get a registry with the given identity.
+
+        :param identity: The registry identity.
+        :param language: RFC 5646 language code for Message Registries.
+            Indicates language of registry to be used. Defaults to 'en'.
+        :param description: Human-readable description to use in logging.
+        :returns: the corresponding registry object or None.
+        """
+        registries = self._registries
+        if not registries:
+            LOG.info('No %s is available', description)
+            return None
+
+        index = registry_index.get_index(registries)
+        if index is not None:
+            registry = index.get_registry(identity, language)
+        else:
+            registry = self._find_registry(registries, identity, language,
+                                           description)
+        if registry is not None:
+            return registry
+
         avail = ', '.join(f'{reg.identity} ({reg.language})'
                           for reg in registries.values())
         LOG.info('%(descr)s %(registry)s not available for language %(lang)s; '
@@ -628,46 +848,89 @@ class ResourceBase(object, metaclass=abc.ABCMeta):
                   'avail': avail})
         return None
 
+    def _is_lazy(self):
+        """Whether fields are loaded on first access.
+
+        :returns: the ``_lazy_fields`` setting of the resource or, if it is
+            not set, of the Sushy root object.
+        """
+        if self._lazy_fields is not None:
+            return bool(self._lazy_fields)
+        return getattr(self._root, '_lazy_fields', None) is True
+
     def _parse_attributes(self, json_doc):
         """Parse the attributes of a resource.
 
         Parsed JSON fields are set to `self` as declared in the class.
 
+        In the lazy mode the fields are not parsed here: the previously
+        loaded values are dropped and each field is loaded from ``json_doc``
+        on first access.
+
         :param json_doc: parsed JSON document in form of Python types
-        :returns: dictionary of attribute/values after parsing
+        :returns: dictionary of attribute/values after parsing or None in
+            the lazy mode
         """
-        settings = {}
-        for attr, field in _collect_fields(self):
+        if self._is_lazy():
+            for attr, field in _collect_fields(self):
+                self.__dict__.pop(attr, None)
+            self._lazy_json = json_doc
+            return None
+
+        self._lazy_json = None
+        fields = _collect_fields(self)
+        for attr, field in fields:
             # Hide the Field object behind the real value
             setattr(self, attr, field._load(json_doc, self))
 
-            # Get the attribute/value pairs that have been parsed
-            settings[attr] = self._get_value(getattr(self, attr))
-
-        return settings
+        # The attribute/value pairs that have been parsed, only built when
+        # used (e.g. for debug logging)
+        return _AttributeValues(self, [attr for attr, _field in fields])
 
-    def _get_etag(self):
+    def _get_etag(self, revalidate=False):
         """Returns the ETag of the HTTP request if any was specified.
 
+        :param revalidate: whether to fetch the headers again even if they
+            are known from the last refresh.
         :returns ETag or None
         """
-        return self._get_headers().get('ETag')
+        return self._get_headers(revalidate=revalidate).get('ETag')
 
-    def _get_headers(self):
+    def _get_headers(self, revalidate=False):
         """Returns the HTTP headers of the request for the resource.
 
+        The headers received on the last refresh are reused unless the
+        resource is stale, they are not known, a request modifying resources
+        has been sent through the connector since or ``revalidate`` is set.
+
+        :param revalidate: whether to fetch the headers again even if they
+            are known from the last refresh.
         :returns: dict of HTTP headers
         """
-        return self._reader.get_data()._headers
+        if (revalidate or self._is_stale or self._headers is None
+                or self._headers_write_count != self._get_write_count()):
+            self._set_headers(self._reader.get_data()._headers)
+        return self._headers
 
-    def _allow_patch(self):
+    def _get_write_count(self):
+        count = getattr(self._conn, 'write_count', None)
+        return count if isinstance(count, int) else None
+
+    def _set_headers(self, headers):
+        self._headers = headers
+        self._headers_write_count = self._get_write_count()
+
+    def _allow_patch(self, revalidate=False):
         """Returns if the resource supports the PATCH HTTP method.
 
         If the resource supports the PATCH HTTP method for updates,
         it will return it in the Allow HTTP header.
+        :param revalidate: whether to fetch the headers again even if they
+            are known from the last refresh.
         :returns: Boolean flag if PATCH is supported or not
         """
-        allow_header = self._get_headers().get('Allow', '')
+        allow_header = self._get_headers(revalidate=revalidate).get(
+            'Allow', '')
         methods = set([h.strip().upper() for h in allow_header.split(',')])
         return "PATCH" in methods
 
@@ -685,6 +948,9 @@ class ResourceBase(object, metaclass=abc.ABCMeta):
             marked as stale, otherwise neither it nor its subresources will
             be refreshed.
         :param json_doc: parsed JSON document in form of Python types.
+        :returns: True if the resource has been (re-)loaded, False if it was
+            not refreshed or the service reported that it has not been
+            modified since it was loaded.
         :raises: ResourceNotFoundError
         :raises: ConnectionError
         :raises: HTTPError
@@ -692,23 +958,188 @@ class ResourceBase(object, metaclass=abc.ABCMeta):
         # Note(deray): Don't re-fetch / invalidate the sub-resources if the
         # resource is "_not_ stale" (i.e. fresh) OR _not_ forced.
         if not self._is_stale and not force:
-            return
+            return False
 
+        changed = parse = True
         if json_doc:
             self._json = json_doc
+            self._headers = None
+            self._prefetched_docs = None
         else:
-            self._json = self._reader.get_data().json_doc
-
-        attributes = self._parse_attributes(self._json)
-        LOG.debug('Received representation of %(type)s %(path)s: %(json)s',
-                  {'type': self.__class__.__name__,
-                   'path': self._path,
-                   'json': (attributes if self._log_resource_body
-                            else '<stripped>')})
+            new_json = self._load_json()
+            if new_json is None:
+                changed = False
+                # NOTE: the unmodified document is parsed again if what it
+                # is parsed with has changed, e.g. the OEM vendor.
+                parse = self._parse_context != self._get_parse_context()
+                LOG.debug('%(type)s %(path)s has not been modified',
+                          {'type': self.__class__.__name__,
+                           'path': self._path})
+            else:
+                self._json = new_json
+
+        if parse:
+            self._parse_context = self._get_parse_context()
+            attributes = self._parse_attributes(self._json)
+            if LOG.isEnabledFor(logging.DEBUG):
+                LOG.debug('Received representation of %(type)s %(path)s: '
+                          '%(json)s',
+                          {'type': self.__class__.__name__,
+                           'path': self._path,
+                           'json': ('<stripped>'
+                                    if not self._log_resource_body
+                                    else self._json if attributes is None
+                                    else attributes)})
         self._do_refresh(force)
 
         # Mark it fresh
         self._is_stale = False
+        return changed
+
+    def _get_parse_context(self):
+        """Returns what parsing the document depends on besides the document.
+
+        When the service reports that the resource has not been modified,
+        the document is only parsed again if this has changed since it was
+        last parsed.
+
+        :returns: a value comparable for equality, None by default.
+        """
+        return None
+
+    def refresh_fields(self, *names):
+        """Refresh only the given fields of the resource
+
+        If the service supports the OData ``$select`` query, only the JSON
+        properties backing the given fields are requested. Only the given
+        fields are parsed again, the other fields, the nested resources and
+        the ``_is_stale`` flag are left untouched. The headers received on
+        the last refresh, e.g. the ETag, are dropped since they do not match
+        the updated document anymore.
+
+        Usage:
+
+        .. code-block:: python
+
+          system.refresh_fields('power_state', 'status')
+
+        :param names: names of the fields to refresh, e.g. ``power_state``.
+        :raises: ValueError if a name is not a field of the resource.
+        :raises: ResourceNotFoundError
+        :raises: ConnectionError
+        :raises: HTTPError
+        """
+        fields, properties, query = self._prepare_refresh_fields(names)
+        if query is not None and type(self._reader) is JsonDataReader:
+            json_doc = self._reader.get_data(query=query).json_doc
+        else:
+            json_doc = self._reader.get_data().json_doc
+
+        self._update_fields(names, fields, properties, json_doc)
+
+    def _prepare_refresh_fields(self, names):
+        """Find the fields to refresh and the query to fetch them with.
+
+        :param names: names of the fields to refresh.
+        :raises: ValueError if a name is not a field of the resource.
+        :returns: tuple of the dict of the fields, the set of the JSON
+            properties backing them and the ``$select`` query string or
+            None if the service does not support it.
+        """
+        fields = dict(_collect_fields(self))
+        unknown = set(names) - set(fields)
+        if unknown:
+            raise ValueError('%(type)s has no fields %(names)s' %
+                             {'type': self.__class__.__name__,
+                              'names': ', '.join(sorted(unknown))})
+
+        properties = {fields[name]._path[0] for name in names}
+        query = None
+        if (getattr(self._root, '_select_supported', False) is True
+                and all(isinstance(prop, str) for prop in properties)):
+            query = '$select=%s' % ','.join(sorted(properties))
+        return fields, properties, query
+
+    def _update_fields(self, names, fields, properties, json_doc):
+        """Parse the refreshed fields from a (partial) document.
+
+        :param names: names of the fields to refresh.
+        :param fields: dict of the fields, see `_prepare_refresh_fields`.
+        :param properties: set of the JSON properties backing the fields.
+        :param json_doc: parsed JSON document in form of Python types.
+        """
+        for name in names:
+            setattr(self, name, fields[name]._load(json_doc, self))
+
+        # NOTE: keep the JSON document in sync with the refreshed fields
+        # without modifying the original one, which may be shared.
+        new_json = dict(self._json or {})
+        for prop in properties:
+            if not isinstance(prop, str):
+                continue
+            if prop in json_doc:
+                new_json[prop] = json_doc[prop]
+            else:
+                new_json.pop(prop, None)
+        self._json = new_json
+        # NOTE: the ETag and the other headers received with the whole
+        # document do not match the merged one anymore.
+        self._headers = None
+
+    def _take_prefetched_json(self):
+        """Take the document of this resource from the prefetched ones.
+
+        Documents are prefetched by collections loaded with ``$expand`` and
+        made available while their members and sub-resources are created,
+        see `sushy.utils.prefetched_documents`. They are only used for the
+        first load of a resource, each of them only once.
+
+        :returns: parsed JSON document or None if it was not prefetched.
+        """
+        if self._json is not None or type(self._reader) is not (
+                JsonDataReader):
+            return None
+        store = utils.get_prefetched_documents()
+        if not store:
+            return None
+        json_doc = store.pop(self._path.rstrip('/'), None)
+        if json_doc is not None:
+            # NOTE: the sub-resources were prefetched in the same request
+            self._prefetched_docs = store
+        return json_doc
+
+    def _load_json(self):
+        """Fetch the JSON document of the resource.
+
+        The response headers are stored for later use. If the resource has
+        already been loaded with an ETag, the request is conditional.
+
+        :returns: parsed JSON document in form of Python types or None if
+            the resource has not been modified since it was loaded.
+        :raises: ResourceNotFoundError
+        :raises: ConnectionError
+        :raises: HTTPError
+        """
+        json_doc = self._take_prefetched_json()
+        if json_doc is not None:
+            self._headers = None
+            return json_doc
+
+        self._prefetched_docs = None
+        etag = None
+        if (self._json is not None
+                and isinstance(self._headers, collections.abc.Mapping)):
+            etag = self._headers.get('ETag')
+        # NOTE: only send ETags actually received from the service.
+        if isinstance(etag, str):
+            data = self._reader.get_data(headers={'If-None-Match': etag})
+            if data.status_code == http_client.NOT_MODIFIED:
+                return None
+        else:
+            data = self._reader.get_data()
+
+        self._set_headers(data.headers)
+        return data.json_doc
 
     def _do_refresh(self, force):
         """Primitive method to be overridden by refresh related activities.
@@ -838,18 +1269,27 @@ class ResourceLinksBase(ResourceBase, metaclass=abc.ABCMeta):
         :returns: The ``_resource_type`` object
         :raises: ResourceNotFoundError
         """
-        return self._resource_type(
-            self._conn, identity, redfish_version=self.redfish_version,
-            registries=self.registries,
-            root=self.root)
+        with utils.prefetched_documents(self._prefetched_docs):
+            return self._resource_type(
+                self._conn, identity, redfish_version=self.redfish_version,
+                registries=self.registries,
+                root=self.root)
 
     @utils.cache_it
-    def get_members(self):
+    def get_members(self, max_workers=None):
         """Return a list of ``_resource_type`` objects present in collection
 
+        :param max_workers: maximum number of members fetched concurrently.
+            Defaults to the ``member_fetch_workers`` setting of the Sushy
+            root object, members are fetched one after another if neither
+            is set. Ignored when the members are already cached.
         :returns: A list of ``_resource_type`` objects
         """
-        return [self.get_member(id_) for id_ in self.members_identities]
+        if max_workers is None:
+            max_workers = getattr(self._root, '_member_fetch_workers', None)
+
+        return utils.map_concurrently(self.get_member,
+                                      self.members_identities, max_workers)
 
 
 class ResourceCollectionBase(ResourceLinksBase):
@@ -861,6 +1301,36 @@ class ResourceCollectionBase(ResourceLinksBase):
                                adapter=utils.get_members_identities)
     """A tuple with the members identities"""
 
+    def _load_json(self):
+        """Fetch the JSON document of the collection.
+
+        If the Sushy root object has ``expand_levels`` set and the service
+        supports it, the members and their subordinate resources are
+        fetched in the same request using ``$expand``. They are then used
+        instead of fetching each of them separately when the members of
+        this collection and their sub-resources are first loaded.
+
+        :returns: parsed JSON document in form of Python types.
+        :raises: ResourceNotFoundError
+        :raises: ConnectionError
+        :raises: HTTPError
+        """
+        query = getattr(self._root, '_expand_query', None)
+        if not isinstance(query, str) or type(self._reader) is not (
+                JsonDataReader):
+            return super()._load_json()
+
+        self._headers = None
+        json_doc = self._take_prefetched_json()
+        if json_doc is None:
+            data = self._reader.get_data(query=query)
+            self._set_headers(data.headers)
+            json_doc = data.json_doc
+            store = {}
+            collect_expanded_resources(json_doc, store)
+            self._prefetched_docs = store or None
+        return json_doc
+
 
 class MutableResourceCollectionBase(ResourceCollectionBase):
 
@@ -15,6 +15,8 @@
 # Redfish standard schema.
 # https://redfish.dmtf.org/schemas/v1/EventService.v1_0_8.json
 
+import contextlib
+import json
 import logging
 
 from sushy import exceptions
@@ -55,6 +57,9 @@ class EventService(base.ResourceBase):
                                               adapter=list)
     """Types of Events that can be subscribed to"""
 
+    server_sent_event_uri = base.Field('ServerSentEventUri')
+    """URI of the stream of server-sent events, if supported"""
+
     service_enabled = base.Field('ServiceEnabled', adapter=bool)
     """Indicates whether the EventService is enabled"""
 
@@ -135,6 +140,28 @@ class EventService(base.ResourceBase):
         return {v for v in constants.EventType
                 if v.value in self.event_types_for_subscription}
 
+    def iter_server_sent_events(self, timeout=None):
+        """Open the stream of server-sent events
+
+        The stream stays open for as long as the returned iterator is used.
+
+        :param timeout: Max time in seconds to wait for the next event, None
+            to wait forever.
+        :returns: An iterator over the Event documents received.
+        :raises: MissingAttributeError if the EventService does not support
+            server-sent events.
+        :raises: ConnectionError
+        :raises: HTTPError
+        """
+        if not self.server_sent_event_uri:
+            raise exceptions.MissingAttributeError(
+                attribute='ServerSentEventUri', resource=self._path)
+
+        response = self._conn.get(self.server_sent_event_uri,
+                                  headers={'Accept': 'text/event-stream'},
+                                  timeout=timeout, stream=True)
+        return _iter_events(response)
+
     def _get_subscriptions_collection_path(self):
         """Helper function to find the EventDestinationCollections path"""
         subscriptions = self.json.get('Subscriptions')
@@ -150,3 +177,29 @@ class EventService(base.ResourceBase):
             self._conn, self._get_subscriptions_collection_path(),
             redfish_version=self.redfish_version, registries=self.registries,
             root=self.root)
+
+
+def _iter_events(response):
+    """Parse a stream of server-sent events
+
+    :param response: streamed response of the server-sent events URI.
+    :returns: An iterator over the Event documents received.
+    """
+    with contextlib.closing(response):
+        data = []
+        for line in response.iter_lines(decode_unicode=True):
+            if not line:
+                if data:
+                    try:
+                        yield json.loads('\n'.join(data))
+                    except ValueError as exc:
+                        LOG.warning('Ignoring malformed server-sent event: '
+                                    '%s', exc)
+                    data = []
+                continue
+
+            # NOTE: only the data field carries the event, lines starting
+            # with a colon are comments, e.g. keep-alive messages.
+            field, _sep, value = line.partition(':')
+            if field == 'data':
+                data.append(value[1:] if value.startswith(' ') else value)
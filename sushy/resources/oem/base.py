@@ -52,6 +52,9 @@ class OEMResourceBase(base.ResourceBase):
         self.invalidate(force_refresh=True)
         return self
 
+    def _get_parse_context(self):
+        return self._vendor_id
+
     def _parse_attributes(self, json_doc):
         """Parse the attributes of a resource.
 
@@ -14,8 +14,10 @@
 # https://redfish.dmtf.org/schemas/v1/AttributeRegistry.v1_3_5.json
 
 import logging
+import types
 
 from sushy.resources import base
+from sushy import utils
 
 LOG = logging.getLogger(__name__)
 
@@ -62,6 +64,53 @@ class AttributeListField(base.ListField):
     """An array of the possible values for enumerated attribute values"""
 
 
+def _get_allowed_values(attribute):
+    values = attribute.allowable_values
+    if not values:
+        return None
+    return frozenset(v.get('ValueName') if isinstance(v, dict) else v
+                     for v in values)
+
+
+def _is_allowed(value, allowed):
+    try:
+        return value in allowed
+    except TypeError:
+        # Unhashable values, e.g. lists, are never allowed
+        return False
+
+
+def _validate_length(attribute, value):
+    if not isinstance(value, str):
+        return 'expected a string, got %r' % (value,)
+    if attribute.min_length is not None and len(value) < attribute.min_length:
+        return 'shorter than %s characters' % attribute.min_length
+    if attribute.max_length is not None and len(value) > attribute.max_length:
+        return 'longer than %s characters' % attribute.max_length
+
+
+def _validate_integer(attribute, value):
+    if not isinstance(value, int) or isinstance(value, bool):
+        return 'expected an integer, got %r' % (value,)
+    if attribute.lower_bound is not None and value < attribute.lower_bound:
+        return 'lower than %s' % attribute.lower_bound
+    if attribute.upper_bound is not None and value > attribute.upper_bound:
+        return 'greater than %s' % attribute.upper_bound
+
+
+def _validate_boolean(attribute, value):
+    if not isinstance(value, bool):
+        return 'expected a boolean, got %r' % (value,)
+
+
+_TYPE_VALIDATORS = {
+    'String': _validate_length,
+    'Password': _validate_length,
+    'Integer': _validate_integer,
+    'Boolean': _validate_boolean,
+}
+
+
 class AttributeRegistryEntryField(base.CompositeField):
 
     attributes = AttributeListField('Attributes')
@@ -96,3 +145,73 @@ class AttributeRegistry(base.ResourceBase):
 
     registry_entries = AttributeRegistryEntryField('RegistryEntries')
     """Field containing Attributes, Dependencies, Menus etc."""
+
+    @property
+    @utils.cache_it
+    def _attribute_index(self):
+        """Attributes and their allowed values keyed by the attribute name"""
+        index = {}
+        entries = self.registry_entries
+        for attribute in (entries.attributes if entries else None) or ():
+            if attribute.name not in index:
+                index[attribute.name] = (attribute,
+                                         _get_allowed_values(attribute))
+        return index
+
+    @property
+    @utils.cache_it
+    def attributes_by_name(self):
+        """Read-only mapping of the attribute names to the attributes
+
+        The mapping is built once and kept until the registry is refreshed.
+        """
+        return types.MappingProxyType(
+            {name: attribute
+             for name, (attribute, _allowed) in self._attribute_index.items()})
+
+    def get_attribute(self, name):
+        """Get an attribute by its name.
+
+        :param name: the attribute name, ``AttributeName`` in the registry.
+        :returns: the `AttributeListField` entry or None if not found.
+        """
+        entry = self._attribute_index.get(name)
+        return entry[0] if entry is not None else None
+
+    def validate_attributes(self, attributes):
+        """Check attribute values against the registry.
+
+        Checks that every attribute is known and writable and that its value
+        has the right type, is within the bounds or length limits and is one
+        of the allowable values, if defined in the registry.
+
+        :param attributes: dict of attribute names and values, e.g. the
+            value passed to `Bios.set_attributes`.
+        :returns: dict of the names of the invalid attributes and the
+            reasons they are invalid, empty if all values are valid.
+        """
+        index = self._attribute_index
+        errors = {}
+        for name, value in attributes.items():
+            entry = index.get(name)
+            if entry is None:
+                errors[name] = 'unknown attribute'
+                continue
+
+            attribute, allowed = entry
+            if attribute.read_only:
+                errors[name] = 'read-only attribute'
+            elif attribute.immutable:
+                errors[name] = 'immutable attribute'
+            elif allowed is not None:
+                if not _is_allowed(value, allowed):
+                    errors[name] = '%r is not one of %s' % (
+                        value, ', '.join(sorted(map(str, allowed))))
+            else:
+                validator = _TYPE_VALIDATORS.get(attribute.attribute_type)
+                error = (validator(attribute, value)
+                         if validator is not None else None)
+                if error is not None:
+                    errors[name] = error
+
+        return errors
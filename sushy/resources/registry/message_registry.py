@@ -13,17 +13,70 @@
 # This is referred from Redfish standard schema.
 # https://redfish.dmtf.org/schemas/v1/MessageRegistry.v1_1_1.json
 
+import functools
 import logging
+import re
 
 from sushy.resources import base
 from sushy.resources import constants as res_cons
 from sushy.resources.registry import constants as reg_cons
+from sushy.resources.registry import registry_index
 
 LOG = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _get_placeholder_pattern(number_of_args):
+    # NOTE: higher positions go first, so that %10 is not taken for %1
+    positions = '|'.join(str(i) for i in range(number_of_args, 0, -1))
+    return re.compile('%%(%s)' % positions)
+
+
+class MessageTemplate(object):
+    """Message template compiled for substituting the arguments."""
+
+    __slots__ = ('_literals', '_positions')
+
+    def __init__(self, template, number_of_args):
+        """Compile the template.
+
+        :param template: template text with %1 to %<number_of_args>
+            placeholders for the message arguments.
+        :param number_of_args: number of the message arguments.
+        """
+        template = template or ''
+        if number_of_args:
+            pieces = _get_placeholder_pattern(number_of_args).split(template)
+        else:
+            pieces = [template]
+        self._literals = tuple(pieces[::2])
+        self._positions = tuple(int(p) - 1 for p in pieces[1::2])
+
+    def format(self, message_args):
+        """Substitute the message arguments.
+
+        :param message_args: list of the message arguments. Placeholders
+            without an argument are replaced with 'unknown'.
+        :returns: the message text.
+        """
+        literals = self._literals
+        if not self._positions:
+            return literals[0]
+
+        message_args = message_args or ()
+        count = len(message_args)
+        parts = [literals[0]]
+        for position, literal in zip(self._positions, literals[1:]):
+            parts.append(str(message_args[position])
+                         if position < count else 'unknown')
+            parts.append(literal)
+        return ''.join(parts)
+
+
 class MessageDictionaryField(base.DictionaryField):
 
+    _record_slots = ('_template',)
+
     description = base.Field('Description', required=True, default='')
     """Indicates how and when the message is returned by the Redfish service"""
 
@@ -54,6 +107,14 @@ class MessageDictionaryField(base.DictionaryField):
                                 default=res_cons.Severity.WARNING)
     """Mapped severity of the message"""
 
+    def _load(self, body, resource, nested_in=None):
+        messages = super(MessageDictionaryField, self)._load(
+            body, resource, nested_in)
+        for message in (messages or {}).values():
+            message._template = MessageTemplate(message.message,
+                                                message.number_of_args)
+        return messages
+
 
 class MessageRegistry(base.ResourceBase):
 
@@ -98,48 +159,71 @@ def parse_message(message_registries, message_field):
 
     :returns: parsed settings.MessageListField with missing attributes filled
     """
+    return _parse_message(message_registries,
+                          registry_index.get_index(message_registries),
+                          message_field)
 
-    reg_msg = None
-    if '.' in message_field.message_id:
-        registry, msg_key = message_field.message_id.rsplit('.', 1)
 
+def parse_messages(message_registries, message_fields):
+    """Parse a list of messages in registries and substitute any params
+
+    :param message_registries: dict of Message Registries
+    :param message_fields: list of settings.MessageListField to parse
+
+    :returns: list of parsed settings.MessageListField with missing
+        attributes filled
+    """
+    index = registry_index.get_index(message_registries)
+    return [_parse_message(message_registries, index, message_field)
+            for message_field in message_fields or ()]
+
+
+def _find_message(message_registries, registry, msg_key):
+    if registry is not None:
         if (registry in message_registries
                 and hasattr(message_registries[registry], "messages")
                 and msg_key in message_registries[registry].messages):
-            reg_msg = message_registries[registry].messages[msg_key]
+            return message_registries[registry].messages[msg_key]
+        return None
+
+    # Some firmware only reports the MessageKey and no RegistryName.
+    # Fall back to the MessageRegistryFile with Id of Messages next, and
+    # BaseMessages as a last resort
+    for mrf_id in registry_index.FALLBACK_MESSAGE_REGISTRIES:
+        if (mrf_id in message_registries and msg_key in
+                message_registries[mrf_id].messages):
+            return message_registries[mrf_id].messages[msg_key]
+
+
+def _parse_message(message_registries, index, message_field):
+    message_id = message_field.message_id
+    if '.' in message_id:
+        registry, msg_key = message_id.rsplit('.', 1)
+    else:
+        registry = None
+        msg_key = message_id
+
+    if index is not None:
+        reg_msg = index.get_message(message_id)
     else:
-        # Some firmware only reports the MessageKey and no RegistryName.
-        # Fall back to the MessageRegistryFile with Id of Messages next, and
-        # BaseMessages as a last resort
-        registry = 'unknown'
-        msg_key = message_field.message_id
-
-        mrf_ids = ['Messages', 'BaseMessages']
-        for mrf_id in mrf_ids:
-            if (mrf_id in message_registries and msg_key in
-                    message_registries[mrf_id].messages):
-                reg_msg = message_registries[mrf_id].messages[msg_key]
-                break
+        reg_msg = _find_message(message_registries, registry, msg_key)
 
     if not reg_msg:
         LOG.warning(
             'Unable to find message for registry %(registry)s, '
             'message ID %(msg_key)s', {
-                'registry': registry,
+                'registry': registry or 'unknown',
                 'msg_key': msg_key})
         if message_field.message is None:
             message_field.message = 'unknown'
         return message_field
 
-    msg = reg_msg.message
-    for i in range(1, reg_msg.number_of_args + 1):
-        if i <= len(message_field.message_args):
-            msg = msg.replace('%%%i' % i,
-                              str(message_field.message_args[i - 1]))
-        else:
-            msg = msg.replace('%%%i' % i, 'unknown')
+    template = getattr(reg_msg, '_template', None)
+    if not isinstance(template, MessageTemplate):
+        # NOTE: messages not loaded by MessageDictionaryField
+        template = MessageTemplate(reg_msg.message, reg_msg.number_of_args)
 
-    message_field.message = msg
+    message_field.message = template.format(message_field.message_args)
     if not message_field.severity:
         message_field.severity = reg_msg.severity
     if not message_field.resolution:
@@ -19,6 +19,7 @@ import logging
 from sushy.resources import base
 from sushy.resources.registry import attribute_registry
 from sushy.resources.registry import message_registry
+from sushy.resources.registry import registry_cache
 
 LOG = logging.getLogger(__name__)
 
@@ -100,6 +101,31 @@ class MessageRegistryFile(base.ResourceBase):
                                   'AttributeRegistry',
                                   attribute_registry.AttributeRegistry)
 
+    def _get_registry_cache_key(self, requested_type, language):
+        """Get the on-disk registry cache and the key for a registry
+
+        :param requested_type: string identifying registry
+        :param language: RFC 5646 language code for registry files
+        :returns: tuple of the RegistryCache and the key or (None, None)
+            if the Sushy root object has no registry cache or the registry
+            cannot be cached.
+        """
+        cache = getattr(self._root, '_registry_cache', None)
+        if not isinstance(cache, registry_cache.RegistryCache):
+            return None, None
+
+        key = [requested_type, self.identity, self.registry, language,
+               self._root.vendor or '', self._root.product or '',
+               self._root.redfish_version or '']
+        if requested_type == 'AttributeRegistry':
+            # NOTE: OEM attribute registries, e.g. of the BIOS, keep their
+            # identity across models and firmware versions.
+            platform = self._root._get_platform_identity()
+            if not isinstance(platform, tuple):
+                return None, None
+            key.extend(platform)
+        return cache, key
+
     def _get_registry(self, language, public_connector, requested_type,
                       registry_class):
         """Load registry file depending on the registry type
@@ -131,6 +157,20 @@ class MessageRegistryFile(base.ResourceBase):
         locations += [
             l for l in self.location if l.language.lower() == 'default']
 
+        cache, cache_key = self._get_registry_cache_key(requested_type,
+                                                        language)
+        cached = cache.get(cache_key) if cache is not None else None
+        if cached is not None:
+            path, json_doc = cached
+            try:
+                return registry_class(self._conn, path=path,
+                                      json_doc=json_doc,
+                                      redfish_version=self.redfish_version)
+            except Exception as exc:
+                LOG.warning('Cannot load cached registry %(registry)s: '
+                            '%(error)s',
+                            {'registry': self.registry, 'error': exc})
+
         for location in locations:
             if location.uri:
                 args = self._conn,
@@ -174,7 +214,7 @@ class MessageRegistryFile(base.ResourceBase):
 
             if registry_type._odata_type.endswith(requested_type):
                 try:
-                    return registry_class(*args, **kwargs)
+                    registry = registry_class(*args, **kwargs)
 
                 except Exception as exc:
                     LOG.warning(
@@ -185,6 +225,10 @@ class MessageRegistryFile(base.ResourceBase):
                             'error': exc})
                     continue
 
+                if cache is not None:
+                    cache.put(cache_key, kwargs['path'], registry.json)
+                return registry
+
             LOG.debug('Ignoring unsupported flavor of registry %(registry)s',
                       {'registry': registry_type._odata_type})
             return
@@ -0,0 +1,132 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import weakref
+
+LOG = logging.getLogger(__name__)
+
+# NOTE: registries shared by all Sushy objects of the process. Only weak
+# references are kept, so that a registry is released together with the
+# last Sushy object using it.
+_interned = weakref.WeakValueDictionary()
+_interned_lock = threading.Lock()
+
+
+def get_interned_registry(key):
+    """Get a registry shared within the process.
+
+    :param key: tuple of strings identifying the registry.
+    :returns: the registry or None if it is not used by anyone.
+    """
+    with _interned_lock:
+        return _interned.get(key)
+
+
+def intern_registry(key, registry):
+    """Share a registry within the process.
+
+    :param key: tuple of strings identifying the registry.
+    :param registry: the registry object.
+    :returns: the registry already shared under the same key if any,
+        otherwise the provided registry.
+    """
+    with _interned_lock:
+        return _interned.setdefault(key, registry)
+
+
+class RegistryCache(object):
+    """On-disk cache of registry documents.
+
+    Every document is stored in a separate gzip-compressed JSON file named
+    after the hash of its key. Files are replaced atomically, so the same
+    directory can be shared by several Sushy objects and processes.
+
+    Failures to read or write the cache are logged and otherwise ignored.
+    """
+
+    def __init__(self, directory):
+        """Create the cache.
+
+        :param directory: directory to store the cached documents in. It is
+            created on first write if missing.
+        """
+        self._directory = directory
+
+    @property
+    def directory(self):
+        return self._directory
+
+    def _get_file_path(self, key):
+        digest = hashlib.sha256(
+            json.dumps(key, sort_keys=True).encode('utf-8')).hexdigest()
+        return os.path.join(self._directory, digest + '.json.gz')
+
+    def get(self, key):
+        """Get a cached document.
+
+        :param key: list of strings identifying the document.
+        :returns: tuple of the path the document was loaded from and the
+            document itself, or None if it is not cached.
+        """
+        file_path = self._get_file_path(key)
+        try:
+            with gzip.open(file_path, 'rt', encoding='utf-8') as fp:
+                entry = json.load(fp)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError) as exc:
+            LOG.warning('Cannot read cached registry %(file)s: %(error)s',
+                        {'file': file_path, 'error': exc})
+            return None
+
+        if not isinstance(entry, dict) or entry.get('key') != list(key):
+            LOG.warning('Ignoring cached registry %(file)s not matching '
+                        '%(key)s', {'file': file_path, 'key': key})
+            return None
+
+        return entry.get('path'), entry.get('json')
+
+    def put(self, key, path, json_doc):
+        """Store a document in the cache.
+
+        :param key: list of strings identifying the document.
+        :param path: path the document has been loaded from.
+        :param json_doc: parsed JSON document in form of Python types.
+        """
+        file_path = self._get_file_path(key)
+        entry = {'key': list(key), 'path': path, 'json': json_doc}
+        tmp_path = None
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self._directory,
+                                            suffix='.tmp')
+            with os.fdopen(fd, 'wb') as raw_fp:
+                with gzip.open(raw_fp, 'wt', encoding='utf-8') as fp:
+                    json.dump(entry, fp, separators=(',', ':'))
+            os.replace(tmp_path, file_path)
+            tmp_path = None
+        except (OSError, TypeError, ValueError) as exc:
+            LOG.warning('Cannot cache registry in %(file)s: %(error)s',
+                        {'file': file_path, 'error': exc})
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
@@ -0,0 +1,158 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+# NOTE: this module is used by sushy.resources.base, thus it must not import
+# any resources.
+
+# Registry file identities to look up messages reported without the registry
+# name, in the order of preference.
+FALLBACK_MESSAGE_REGISTRIES = ('Messages', 'BaseMessages')
+
+
+class RegistryIndex(object):
+    """Lookup tables for a dictionary of registries.
+
+    The table of registries is built on first use, messages are looked up
+    in the registry they belong to. The index must be dropped when the
+    dictionary changes, see `RegistryDict`.
+    """
+
+    def __init__(self, registries):
+        """Create the index.
+
+        :param registries: dict of registries keyed by both the registry name
+            (Registry_name.Major_version.Minor_version) and the registry file
+            identity.
+        """
+        self._registries = registries
+        self._by_identity = None
+
+    @staticmethod
+    def _normalize_language(language):
+        # NOTE(iurygregory): some registries may have "en-US" as their
+        # language, in this case the registry is also found by the language
+        # without the region.
+        return language.lower().split('-', 1)[0]
+
+    def _build_identity_table(self):
+        table = {}
+        for key, registry in self._registries.items():
+            if not registry:
+                continue
+
+            language = registry.language
+            languages = (language, self._normalize_language(language))
+            for identity in (key, registry.identity):
+                for lang in languages:
+                    table.setdefault((identity, lang), registry)
+        return table
+
+    def get_registry(self, identity, language):
+        """Get a registry by its identity and language.
+
+        :param identity: registry name or registry file identity.
+        :param language: RFC 5646 language code. Registries with a region
+            in their language are also found by the language alone.
+        :returns: the registry or None if not found.
+        """
+        if self._by_identity is None:
+            self._by_identity = self._build_identity_table()
+
+        registry = self._by_identity.get((identity, language))
+        if registry is None:
+            registry = self._by_identity.get((identity, language.lower()))
+        return registry
+
+    def get_message(self, message_id):
+        """Get a registry message by its full identifier.
+
+        Only the messages of the registry named in the identifier are
+        loaded, so the messages of the other registries are not parsed.
+
+        :param message_id: MessageId in form
+            Registry_name.Major_version.Minor_version.MessageKey or just
+            MessageKey for messages of the fallback registries.
+        :returns: the registry message or None if not found.
+        """
+        registry_key, _sep, msg_key = message_id.rpartition('.')
+        if registry_key:
+            keys = (registry_key,)
+        else:
+            # Some firmware only reports the MessageKey and no RegistryName
+            keys = FALLBACK_MESSAGE_REGISTRIES
+
+        for key in keys:
+            messages = getattr(self._registries.get(key), 'messages', None)
+            if messages and msg_key in messages:
+                return messages[msg_key]
+        return None
+
+
+class RegistryDict(dict):
+    """Dictionary of registries maintaining a `RegistryIndex`."""
+
+    def __init__(self, *args, **kwargs):
+        super(RegistryDict, self).__init__(*args, **kwargs)
+        self._index = None
+
+    @property
+    def registry_index(self):
+        """The index of the registries, rebuilt after any change."""
+        if self._index is None:
+            self._index = RegistryIndex(self)
+        return self._index
+
+    def _changed(self):
+        self._index = None
+
+    def __setitem__(self, key, value):
+        super(RegistryDict, self).__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super(RegistryDict, self).__delitem__(key)
+        self._changed()
+
+    def clear(self):
+        super(RegistryDict, self).clear()
+        self._changed()
+
+    def pop(self, *args):
+        self._changed()
+        return super(RegistryDict, self).pop(*args)
+
+    def popitem(self):
+        self._changed()
+        return super(RegistryDict, self).popitem()
+
+    def setdefault(self, key, default=None):
+        self._changed()
+        return super(RegistryDict, self).setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        super(RegistryDict, self).update(*args, **kwargs)
+        self._changed()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+
+def get_index(registries):
+    """Get the index of registries if they maintain one.
+
+    :param registries: `RegistryDict`, an object wrapping it like
+        `sushy.main.LazyRegistries` or any other mapping of registries.
+    :returns: `RegistryIndex` or None if the registries are not indexed.
+    """
+    index = getattr(registries, 'registry_index', None)
+    return index if isinstance(index, RegistryIndex) else None
@@ -189,10 +189,8 @@ class SettingsField(base.CompositeField):
         if not self.time:
             return SettingsUpdate(NO_UPDATES, None)
 
-        parsed_msgs = []
-        for m in self.messages:
-            parsed_msgs.append(
-                message_registry.parse_message(registries, m))
+        parsed_msgs = message_registry.parse_messages(registries,
+                                                      self.messages)
         any_errors = any(m for m in parsed_msgs
                          if m.severity != res_cons.Severity.OK)
 
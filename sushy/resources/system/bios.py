@@ -24,6 +24,46 @@ from sushy import utils
 
 LOG = logging.getLogger(__name__)
 
+_MISSING = object()
+
+
+class AttributesUpdate(object):
+    """Report of the changes requested by :py:meth:`Bios.apply_attributes`"""
+
+    def __init__(self, changed, pending, unchanged):
+        self._changed = changed
+        self._pending = pending
+        self._unchanged = unchanged
+
+    @property
+    def changed(self):
+        """Dict of the requested attributes and their current and new values
+
+        Values are ``(current, new)`` tuples, the current value is None for
+        attributes missing from the current attributes.
+        """
+        return self._changed
+
+    @property
+    def pending(self):
+        """Dict of the attributes already pending with the desired values"""
+        return self._pending
+
+    @property
+    def unchanged(self):
+        """List of the attributes already having the desired values"""
+        return self._unchanged
+
+    @property
+    def requested(self):
+        """Whether an update has been requested"""
+        return bool(self._changed)
+
+    def __repr__(self):
+        return ('<AttributesUpdate changed=%s pending=%s unchanged=%s>'
+                % (sorted(self._changed), sorted(self._pending),
+                   len(self._unchanged)))
+
 
 class ActionsField(base.CompositeField):
     change_password = common.ActionField('#Bios.ChangePassword')
@@ -103,7 +143,7 @@ class Bios(base.ResourceBase):
 
     def set_attribute(self, key, value, apply_time=None,
                       maint_window_start_time=None,
-                      maint_window_duration=None):
+                      maint_window_duration=None, validate=False):
         """Update an attribute
 
         Attribute update is not immediate but requires system restart.
@@ -121,13 +161,16 @@ class Bios(base.ResourceBase):
             maintenance window start time in seconds. Required when updating
             during maintenance window and default maintenance window not
             set by the system.
+        :param validate: Whether to check the value against the attribute
+            registry first, see :py:func:`~validate_attributes`.
+        :raises: InvalidAttributesError if validated and invalid.
         """
         self.set_attributes({key: value}, apply_time, maint_window_start_time,
-                            maint_window_duration)
+                            maint_window_duration, validate=validate)
 
     def set_attributes(self, value, apply_time=None,
                        maint_window_start_time=None,
-                       maint_window_duration=None):
+                       maint_window_duration=None, validate=False):
         """Update many attributes at once
 
         Attribute update is not immediate but requires system restart.
@@ -144,7 +187,13 @@ class Bios(base.ResourceBase):
             maintenance window start time in seconds. Required when updating
             during maintenance window and default maintenance window not
             set by the system.
+        :param validate: Whether to check the values against the attribute
+            registry first, see :py:func:`~validate_attributes`.
+        :raises: InvalidAttributesError if validated and invalid.
         """
+        if validate:
+            self.validate_attributes(value)
+
         payload = {'Attributes': value}
         payload = utils.process_apply_time_input(
             payload, apply_time, maint_window_start_time,
@@ -158,6 +207,75 @@ class Bios(base.ResourceBase):
         utils.cache_clear(self, force_refresh=False,
                           only_these=['_pending_settings_resource'])
 
+    def apply_attributes(self, value, apply_time=None,
+                         maint_window_start_time=None,
+                         maint_window_duration=None, validate=False):
+        """Update the attributes differing from the desired ones
+
+        Compares the desired attributes with the current and the pending
+        ones and only requests an update of the differences, if any.
+        Attributes already pending with the desired value are not requested
+        again, attributes with the desired current value but a different
+        pending one are requested to revert the pending change.
+
+        :param value: Key-value pairs for attribute name and desired value,
+            e.g. a complete BIOS profile.
+        :param apply_time: When to update the attributes. Optional.
+            An :py:class:`sushy.ApplyTime` value.
+        :param maint_window_start_time: The start time of a maintenance window,
+            datetime. Required when updating during maintenance window and
+            default maintenance window not set by the system.
+        :param maint_window_duration: Duration of maintenance time since
+            maintenance window start time in seconds. Required when updating
+            during maintenance window and default maintenance window not
+            set by the system.
+        :param validate: Whether to check the changed values against the
+            attribute registry first, see :py:func:`~validate_attributes`.
+        :raises: InvalidAttributesError if validated and invalid.
+        :returns: :class:`.AttributesUpdate` object describing the changes
+        """
+        self.refresh(force=False)
+        current = self.attributes or {}
+        # NOTE: some services report all attributes in the settings
+        # resource, thus only values differing from the current ones are
+        # pending changes.
+        pending = (self.pending_attributes or {}
+                   if self._settings is not None else {})
+
+        changed = {}
+        already_pending = {}
+        unchanged = []
+        for name, desired in value.items():
+            current_value = current.get(name, _MISSING)
+            pending_value = pending.get(name, _MISSING)
+            if (pending_value is not _MISSING
+                    and pending_value != current_value):
+                if pending_value == desired:
+                    already_pending[name] = desired
+                    continue
+            elif current_value == desired:
+                unchanged.append(name)
+                continue
+
+            changed[name] = (
+                None if current_value is _MISSING else current_value,
+                desired)
+
+        update = AttributesUpdate(changed, already_pending, unchanged)
+        if not changed:
+            LOG.debug('BIOS attributes %s are up to date, no update needed',
+                      self.identity)
+            return update
+
+        LOG.debug('Updating %(count)d BIOS attributes of %(bios)s: '
+                  '%(names)s', {'count': len(changed), 'bios': self.identity,
+                                'names': ', '.join(sorted(changed))})
+        self.set_attributes({name: new for name, (_old, new)
+                             in changed.items()},
+                            apply_time, maint_window_start_time,
+                            maint_window_duration, validate=validate)
+        return update
+
     def _get_reset_bios_action_element(self):
         actions = self._actions
 
@@ -242,3 +360,25 @@ class Bios(base.ResourceBase):
         return self._get_registry(self._attribute_registry,
                                   language=language,
                                   description='BIOS attribute registry')
+
+    def validate_attributes(self, value, language='en'):
+        """Check attribute values against the Attribute Registry
+
+        All values are checked at once, without contacting the service
+        except for loading the registry if needed.
+
+        :param value: Key-value pairs for attribute name and value
+        :param language: RFC 5646 language code of the registry to use.
+            Defaults to 'en'.
+        :raises: MissingAttributeError if the registry is not available.
+        :raises: InvalidAttributesError listing all invalid values.
+        """
+        registry = self.get_attribute_registry(language=language)
+        if registry is None:
+            raise exceptions.MissingAttributeError(
+                attribute='AttributeRegistry', resource=self._path)
+
+        errors = registry.validate_attributes(value)
+        if errors:
+            raise exceptions.InvalidAttributesError(resource=self._path,
+                                                    errors=errors)
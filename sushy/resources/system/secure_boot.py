@@ -147,3 +147,4 @@ class SecureBoot(base.ResourceBase):
         etag = self._get_etag()
         self._conn.patch(self.path, data={'SecureBootEnable': enabled},
                          etag=etag)
+        self.invalidate()
@@ -362,6 +362,8 @@ class System(base.ResourceBase):
             path = self.path
             self._conn.patch(path, data=data, etag=etag)
 
+        self.invalidate()
+
     # TODO(etingof): we should remove this method, eventually
     def set_system_boot_source(
             self, target, enabled=sys_cons.BootSourceOverrideEnabled.ONCE,
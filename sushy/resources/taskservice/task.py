@@ -86,8 +86,7 @@ class Task(base.ResourceBase):
 
     def parse_messages(self):
         """Parses the messages"""
-        for m in self.messages:
-            message_registry.parse_message(self._registries, m)
+        message_registry.parse_messages(self._registries, self.messages)
 
 
 class TaskCollection(base.ResourceCollectionBase):
@@ -0,0 +1,260 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Stores of Redfish session tokens reused by `sushy.auth.SessionAuth`."""
+
+import abc
+import hashlib
+import hmac
+import json
+import logging
+import os
+import secrets
+import tempfile
+import threading
+import time
+
+LOG = logging.getLogger(__name__)
+
+
+def get_session_key(base_url, username, password):
+    """Get the key of the session of a user on a Redfish service.
+
+    The password is only part of the key in a hashed form, so that
+    a session is never reused with different credentials.
+
+    :param base_url: The base URL of the Redfish service.
+    :param username: User account name.
+    :param password: User account password.
+    :returns: tuple of strings.
+    """
+    digest = hashlib.sha256((password or '').encode('utf-8')).hexdigest()
+    return (base_url or '', username or '', digest)
+
+
+class SessionStore(object, metaclass=abc.ABCMeta):
+    """Base class of the session token stores.
+
+    Stored sessions may have expired or been deleted on the service, they
+    are validated by using them.
+    """
+
+    def __init__(self, max_age=None):
+        """Create the store.
+
+        :param max_age: Number of seconds after which a stored session is
+            not reused anymore. Defaults to None, in which case sessions are
+            reused until the service rejects them.
+        """
+        self._max_age = max_age
+
+    def _is_expired(self, created_at):
+        return (self._max_age is not None
+                and time.time() - created_at > self._max_age)
+
+    @abc.abstractmethod
+    def get(self, key):
+        """Get a stored session.
+
+        :param key: tuple of strings identifying the session, see
+            `get_session_key`.
+        :returns: tuple of the session token and the session URI, or None
+            if no session is stored.
+        """
+
+    @abc.abstractmethod
+    def put(self, key, token, session_uri):
+        """Store a session.
+
+        :param key: tuple of strings identifying the session.
+        :param token: the X-Auth-Token of the session.
+        :param session_uri: the URI of the session resource.
+        """
+
+    @abc.abstractmethod
+    def delete(self, key, token=None):
+        """Remove a stored session.
+
+        :param key: tuple of strings identifying the session.
+        :param token: only remove the session if it has this token, so that
+            a session stored meanwhile by someone else is kept.
+        """
+
+
+class MemorySessionStore(SessionStore):
+    """Session store sharing sessions within the process."""
+
+    def __init__(self, max_age=None):
+        super(MemorySessionStore, self).__init__(max_age=max_age)
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._sessions.get(tuple(key))
+        if entry is None or self._is_expired(entry[2]):
+            return None
+        return entry[0], entry[1]
+
+    def put(self, key, token, session_uri):
+        with self._lock:
+            self._sessions[tuple(key)] = (token, session_uri, time.time())
+
+    def delete(self, key, token=None):
+        with self._lock:
+            entry = self._sessions.get(tuple(key))
+            if entry is not None and token in (None, entry[0]):
+                del self._sessions[tuple(key)]
+
+
+class FileSessionStore(SessionStore):
+    """Session store sharing sessions between processes.
+
+    Every session is stored in a separate JSON file, readable only by the
+    owner, named after an HMAC of its key with a random secret of the store.
+    The key itself, derived from the credentials, is not stored. Files are
+    replaced atomically, so the same directory can be shared by several
+    processes.
+
+    Failures to read or write the store are logged and otherwise ignored.
+    """
+
+    _SECRET_FILE = '.secret'
+
+    def __init__(self, directory, max_age=None):
+        """Create the store.
+
+        :param directory: directory to store the sessions in. It is created
+            on first write if missing, accessible only by the owner.
+        :param max_age: Number of seconds after which a stored session is
+            not reused anymore, see `SessionStore`.
+        """
+        super(FileSessionStore, self).__init__(max_age=max_age)
+        self._directory = directory
+        self._secret = None
+
+    @property
+    def directory(self):
+        return self._directory
+
+    def _get_secret(self, create=False):
+        """Get the secret of the store.
+
+        :param create: whether to create the secret if it does not exist.
+        :raises: OSError if the secret cannot be read or created.
+        :returns: the secret as bytes or None if it does not exist.
+        """
+        if self._secret is not None:
+            return self._secret
+
+        secret_path = os.path.join(self._directory, self._SECRET_FILE)
+        try:
+            with open(secret_path, encoding='utf-8') as fp:
+                secret = fp.read().strip()
+        except FileNotFoundError:
+            if not create:
+                return None
+            os.makedirs(self._directory, mode=0o700, exist_ok=True)
+            secret = secrets.token_hex(32)
+            try:
+                fd = os.open(secret_path,
+                             os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            except FileExistsError:
+                # NOTE: created meanwhile by another process
+                return self._get_secret()
+            with os.fdopen(fd, 'w', encoding='utf-8') as fp:
+                fp.write(secret)
+
+        if not secret:
+            raise OSError('the secret of the store %s is empty' % secret_path)
+        self._secret = secret.encode('utf-8')
+        return self._secret
+
+    def _get_file_path(self, key, create=False):
+        secret = self._get_secret(create=create)
+        if secret is None:
+            return None
+        digest = hmac.new(secret, json.dumps(list(key)).encode('utf-8'),
+                          hashlib.sha256).hexdigest()
+        return os.path.join(self._directory, digest + '.json')
+
+    def _read(self, key):
+        file_path = None
+        try:
+            file_path = self._get_file_path(key)
+            if file_path is None:
+                return None
+            with open(file_path, encoding='utf-8') as fp:
+                entry = json.load(fp)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            LOG.warning('Cannot read stored session %(file)s: %(error)s',
+                        {'file': file_path or self._directory,
+                         'error': exc})
+            return None
+
+        if not isinstance(entry, dict) or not entry.get('token'):
+            LOG.warning('Ignoring invalid stored session %(file)s',
+                        {'file': file_path})
+            return None
+
+        return entry
+
+    def get(self, key):
+        entry = self._read(key)
+        if entry is None or self._is_expired(entry.get('created_at', 0)):
+            return None
+        return entry['token'], entry.get('session_uri')
+
+    def put(self, key, token, session_uri):
+        entry = {'token': token, 'session_uri': session_uri,
+                 'created_at': time.time()}
+        file_path = None
+        tmp_path = None
+        try:
+            file_path = self._get_file_path(key, create=True)
+            # NOTE: mkstemp creates the file readable only by the owner
+            fd, tmp_path = tempfile.mkstemp(dir=self._directory,
+                                            suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as fp:
+                json.dump(entry, fp)
+            os.replace(tmp_path, file_path)
+            tmp_path = None
+        except (OSError, TypeError, ValueError) as exc:
+            LOG.warning('Cannot store session in %(file)s: %(error)s',
+                        {'file': file_path or self._directory,
+                         'error': exc})
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def delete(self, key, token=None):
+        if token is not None:
+            entry = self._read(key)
+            if entry is None or entry['token'] != token:
+                return
+
+        file_path = None
+        try:
+            file_path = self._get_file_path(key)
+            if file_path is not None:
+                os.unlink(file_path)
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            LOG.warning('Cannot remove stored session %(file)s: %(error)s',
+                        {'file': file_path or self._directory,
+                         'error': exc})
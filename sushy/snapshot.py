@@ -0,0 +1,294 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Snapshots of Redfish resource trees restorable without a service."""
+
+import collections
+import gzip
+import json
+import logging
+import time
+from urllib import parse as urlparse
+
+from sushy import auth as sushy_auth
+from sushy import exceptions
+from sushy import main
+from sushy.resources import base
+from sushy.resources.registry import message_registry_file
+
+LOG = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+_READ_ONLY_ERROR = 'the resources are restored from a snapshot'
+
+
+def _normalize_path(path):
+    parsed = urlparse.urlparse(path)
+    return (parsed.path or '/').rstrip('/') or '/'
+
+
+def _get_cached_properties(cls):
+    """Get the names of the properties of a class cached with cache_it."""
+    names = []
+    for name in dir(cls):
+        value = getattr(cls, name, None)
+        if (isinstance(value, property)
+                and getattr(value.fget, 'cached_resource_accessor', False)):
+            names.append(name)
+    return names
+
+
+def _iter_resources(value):
+    if isinstance(value, base.ResourceBase):
+        yield value
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            if isinstance(item, base.ResourceBase):
+                yield item
+
+
+class Snapshot(object):
+    """JSON documents of a Redfish resource tree."""
+
+    def __init__(self, documents, base_url=None, root_prefix='/redfish/v1/',
+                 created_at=None):
+        """Create the snapshot.
+
+        :param documents: dict of the resource paths and their parsed JSON
+            documents.
+        :param base_url: The base URL of the Redfish service.
+        :param root_prefix: The URL prefix of the service root.
+        :param created_at: Time the documents were taken at, in seconds since
+            the epoch. Defaults to now.
+        """
+        self._documents = {_normalize_path(path): doc
+                           for path, doc in documents.items()}
+        self._base_url = base_url
+        self._root_prefix = root_prefix
+        self._created_at = time.time() if created_at is None else created_at
+
+    @property
+    def documents(self):
+        """Dict of the resource paths and their JSON documents"""
+        return self._documents
+
+    @property
+    def base_url(self):
+        """The base URL of the Redfish service"""
+        return self._base_url
+
+    @property
+    def root_prefix(self):
+        """The URL prefix of the service root"""
+        return self._root_prefix
+
+    @property
+    def created_at(self):
+        """Time the snapshot was taken at, in seconds since the epoch"""
+        return self._created_at
+
+    def get_document(self, path):
+        """Get the document of a resource.
+
+        :param path: path or URL of the resource.
+        :returns: the parsed JSON document or None if not in the snapshot.
+        """
+        return self._documents.get(_normalize_path(path))
+
+    def dump(self, path):
+        """Write the snapshot to a gzip-compressed JSON file.
+
+        :param path: the file to write.
+        """
+        content = {'version': FORMAT_VERSION, 'base_url': self._base_url,
+                   'root_prefix': self._root_prefix,
+                   'created_at': self._created_at,
+                   'documents': self._documents}
+        with gzip.open(path, 'wt', encoding='utf-8') as fp:
+            json.dump(content, fp, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path):
+        """Read a snapshot written by `dump`.
+
+        :param path: the file to read.
+        :raises: ValueError if the file is not a supported snapshot.
+        :returns: the `Snapshot`.
+        """
+        with gzip.open(path, 'rt', encoding='utf-8') as fp:
+            content = json.load(fp)
+
+        if (not isinstance(content, dict)
+                or content.get('version') != FORMAT_VERSION
+                or not isinstance(content.get('documents'), dict)):
+            raise ValueError('%s is not a supported snapshot' % path)
+
+        return cls(content['documents'], base_url=content.get('base_url'),
+                   root_prefix=content.get('root_prefix', '/redfish/v1/'),
+                   created_at=content.get('created_at'))
+
+    def restore(self, **kwargs):
+        """Create a Sushy object serving the resources of the snapshot.
+
+        No request is sent to the service: resources are loaded from the
+        snapshot, resources missing from it are not found, and any
+        modification raises ConnectionError.
+
+        :param kwargs: Other arguments of `sushy.Sushy`, e.g. ``language``.
+        :returns: the `sushy.Sushy` object.
+        """
+        connector = SnapshotConnector(self)
+        return main.Sushy(self._base_url or 'http://snapshot',
+                          root_prefix=self._root_prefix,
+                          auth=_SnapshotAuth(), connector=connector,
+                          public_connector=connector, **kwargs)
+
+
+class _SnapshotResponse(object):
+
+    def __init__(self, status_code, json_doc):
+        self.status_code = status_code
+        self.headers = {}
+        self.content = json.dumps(json_doc).encode('utf-8')
+        self._json_doc = json_doc
+
+    def json(self):
+        return self._json_doc
+
+
+class SnapshotConnector(object):
+    """Connector serving GET requests from a `Snapshot`."""
+
+    def __init__(self, snapshot):
+        self._snapshot = snapshot
+        self._url = snapshot.base_url
+
+    def get(self, path='', data=None, headers=None, blocking=False,
+            timeout=60, **extra_session_req_kwargs):
+        """Get a resource document from the snapshot.
+
+        :param path: path or URL of the resource, a query is ignored.
+        :raises: ResourceNotFoundError if the resource is not in the snapshot.
+        :returns: a response-like object.
+        """
+        path = path.split('?', 1)[0]
+        json_doc = self._snapshot.get_document(path)
+        if json_doc is None:
+            raise exceptions.ResourceNotFoundError(
+                'GET', path, _SnapshotResponse(404, {'error': {
+                    'code': 'Base.1.0.ResourceMissingAtURI',
+                    'message': 'The resource is not in the snapshot'}}))
+        return _SnapshotResponse(200, json_doc)
+
+    def _read_only(self, path='', *args, **kwargs):
+        raise exceptions.ConnectionError(url=path, error=_READ_ONLY_ERROR)
+
+    post = patch = put = delete = _read_only
+
+    def set_auth(self, auth):
+        pass
+
+    def close(self):
+        pass
+
+
+class _SnapshotAuth(sushy_auth.AuthBase):
+
+    def _do_authenticate(self):
+        pass
+
+    def can_refresh_session(self):
+        return False
+
+
+def create_snapshot(root, resources=None):
+    """Take a snapshot of the resource tree of a Redfish service.
+
+    Systems, chassis, managers, registry files and, recursively, all their
+    sub-resources cached with `sushy.utils.cache_it` are loaded, unless
+    already loaded, and their documents are collected. Sub-resources which
+    are missing or cannot be loaded are skipped. Of the registries provided
+    by the service, those served by the service itself are included; the
+    others are replaced by the standard registries when restored.
+
+    :param root: the `sushy.Sushy` object.
+    :param resources: other resources to include along with their
+        sub-resources, e.g. the update service.
+    :returns: the `Snapshot`.
+    """
+    pending = collections.deque([root])
+    for getter in (root.get_system_collection, root.get_chassis_collection,
+                   root.get_manager_collection, root._get_registry_collection):
+        try:
+            collection = getter()
+        except exceptions.SushyError as exc:
+            LOG.debug('Skipping a collection of %(root)s in the snapshot: '
+                      '%(error)s', {'root': root.path, 'error': exc})
+        else:
+            if collection is not None:
+                pending.append(collection)
+    pending.extend(resources or ())
+
+    documents = {}
+    properties = {}
+    registry_uris = []
+    while pending:
+        resource = pending.popleft()
+        path = _normalize_path(resource.path)
+        if path in documents or resource.json is None:
+            continue
+        documents[path] = resource.json
+        if resource is root:
+            continue
+
+        if isinstance(resource, message_registry_file.MessageRegistryFile):
+            registry_uris.extend(location.uri
+                                 for location in resource.location or ()
+                                 if location.uri)
+
+        children = []
+        if isinstance(resource, base.ResourceCollectionBase):
+            # NOTE: members are loaded one by one, so that a missing member
+            # does not prevent taking the others.
+            for identity in resource.members_identities:
+                children.append(
+                    lambda identity=identity: resource.get_member(identity))
+
+        cls = type(resource)
+        if cls not in properties:
+            properties[cls] = _get_cached_properties(cls)
+        for name in properties[cls]:
+            children.append(lambda name=name: getattr(resource, name))
+
+        for get_children in children:
+            try:
+                pending.extend(_iter_resources(get_children()))
+            except exceptions.SushyError as exc:
+                LOG.debug('Skipping a sub-resource of %(path)s in the '
+                          'snapshot: %(error)s', {'path': path, 'error': exc})
+
+    for uri in registry_uris:
+        path = _normalize_path(uri)
+        if path in documents:
+            continue
+        try:
+            documents[path] = root._conn.get(path=uri).json()
+        except (exceptions.SushyError, ValueError) as exc:
+            LOG.debug('Skipping the registry %(path)s in the snapshot: '
+                      '%(error)s', {'path': path, 'error': exc})
+
+    LOG.debug('Took a snapshot of %(count)d resources of %(root)s',
+              {'count': len(documents), 'root': root.path})
+    return Snapshot(documents,
+                    base_url=getattr(root, '_base_url', None),
+                    root_prefix=getattr(root, '_root_prefix', '/redfish/v1/'))
@@ -13,9 +13,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent import futures
 from datetime import datetime
+import heapq
 from http import client as http_client
+import itertools
 import logging
+import random
+import threading
 import time
 from urllib.parse import urljoin
 
@@ -26,6 +31,11 @@ from sushy.resources.taskservice import task
 
 LOG = logging.getLogger(__name__)
 
+# Keys of TaskEvent registry messages reported when a task is over.
+_TASK_END_MESSAGES = frozenset(['TaskCompletedOK', 'TaskCompletedWarning',
+                                'TaskAborted', 'TaskCancelled',
+                                'TaskRemoved'])
+
 
 class TaskMonitor(object):
     def __init__(self,
@@ -50,6 +60,8 @@ class TaskMonitor(object):
         self._registries = registries
         self._task = None
         self._response = response
+        self._retry_after = (None, None)
+        self._task_ended = threading.Event()
 
         if (self._response and self._response.content
                 and self._response.status_code == http_client.ACCEPTED):
@@ -116,6 +128,29 @@ class TaskMonitor(object):
 
         return self.is_processing
 
+    def _parse_retry_after(self):
+        """Parse the Retry-After header of the last response
+
+        The parsed value is cached for as long as the header does not change.
+
+        :returns: The number of seconds to wait, an absolute datetime or None
+            if Retry-After is not specified.
+        """
+        retry_after = self._response.headers.get('Retry-After')
+        cached, parsed = self._retry_after
+        if retry_after == cached:
+            return parsed
+
+        if retry_after is None:
+            parsed = None
+        elif isinstance(retry_after, int) or retry_after.isdigit():
+            parsed = int(retry_after)
+        else:
+            parsed = parser.parse(retry_after)
+
+        self._retry_after = (retry_after, parsed)
+        return parsed
+
     @property
     def sleep_for(self):
         """Seconds the client should wait before querying the operation status
@@ -124,15 +159,27 @@ class TaskMonitor(object):
 
         :returns: The number of seconds to wait
         """
-        retry_after = self._response.headers.get('Retry-After')
+        retry_after = self._parse_retry_after()
         if retry_after is None:
             return 1
 
-        if isinstance(retry_after, int) or retry_after.isdigit():
+        if isinstance(retry_after, int):
             return retry_after
 
-        return max(0, (parser.parse(retry_after)
-                   - datetime.now().astimezone()).total_seconds())
+        return max(0, (retry_after
+                       - datetime.now().astimezone()).total_seconds())
+
+    @property
+    def retry_after(self):
+        """Seconds the service asked to wait before querying the status
+
+        :returns: The number of seconds to wait or None if the service
+            did not specify it with Retry-After.
+        """
+        if self._parse_retry_after() is None:
+            return None
+
+        return float(self.sleep_for)
 
     @property
     def cancellable(self):
@@ -175,28 +222,89 @@ class TaskMonitor(object):
                          redfish_version=self._redfish_version,
                          registries=self._registries)
 
-    def wait(self, timeout_sec):
+    def handle_event(self, event):
+        """Handle an event delivered by the EventService
+
+        Events telling that the task is over wake up `wait`, which then
+        checks the task monitor. Use it to feed the events received by an
+        event subscription or from `EventService.iter_server_sent_events`.
+
+        :param event: Event document, either with a list of event records
+            in Events or a single event record.
+        :returns: True if the event tells that the task is over.
+        """
+        records = event.get('Events') if isinstance(event, dict) else None
+        if records is None:
+            records = [event]
+
+        for record in records:
+            if not isinstance(record, dict):
+                continue
+
+            message_id = record.get('MessageId') or ''
+            if message_id.rsplit('.', 1)[-1] not in _TASK_END_MESSAGES:
+                continue
+
+            if self._is_own_event(record):
+                LOG.debug('Task monitor %(url)s got event %(message)s',
+                          {'url': self.task_monitor_uri,
+                           'message': message_id})
+                self._task_ended.set()
+                return True
+
+        return False
+
+    def _is_own_event(self, record):
+        origin = record.get('OriginOfCondition')
+        if isinstance(origin, dict):
+            origin = origin.get('@odata.id')
+        origin = (origin or '').rstrip('/')
+        if origin and origin == self.task_monitor_uri.rstrip('/'):
+            return True
+
+        identity = self._task.identity if self._task is not None else None
+        if not identity:
+            return False
+
+        args = record.get('MessageArgs') or []
+        return (origin.endswith('/' + identity)
+                or (not origin and identity in args))
+
+    def wait(self, timeout_sec, poll=True):
         """Waits until task is completed or it times out.
 
         :param timeout_sec: Timeout to wait
+        :param poll: Whether to poll the task monitor. If False, the task
+            monitor is only queried again when `handle_event` gets an event
+            telling that the task is over, and when the timeout expires.
         :raises: ConnectionError when times out
         """
         timeout_at = time.time() + timeout_sec
 
         while self.check_is_processing:
-
-            LOG.debug('Waiting for task monitor %(url)s; sleeping for '
-                      '%(sleep)s seconds',
-                      {'url': self.task_monitor_uri,
-                       'sleep': self.sleep_for})
-            time.sleep(self.sleep_for)
-            if time.time() >= timeout_at and self.check_is_processing:
-                m = ('Timeout waiting for task monitor %(url)s '
-                     '(timeout = %(timeout)s)'
-                     % {'url': self.task_monitor_uri,
-                        'timeout': timeout_sec})
-                raise exceptions.ConnectionError(url=self.task_monitor_uri,
-                                                 error=m)
+            remaining = timeout_at - time.time()
+            if remaining <= 0:
+                raise self._timeout_error(timeout_sec)
+
+            if poll:
+                sleep = min(self.sleep_for, remaining)
+                LOG.debug('Waiting for task monitor %(url)s; sleeping for '
+                          '%(sleep)s seconds',
+                          {'url': self.task_monitor_uri, 'sleep': sleep})
+                time.sleep(sleep)
+            else:
+                LOG.debug('Waiting for an event of task monitor %(url)s for '
+                          'up to %(sleep)s seconds',
+                          {'url': self.task_monitor_uri, 'sleep': remaining})
+                self._task_ended.wait(remaining)
+                self._task_ended.clear()
+
+    def _timeout_error(self, timeout_sec):
+        m = ('Timeout waiting for task monitor %(url)s '
+             '(timeout = %(timeout)s)'
+             % {'url': self.task_monitor_uri,
+                'timeout': timeout_sec})
+        return exceptions.ConnectionError(url=self.task_monitor_uri, error=m)
 
     @staticmethod
     def from_response(conn, response, target_uri, redfish_version=None,
@@ -228,3 +336,190 @@ class TaskMonitor(object):
                            redfish_version=redfish_version,
                            registries=registries,
                            response=response)
+
+
+class _PollEntry(object):
+
+    __slots__ = ('monitor', 'future', 'timeout_sec', 'deadline', 'attempt')
+
+    def __init__(self, monitor, future, timeout_sec):
+        self.monitor = monitor
+        self.future = future
+        self.timeout_sec = timeout_sec
+        self.deadline = (time.monotonic() + timeout_sec
+                         if timeout_sec is not None else None)
+        self.attempt = 0
+
+
+class TaskPollScheduler(object):
+    """Waits for many task monitors using a few worker threads.
+
+    Instead of sleeping in `TaskMonitor.wait` in a thread per task, task
+    monitors are submitted to the scheduler which polls each of them when
+    it is due. The service's Retry-After is honoured; without it, the poll
+    interval grows exponentially. A random jitter is added to every
+    interval so that tasks started together are not polled together.
+    """
+
+    def __init__(self, max_workers=4, min_interval=1, max_interval=30,
+                 backoff_factor=2, jitter=0.1):
+        """Create the scheduler.
+
+        :param max_workers: maximum number of task monitors polled
+            concurrently.
+        :param min_interval: seconds between the first polls of a task
+            without Retry-After.
+        :param max_interval: maximum seconds between polls of a task without
+            Retry-After.
+        :param backoff_factor: factor to grow the interval by after every
+            poll of a task without Retry-After.
+        :param jitter: maximum fraction of the interval added at random.
+        """
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='sushy-task-poll')
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._backoff_factor = backoff_factor
+        self._jitter = jitter
+        self._queue = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._shutdown = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    def submit(self, monitor, timeout_sec=None):
+        """Wait for a task monitor in the background.
+
+        The task monitor must not be used elsewhere until the returned future
+        is done.
+
+        :param monitor: TaskMonitor to wait for.
+        :param timeout_sec: timeout to wait, None to wait forever.
+        :returns: a `concurrent.futures.Future` resolving to the task
+            monitor once the task is completed. If the timeout expires,
+            ConnectionError is set as the exception of the future, same as
+            `TaskMonitor.wait` raises. Use `add_done_callback` on the future
+            to get notified of completion.
+        :raises: RuntimeError if the scheduler has been shut down.
+        """
+        entry = _PollEntry(monitor, futures.Future(), timeout_sec)
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError('Cannot submit task monitors after '
+                                   'shutdown')
+
+            self._schedule(entry, 0)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name='sushy-task-poll-scheduler',
+                    daemon=True)
+                self._thread.start()
+
+        return entry.future
+
+    def shutdown(self, wait=True):
+        """Stop polling.
+
+        Futures of the task monitors which are still waited for are
+        cancelled.
+
+        :param wait: whether to wait for the polls in progress to finish.
+        """
+        with self._condition:
+            self._shutdown = True
+            pending, self._queue = self._queue, []
+            self._condition.notify_all()
+            thread = self._thread
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        for _due, _count, entry in pending:
+            entry.future.cancel()
+        self._executor.shutdown(wait=wait)
+
+    def _schedule(self, entry, delay):
+        # NOTE: must be called with the condition held
+        if self._shutdown:
+            entry.future.cancel()
+            return
+
+        heapq.heappush(self._queue, (time.monotonic() + delay,
+                                     next(self._counter), entry))
+        self._condition.notify()
+
+    def _run(self):
+        with self._condition:
+            while not self._shutdown:
+                if not self._queue:
+                    self._condition.wait()
+                    continue
+
+                delay = self._queue[0][0] - time.monotonic()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    continue
+
+                _due, _count, entry = heapq.heappop(self._queue)
+                if not entry.future.cancelled():
+                    self._executor.submit(self._poll, entry)
+
+    def _get_interval(self, entry):
+        retry_after = entry.monitor.retry_after
+        if retry_after is not None:
+            interval = retry_after
+        else:
+            interval = min(self._max_interval,
+                           self._min_interval
+                           * self._backoff_factor ** entry.attempt)
+        return interval * (1 + random.uniform(0, self._jitter))
+
+    @staticmethod
+    def _resolve(future, result=None, exception=None):
+        # NOTE: the future stays pending while polling, so that it can be
+        # cancelled by the caller at any time, including right now.
+        try:
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(result)
+        except futures.InvalidStateError:
+            pass
+
+    def _poll(self, entry):
+        if entry.future.cancelled():
+            return
+
+        try:
+            processing = entry.monitor.check_is_processing
+            if processing:
+                interval = self._get_interval(entry)
+        except Exception as exc:
+            self._resolve(entry.future, exception=exc)
+            return
+
+        if not processing:
+            self._resolve(entry.future, entry.monitor)
+            return
+
+        now = time.monotonic()
+        if entry.deadline is not None:
+            if now >= entry.deadline:
+                self._resolve(
+                    entry.future,
+                    exception=entry.monitor._timeout_error(entry.timeout_sec))
+                return
+            interval = min(interval, entry.deadline - now)
+
+        LOG.debug('Task monitor %(url)s is still processing; polling again '
+                  'in %(interval).1f seconds',
+                  {'url': entry.monitor.task_monitor_uri,
+                   'interval': interval})
+        entry.attempt += 1
+        with self._condition:
+            self._schedule(entry, interval)
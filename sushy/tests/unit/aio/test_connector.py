@@ -0,0 +1,182 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import asyncio
+import json
+from unittest import mock
+
+import aiohttp
+
+from sushy.aio import connector
+from sushy import exceptions
+from sushy.tests.unit import base
+
+
+class FakeClientResponse(object):
+
+    def __init__(self, status, body=None, headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self._content = (json.dumps(body).encode('utf-8')
+                         if body is not None else b'')
+
+    async def read(self):
+        return self._content
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_args):
+        pass
+
+
+class ResponseTestCase(base.TestCase):
+
+    def test_json(self):
+        response = connector.Response(200, {'ETag': '"1"'}, b'{"a": 1}',
+                                      'http://foo')
+        self.assertEqual({'a': 1}, response.json())
+        self.assertEqual('"1"', response.headers['etag'])
+
+    def test_json_invalid(self):
+        response = connector.Response(500, None, b'', 'http://foo')
+        self.assertRaises(ValueError, response.json)
+
+
+class ConnectorOpTestCase(base.TestCase):
+
+    def setUp(self):
+        super(ConnectorOpTestCase, self).setUp()
+        self.conn = connector.Connector('http://foo.bar:1234', verify=True,
+                                        server_side_retries=2)
+        self.session = mock.Mock(closed=False)
+        self.conn._session = self.session
+
+    def _op(self, *args, **kwargs):
+        return asyncio.run(self.conn._op(*args, **kwargs))
+
+    def test_ok_get(self):
+        self.session.request.return_value = FakeClientResponse(
+            200, {'Id': '1'})
+
+        response = self._op('GET', path='fake/path')
+
+        self.assertEqual({'Id': '1'}, response.json())
+        self.session.request.assert_called_once_with(
+            'GET', 'http://foo.bar:1234/fake/path', json=None,
+            headers={'OData-Version': '4.0', 'Accept-Encoding': 'identity'},
+            timeout=mock.ANY)
+
+    def test_ok_post_with_session_auth(self):
+        self.conn.set_http_session_auth('token')
+        self.session.request.return_value = FakeClientResponse(201)
+
+        self._op('POST', path='fake/path', data={'a': 'b'})
+
+        self.session.request.assert_called_once_with(
+            'POST', 'http://foo.bar:1234/fake/path', json={'a': 'b'},
+            headers={'OData-Version': '4.0', 'Accept-Encoding': 'identity',
+                     'Content-Type': 'application/json',
+                     'X-Auth-Token': 'token'},
+            timeout=mock.ANY)
+
+    def test_basic_auth(self):
+        self.conn.set_http_basic_auth('user', 'pass')
+        self.session.request.return_value = FakeClientResponse(200)
+
+        self._op('GET')
+
+        self.assertEqual(
+            'Basic dXNlcjpwYXNz',
+            self.session.request.call_args[1]['headers']['Authorization'])
+
+    def test_connection_error(self):
+        self.session.request.side_effect = aiohttp.ClientConnectionError(
+            'boom')
+
+        self.assertRaises(exceptions.ConnectionError, self._op, 'GET')
+
+    def test_not_found(self):
+        self.session.request.return_value = FakeClientResponse(
+            404, {'error': {'message': 'not here'}})
+
+        self.assertRaises(exceptions.ResourceNotFoundError, self._op, 'GET')
+
+    @mock.patch.object(connector.asyncio, 'sleep', autospec=True)
+    def test_server_side_error_retried(self, mock_sleep):
+        self.session.request.side_effect = [
+            FakeClientResponse(500), FakeClientResponse(200, {})]
+
+        response = self._op('GET', path='fake/path')
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(2, self.session.request.call_count)
+        mock_sleep.assert_called_once_with(0)
+
+    @mock.patch.object(connector.asyncio, 'sleep', autospec=True)
+    def test_server_side_error_retries_exhausted(self, mock_sleep):
+        self.session.request.side_effect = lambda *a, **kw: (
+            FakeClientResponse(500))
+
+        self.assertRaises(exceptions.ServerSideError, self._op, 'GET')
+        self.assertEqual(3, self.session.request.call_count)
+
+    def test_access_error_refreshes_session(self):
+        auth = mock.Mock()
+        auth.can_refresh_session.return_value = True
+
+        async def refresh():
+            self.conn.set_http_session_auth('new-token')
+
+        auth.refresh_session.side_effect = refresh
+        self.conn.set_auth(auth)
+        self.conn.set_http_session_auth('old-token')
+        self.session.request.side_effect = [
+            FakeClientResponse(401), FakeClientResponse(200, {})]
+
+        response = self._op('GET', path='fake/path')
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(
+            'new-token',
+            self.session.request.call_args[1]['headers']['X-Auth-Token'])
+
+    def test_access_error_no_auth(self):
+        self.session.request.return_value = FakeClientResponse(403)
+
+        self.assertRaises(exceptions.AccessError, self._op, 'GET')
+
+    def test_not_acceptable_retried_without_identity(self):
+        self.session.request.side_effect = [
+            FakeClientResponse(406), FakeClientResponse(200, {})]
+
+        self._op('GET', path='fake/path')
+
+        self.assertNotIn(
+            'Accept-Encoding',
+            self.session.request.call_args[1]['headers'])
+
+    def test_patch_etag(self):
+        self.session.request.return_value = FakeClientResponse(204)
+
+        asyncio.run(self.conn.patch('fake/path', data={}, etag='"12"'))
+
+        self.assertEqual(
+            '"12"', self.session.request.call_args[1]['headers']['If-Match'])
+
+    def test_close(self):
+        self.session.close = mock.AsyncMock()
+
+        asyncio.run(self.conn.close())
+
+        self.session.close.assert_awaited_once_with()
+        self.assertIsNone(self.conn._session)
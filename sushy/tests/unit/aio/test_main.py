@@ -0,0 +1,228 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import asyncio
+import json
+from unittest import mock
+
+from sushy.aio import auth
+from sushy.aio import base as aio_base
+from sushy.aio import connector
+from sushy.aio import main
+from sushy import exceptions
+from sushy.resources import constants as res_cons
+from sushy.resources.system import system
+from sushy.tests.unit import base
+
+
+def _load(name):
+    with open('sushy/tests/unit/json_samples/%s.json' % name) as f:
+        return json.load(f)
+
+
+class FakeConnector(object):
+    """Serves JSON samples keyed by path."""
+
+    def __init__(self, docs):
+        self.docs = docs
+        self.requested = []
+        self.closed = False
+
+    async def get(self, path='', **kwargs):
+        self.requested.append(path)
+        # Yield control so that concurrent requests interleave
+        await asyncio.sleep(0)
+        doc = self.docs[path.split('?', 1)[0]]
+        return connector.Response(200, {'ETag': '"%d"' % len(self.requested)},
+                                  json.dumps(doc).encode(), path)
+
+    async def close(self):
+        self.closed = True
+
+
+class AsyncSushyTestCase(base.TestCase):
+
+    def setUp(self):
+        super(AsyncSushyTestCase, self).setUp()
+        system_collection = _load('system_collection')
+        system_collection['Members'] = [
+            {'@odata.id': '/redfish/v1/Systems/%d' % i} for i in range(3)]
+        self.docs = {'/redfish/v1/': _load('root'),
+                     '/redfish/v1/Systems': system_collection}
+        for i in range(3):
+            doc = _load('system')
+            doc['Id'] = str(i)
+            self.docs['/redfish/v1/Systems/%d' % i] = doc
+        self.conn = FakeConnector(self.docs)
+        self.auth = mock.Mock(spec=auth.BasicAuth)
+        self.root = main.Sushy('http://foo.bar:1234', auth=self.auth,
+                               connector=self.conn)
+
+    def test_init_no_io(self):
+        self.assertEqual([], self.conn.requested)
+        self.assertTrue(self.root._is_stale)
+
+    def test_connect(self):
+        asyncio.run(self.root.connect())
+
+        self.assertEqual('RootService', self.root.identity)
+        self.assertEqual('1.0.2', self.root.redfish_version)
+        self.auth.set_context.assert_called_once_with(self.root, self.conn)
+        self.auth.authenticate.assert_awaited_once_with()
+
+    def test_context_manager(self):
+        async def _run():
+            async with self.root as root:
+                return root.identity
+
+        self.assertEqual('RootService', asyncio.run(_run()))
+        self.auth.close.assert_awaited_once_with()
+        self.assertTrue(self.conn.closed)
+
+    def test_get_members(self):
+        async def _run():
+            await self.root.connect()
+            systems = await self.root.get_system_collection()
+            return await systems.get_members()
+
+        members = asyncio.run(_run())
+
+        self.assertEqual(['0', '1', '2'], [m.identity for m in members])
+        for member in members:
+            self.assertIsInstance(member, system.System)
+            self.assertIsInstance(member, aio_base.ResourceMixin)
+            self.assertEqual('On', member.power_state.value)
+            self.assertIs(self.root, member.root)
+
+    def test_get_members_cached(self):
+        async def _run():
+            await self.root.connect()
+            systems = await self.root.get_system_collection()
+            first = await systems.get_members()
+            second = await systems.get_members()
+            return first, second
+
+        first, second = asyncio.run(_run())
+
+        self.assertIs(first, second)
+        self.assertEqual(1, self.conn.requested.count('/redfish/v1/Systems/0'))
+
+    def test_get_system_default_not_unique(self):
+        async def _run():
+            await self.root.connect()
+            return await self.root.get_system()
+
+        self.assertRaises(exceptions.UnknownDefaultError, asyncio.run, _run())
+
+    def test_get_system(self):
+        async def _run():
+            await self.root.connect()
+            return await self.root.get_system('/redfish/v1/Systems/1')
+
+        self.assertEqual('1', asyncio.run(_run()).identity)
+
+    def test_get_system_collection_missing(self):
+        async def _run():
+            await self.root.connect()
+            self.root._systems_path = None
+            return await self.root.get_system_collection()
+
+        self.assertRaises(exceptions.MissingAttributeError,
+                          asyncio.run, _run())
+
+    def _get_system(self):
+        asyncio.run(self.root.connect())
+        return asyncio.run(self.root.get_system('/redfish/v1/Systems/1'))
+
+    def test_refresh_fields(self):
+        sys = self._get_system()
+        self.docs['/redfish/v1/Systems/1'] = dict(
+            self.docs['/redfish/v1/Systems/1'], PowerState='Off')
+
+        asyncio.run(sys.refresh_fields('power_state'))
+
+        self.assertEqual(res_cons.PowerState.OFF, sys.power_state)
+        self.assertEqual('Off', sys.json['PowerState'])
+        self.assertEqual('/redfish/v1/Systems/1', self.conn.requested[-1])
+
+    def test_refresh_fields_select(self):
+        self.docs['/redfish/v1/']['ProtocolFeaturesSupported'][
+            'SelectQuery'] = True
+        sys = self._get_system()
+
+        asyncio.run(sys.refresh_fields('power_state'))
+
+        self.assertEqual('/redfish/v1/Systems/1?$select=PowerState',
+                         self.conn.requested[-1])
+
+    def test_get_headers(self):
+        sys = self._get_system()
+
+        self.assertEqual('"%d"' % len(self.conn.requested), sys._get_etag())
+        self.assertRaises(ValueError, sys._get_headers, revalidate=True)
+
+    def test_invalidate_force_refresh_unsupported(self):
+        self.assertRaises(ValueError, self.root.invalidate,
+                          force_refresh=True)
+
+    def test_get_resource_class_cached(self):
+        cls = aio_base.get_resource_class(system.System)
+
+        self.assertIs(cls, aio_base.get_resource_class(system.System))
+        self.assertIs(cls, aio_base.get_resource_class(cls))
+        self.assertEqual('System', cls.__name__)
+
+
+class AsyncSessionAuthTestCase(base.TestCase):
+
+    def setUp(self):
+        super(AsyncSessionAuthTestCase, self).setUp()
+        self.conn = mock.Mock(spec=connector.Connector)
+        self.root = mock.Mock(spec=main.Sushy)
+
+    def test_authenticate(self):
+        self.root.create_session.return_value = ('token', '/sessions/1')
+        sess_auth = auth.SessionAuth('foo', 'bar')
+        sess_auth.set_context(self.root, self.conn)
+
+        asyncio.run(sess_auth.authenticate())
+
+        self.root.create_session.assert_awaited_once_with('foo', 'bar')
+        self.conn.set_http_session_auth.assert_called_once_with('token')
+        self.assertTrue(sess_auth.can_refresh_session())
+
+    def test_close(self):
+        self.root.create_session.return_value = ('token', '/sessions/1')
+        sess_auth = auth.SessionAuth('foo', 'bar')
+        sess_auth.set_context(self.root, self.conn)
+
+        async def _run():
+            await sess_auth.authenticate()
+            await sess_auth.close()
+
+        asyncio.run(_run())
+
+        self.conn.delete.assert_awaited_once_with('/sessions/1')
+        self.conn.clear_auth.assert_called_once_with()
+        self.assertFalse(sess_auth.can_refresh_session())
+
+    def test_fallback_to_basic(self):
+        response = mock.Mock(status_code=401)
+        response.json.return_value = {}
+        self.root.create_session.side_effect = exceptions.AccessError(
+            'POST', '/sessions', response)
+        sess_auth = auth.SessionOrBasicAuth('foo', 'bar')
+        sess_auth.set_context(self.root, self.conn)
+
+        asyncio.run(sess_auth.authenticate())
+
+        self.conn.set_http_basic_auth.assert_called_once_with('foo', 'bar')
@@ -42,6 +42,8 @@ class EventServiceTestCase(base.TestCase):
         self.assertEqual(self.eventservice.delivery_retry_attempts, 3)
         self.assertEqual(self.eventservice.delivery_retry_interval, 30)
         self.assertEqual(self.eventservice.service_enabled, True)
+        self.assertEqual(self.eventservice.server_sent_event_uri,
+                         '/redfish/v1/EventService/SSE')
         self.assertEqual(self.eventservice.status.health, res_cons.Health.OK)
         self.assertEqual(self.eventservice.status.health_rollup,
                          res_cons.Health.OK)
@@ -110,3 +112,36 @@ class EventServiceTestCase(base.TestCase):
         self.eventservice._conn.post.assert_called_once_with(
             '/redfish/v1/EventService/Actions/EventService.SubmitTestEvent/',
             data=payload)
+
+    def test_iter_server_sent_events(self):
+        response = self.conn.get.return_value
+        response.iter_lines.return_value = [
+            ': keep-alive',
+            '',
+            'id: 1',
+            'data: {"Id": "1",',
+            'data: "Events": [{"MessageId": "TaskEvent.1.0.TaskStarted"}]}',
+            '',
+            'data: not json',
+            '',
+            'data:{"Id": "2"}',
+            '',
+        ]
+
+        events = self.eventservice.iter_server_sent_events(timeout=30)
+
+        self.conn.get.assert_called_with(
+            '/redfish/v1/EventService/SSE',
+            headers={'Accept': 'text/event-stream'}, timeout=30, stream=True)
+        self.assertEqual(
+            [{'Id': '1',
+              'Events': [{'MessageId': 'TaskEvent.1.0.TaskStarted'}]},
+             {'Id': '2'}],
+            list(events))
+        response.close.assert_called_once_with()
+
+    def test_iter_server_sent_events_not_supported(self):
+        self.eventservice.server_sent_event_uri = None
+        self.assertRaisesRegex(
+            exceptions.MissingAttributeError, 'ServerSentEventUri',
+            self.eventservice.iter_server_sent_events)
@@ -140,6 +140,7 @@ class VirtualMediaTestCase(base.TestCase):
 
     def test_insert_media_fallback(self):
         self.conn.get.return_value.headers = {'Allow': 'GET,HEAD,PATCH'}
+        self.sys_virtual_media.refresh()
         self.sys_virtual_media._actions.insert_media = None
         self.sys_virtual_media.insert_media(
             "https://www.dmtf.org/freeImages/Sardine.img", True, False)
@@ -153,6 +154,7 @@ class VirtualMediaTestCase(base.TestCase):
     def test_insert_media_fallback_with_etag(self):
         self.conn.get.return_value.headers = {'Allow': 'GET,HEAD,PATCH',
                                               'ETag': '"3d7b8a7360bf2941d"'}
+        self.sys_virtual_media.refresh()
         self.sys_virtual_media._actions.insert_media = None
         self.sys_virtual_media.insert_media(
             "https://www.dmtf.org/freeImages/Sardine.img", True, False)
@@ -166,6 +168,7 @@ class VirtualMediaTestCase(base.TestCase):
     def test_insert_media_fallback_with_weak_etag(self):
         self.conn.get.return_value.headers = {'Allow': 'GET,HEAD,PATCH',
                                               'ETag': 'W/"3d7b8a7360bf2941d"'}
+        self.sys_virtual_media.refresh()
         self.sys_virtual_media._actions.insert_media = None
         self.sys_virtual_media.insert_media(
             "https://www.dmtf.org/freeImages/Sardine.img", True, False)
@@ -248,6 +251,7 @@ class VirtualMediaTestCase(base.TestCase):
 
     def test_eject_media_fallback(self):
         self.conn.get.return_value.headers = {'Allow': 'GET,HEAD,PATCH'}
+        self.sys_virtual_media.refresh()
         self.sys_virtual_media._actions.eject_media = None
         self.sys_virtual_media.eject_media()
         self.sys_virtual_media._conn.patch.assert_called_once_with(
@@ -258,6 +262,7 @@ class VirtualMediaTestCase(base.TestCase):
     def test_eject_media_fallback_with_etag(self):
         self.conn.get.return_value.headers = {'Allow': 'GET,HEAD,PATCH',
                                               'ETag': '"3d7b8a7360bf2941d"'}
+        self.sys_virtual_media.refresh()
         self.sys_virtual_media._actions.eject_media = None
         self.sys_virtual_media.eject_media()
         self.sys_virtual_media._conn.patch.assert_called_once_with(
@@ -269,6 +274,7 @@ class VirtualMediaTestCase(base.TestCase):
     def test_eject_media_fallback_with_weak_etag(self):
         self.conn.get.return_value.headers = {'Allow': 'GET,HEAD,PATCH',
                                               'ETag': 'W/"3d7b8a7360bf2941d"'}
+        self.sys_virtual_media.refresh()
         self.sys_virtual_media._actions.eject_media = None
         self.sys_virtual_media.eject_media()
         self.sys_virtual_media._conn.patch.assert_called_once_with(
@@ -306,6 +312,7 @@ class VirtualMediaTestCase(base.TestCase):
     def test_set_verify_certificate(self):
         self.conn.get.return_value.headers = {'Allow': 'GET,HEAD',
                                               'ETag': '3d7b8a7360bf2941d'}
+        self.sys_virtual_media.refresh()
         with mock.patch.object(
                 self.sys_virtual_media, 'invalidate',
                 autospec=True) as invalidate_mock:
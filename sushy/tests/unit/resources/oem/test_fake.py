@@ -10,6 +10,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from http import client as http_client
 import json
 from unittest import mock
 
@@ -55,3 +56,30 @@ class FakeOEMSystemExtensionTestCase(base.TestCase):
             '/redfish/v1/Systems/437XR1138R2/Oem/Contoso/Actions/Contoso.Reset'
             )
         self.assertEqual(expected, value)
+
+    def test_set_parent_resource_not_modified(self):
+        with open('sushy/tests/unit/json_samples/system.json', 'r') as f:
+            system_json = json.loads(f.read())
+
+        def get(path, headers=None, **kwargs):
+            response = mock.Mock(headers={'ETag': '"1"'})
+            if headers and headers.get('If-None-Match') == '"1"':
+                response.status_code = http_client.NOT_MODIFIED
+            else:
+                response.status_code = http_client.OK
+                response.json.return_value = system_json
+            return response
+
+        self.conn.get.side_effect = get
+        fake_sys_oem_extn = fake.FakeOEMSystemExtension(
+            self.conn, '/redfish/v1/Systems/437XR1138R2',
+            redfish_version='1.0.2')
+
+        fake_sys_oem_extn.set_parent_resource(self.sys_instance, 'Contoso')
+
+        self.assertEqual(
+            {'If-None-Match': '"1"'},
+            self.conn.get.call_args[1].get('headers'))
+        self.assertEqual('Contoso OEM system', fake_sys_oem_extn.name)
+        self.assertEqual('USA', (
+            fake_sys_oem_extn.production_location.country))
@@ -105,3 +105,86 @@ class AttributeRegistryTestCase(base.TestCase):
                           {'ValueDisplayName': 'Enable',
                            'ValueName': 'Enable'}],
                          attributes.allowable_values)
+
+    def _add_attributes(self):
+        self.json_doc['RegistryEntries']['Attributes'].extend([
+            {'AttributeName': 'BootDelay', 'Type': 'Integer',
+             'LowerBound': 0, 'UpperBound': 60, 'ReadOnly': False},
+            {'AttributeName': 'AssetTag', 'Type': 'String',
+             'MinLength': 1, 'MaxLength': 4, 'ReadOnly': False},
+            {'AttributeName': 'SecureBoot', 'Type': 'Boolean',
+             'ReadOnly': False},
+            {'AttributeName': 'Fixed', 'Type': 'Integer', 'Immutable': True},
+        ])
+        self.registry.refresh()
+
+    def test_get_attribute(self):
+        attribute = self.registry.get_attribute('ProcVirtualization')
+        self.assertIs(self.registry.registry_entries.attributes[1],
+                      attribute)
+        self.assertIsNone(self.registry.get_attribute('Unknown'))
+
+    def test_attributes_by_name(self):
+        attributes = self.registry.attributes_by_name
+        self.assertEqual(['SystemModelName', 'ProcVirtualization'],
+                         list(attributes))
+        self.assertEqual('Virtualization Technology',
+                         attributes['ProcVirtualization'].display_name)
+
+    def test_attributes_by_name_cached(self):
+        attributes = self.registry.attributes_by_name
+        self.assertIs(attributes, self.registry.attributes_by_name)
+
+        self._add_attributes()
+        refreshed = self.registry.attributes_by_name
+        self.assertIsNot(attributes, refreshed)
+        self.assertIn('BootDelay', refreshed)
+        self.assertIs(refreshed, self.registry.attributes_by_name)
+
+    def test_index_rebuilt_on_refresh(self):
+        self.assertIsNone(self.registry.get_attribute('BootDelay'))
+        self._add_attributes()
+        self.assertEqual('Integer',
+                         self.registry.get_attribute('BootDelay')
+                         .attribute_type)
+
+    def test_validate_attributes_valid(self):
+        self._add_attributes()
+        self.assertEqual({}, self.registry.validate_attributes(
+            {'ProcVirtualization': 'Disabled', 'BootDelay': 60,
+             'AssetTag': 'A1', 'SecureBoot': True}))
+
+    def test_validate_attributes_invalid(self):
+        self._add_attributes()
+        errors = self.registry.validate_attributes({
+            'Unknown': 1,
+            'SystemModelName': 'Model',
+            'Fixed': 1,
+            'ProcVirtualization': 'Maybe',
+            'BootDelay': 61,
+            'AssetTag': 'Too long',
+            'SecureBoot': 'yes',
+        })
+        self.assertEqual({
+            'Unknown': 'unknown attribute',
+            'SystemModelName': 'read-only attribute',
+            'Fixed': 'immutable attribute',
+            'ProcVirtualization': "'Maybe' is not one of Disabled, Enabled",
+            'BootDelay': 'greater than 60',
+            'AssetTag': 'longer than 4 characters',
+            'SecureBoot': "expected a boolean, got 'yes'",
+        }, errors)
+
+    def test_validate_attributes_types(self):
+        self._add_attributes()
+        errors = self.registry.validate_attributes({
+            'ProcVirtualization': ['Enabled'],
+            'BootDelay': True,
+            'AssetTag': '',
+        })
+        self.assertEqual({
+            'ProcVirtualization':
+                "['Enabled'] is not one of Disabled, Enabled",
+            'BootDelay': 'expected an integer, got True',
+            'AssetTag': 'shorter than 1 characters',
+        }, errors)
@@ -22,6 +22,7 @@ from sushy.resources import constants as res_cons
 from sushy.resources.registry import attribute_registry
 from sushy.resources.registry import constants as reg_cons
 from sushy.resources.registry import message_registry
+from sushy.resources.registry import registry_index
 from sushy.tests.unit import base
 
 
@@ -130,6 +131,58 @@ class MessageRegistryTestCase(base.TestCase):
                                'unknown_type',
                                self.registry._parse_attributes, self.json_doc)
 
+    def test_messages_compiled(self):
+        message = self.registry.messages['TooBig']
+        self.assertIsInstance(message._template,
+                              message_registry.MessageTemplate)
+        self.assertEqual('Property\'s a value cannot be greater than 1.',
+                         message._template.format(['a', 1]))
+        self.assertEqual({}, vars(message))
+
+    def test_message_template(self):
+        template = message_registry.MessageTemplate('%2 and %1, %3%', 2)
+
+        self.assertEqual('b and a, %3%', template.format(['a', 'b']))
+        self.assertEqual('unknown and 1, %3%', template.format([1]))
+        self.assertEqual('unknown and unknown, %3%', template.format(None))
+
+    def test_message_template_many_args(self):
+        template = message_registry.MessageTemplate(
+            ' '.join('%%%d' % i for i in range(12, 0, -1)), 12)
+
+        self.assertEqual('l k j i h g f e d c b a',
+                         template.format('abcdefghijkl'))
+
+    def test_message_template_no_args(self):
+        template = message_registry.MessageTemplate('Done %1.', 0)
+
+        self.assertEqual('Done %1.', template.format(['a']))
+
+    def test_parse_messages(self):
+        registries = {'Test.1.0.0': self.registry}
+        message_fields = []
+        for message_id, args in [('Test.1.0.0.TooBig', ['arg1', 10]),
+                                 ('Test.1.0.0.Success', []),
+                                 ('Test.1.0.0.BadMessageKey', [])]:
+            message_field = sushy_base.MessageListField('Foo')
+            message_field.message_id = message_id
+            message_field.message_args = args
+            message_field.message = None
+            message_field.severity = None
+            message_field.resolution = None
+            message_fields.append(message_field)
+
+        parsed_msgs = message_registry.parse_messages(registries,
+                                                      message_fields)
+
+        self.assertEqual(['Property\'s arg1 value cannot be greater than 10.',
+                          'Everything done successfully.',
+                          'unknown'],
+                         [m.message for m in parsed_msgs])
+
+    def test_parse_messages_empty(self):
+        self.assertEqual([], message_registry.parse_messages({}, None))
+
     def test_parse_message(self):
         conn = mock.Mock()
         with open('sushy/tests/unit/json_samples/message_registry.json') as f:
@@ -151,6 +204,50 @@ class MessageRegistryTestCase(base.TestCase):
         self.assertEqual('Property\'s arg1 value cannot be greater than 10.',
                          parsed_msg.message)
 
+    def test_parse_message_indexed(self):
+        registries = registry_index.RegistryDict({
+            'Test.1.0.0': self.registry, 'Messages': self.registry})
+        message_field = sushy_base.MessageListField('Foo')
+        message_field.message_id = 'Test.1.0.0.TooBig'
+        message_field.message_args = ['arg1', 10]
+        message_field.severity = None
+        message_field.resolution = None
+        fallback_field = sushy_base.MessageListField('Foo')
+        fallback_field.message_id = 'Success'
+        fallback_field.severity = None
+        fallback_field.resolution = None
+
+        with mock.patch.object(registry_index.RegistryIndex, 'get_message',
+                               autospec=True,
+                               side_effect=registry_index.RegistryIndex
+                               .get_message) as mock_get_message:
+            parsed_msg = message_registry.parse_message(registries,
+                                                        message_field)
+            parsed_fallback = message_registry.parse_message(registries,
+                                                             fallback_field)
+
+        self.assertEqual(2, mock_get_message.call_count)
+        self.assertEqual('Try again', parsed_msg.resolution)
+        self.assertEqual(res_cons.Severity.WARNING, parsed_msg.severity)
+        self.assertEqual('Property\'s arg1 value cannot be greater than 10.',
+                         parsed_msg.message)
+        self.assertEqual('Everything done successfully.',
+                         parsed_fallback.message)
+        self.assertEqual(res_cons.Severity.OK, parsed_fallback.severity)
+
+    @mock.patch.object(message_registry, 'LOG', autospec=True)
+    def test_parse_message_indexed_not_found(self, mock_log):
+        registries = registry_index.RegistryDict({'Test.1.0.0': self.registry})
+        message_field = sushy_base.MessageListField('Foo')
+        message_field.message_id = 'Test.1.0.0.BadMessageKey'
+        message_field.message = None
+
+        parsed_msg = message_registry.parse_message(registries, message_field)
+
+        self.assertEqual('unknown', parsed_msg.message)
+        mock_log.warning.assert_called_once_with(
+            mock.ANY, {'registry': 'Test.1.0.0', 'msg_key': 'BadMessageKey'})
+
     def test_parse_message_with_severity_resolution_no_args(self):
         conn = mock.Mock()
         with open('sushy/tests/unit/json_samples/message_registry.json') as f:
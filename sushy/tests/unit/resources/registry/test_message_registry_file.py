@@ -18,6 +18,7 @@ from unittest import mock
 
 from sushy.resources.base import FieldData
 from sushy.resources.registry import message_registry_file
+from sushy.resources.registry import registry_cache
 from sushy.tests.unit import base
 
 
@@ -81,6 +82,97 @@ class MessageRegistryFileTestCase(base.TestCase):
             reader=None, redfish_version=self.reg_file.redfish_version)
         self.assertEqual(mock_msg_reg_rv, registry)
 
+    @mock.patch('sushy.resources.registry.message_registry.MessageRegistry',
+                autospec=True)
+    @mock.patch('sushy.resources.base.JsonDataReader', autospec=True)
+    def test_get_message_registry_cache_miss(self, mock_reader,
+                                             mock_msg_reg):
+        cache = mock.Mock(spec=registry_cache.RegistryCache)
+        cache.get.return_value = None
+        self.reg_file._root = mock.Mock(_registry_cache=cache,
+                                        vendor='Contoso', product=None,
+                                        redfish_version='1.6.0')
+        mock_reader.return_value.get_data.return_value = FieldData(200, {}, {
+            "@odata.type": "#MessageRegistry.v1_1_1.MessageRegistry",
+        })
+
+        registry = self.reg_file.get_message_registry('en', None)
+
+        self.assertIs(mock_msg_reg.return_value, registry)
+        key = ['MessageRegistry', 'Test', 'Test.1.0', 'en', 'Contoso', '',
+               '1.6.0']
+        cache.get.assert_called_once_with(key)
+        cache.put.assert_called_once_with(
+            key, '/redfish/v1/Registries/Test/Test.1.0.json', registry.json)
+
+    @mock.patch(
+        'sushy.resources.registry.attribute_registry.AttributeRegistry',
+        autospec=True)
+    @mock.patch('sushy.resources.base.JsonDataReader', autospec=True)
+    def test_get_attribute_registry_cache_platform(self, mock_reader,
+                                                   mock_attr_reg):
+        cache = mock.Mock(spec=registry_cache.RegistryCache)
+        cache.get.return_value = None
+        self.reg_file._root = mock.Mock(_registry_cache=cache,
+                                        vendor='Contoso', product=None,
+                                        redfish_version='1.6.0')
+        self.reg_file._root._get_platform_identity.return_value = (
+            'manager/BMC/1.0', 'system/S1/2.0')
+        mock_reader.return_value.get_data.return_value = FieldData(200, {}, {
+            "@odata.type": "#AttributeRegistry.v1_1_1.AttributeRegistry",
+        })
+
+        registry = self.reg_file.get_attribute_registry('en', None)
+
+        self.assertIs(mock_attr_reg.return_value, registry)
+        key = ['AttributeRegistry', 'Test', 'Test.1.0', 'en', 'Contoso', '',
+               '1.6.0', 'manager/BMC/1.0', 'system/S1/2.0']
+        cache.get.assert_called_once_with(key)
+        cache.put.assert_called_once_with(
+            key, '/redfish/v1/Registries/Test/Test.1.0.json', registry.json)
+
+    @mock.patch(
+        'sushy.resources.registry.attribute_registry.AttributeRegistry',
+        autospec=True)
+    @mock.patch('sushy.resources.base.JsonDataReader', autospec=True)
+    def test_get_attribute_registry_cache_unknown_platform(self, mock_reader,
+                                                           mock_attr_reg):
+        cache = mock.Mock(spec=registry_cache.RegistryCache)
+        self.reg_file._root = mock.Mock(_registry_cache=cache,
+                                        vendor='Contoso', product=None,
+                                        redfish_version='1.6.0')
+        self.reg_file._root._get_platform_identity.return_value = None
+        mock_reader.return_value.get_data.return_value = FieldData(200, {}, {
+            "@odata.type": "#AttributeRegistry.v1_1_1.AttributeRegistry",
+        })
+
+        registry = self.reg_file.get_attribute_registry('en', None)
+
+        self.assertIs(mock_attr_reg.return_value, registry)
+        cache.get.assert_not_called()
+        cache.put.assert_not_called()
+
+    @mock.patch('sushy.resources.registry.message_registry.MessageRegistry',
+                autospec=True)
+    def test_get_message_registry_cache_hit(self, mock_msg_reg):
+        cache = mock.Mock(spec=registry_cache.RegistryCache)
+        cache.get.return_value = ('/redfish/v1/Registries/Test.json',
+                                  {'Id': 'Test.1.0.0'})
+        self.reg_file._root = mock.Mock(_registry_cache=cache,
+                                        vendor='Contoso', product='BMC',
+                                        redfish_version='1.6.0')
+        self.conn.reset_mock()
+
+        registry = self.reg_file.get_message_registry('en', None)
+
+        self.assertIs(mock_msg_reg.return_value, registry)
+        mock_msg_reg.assert_called_once_with(
+            self.conn, path='/redfish/v1/Registries/Test.json',
+            json_doc={'Id': 'Test.1.0.0'},
+            redfish_version=self.reg_file.redfish_version)
+        self.conn.get.assert_not_called()
+        cache.put.assert_not_called()
+
     @mock.patch('sushy.resources.registry.message_registry.MessageRegistry',
                 autospec=True)
     @mock.patch('sushy.resources.base.JsonArchiveReader', autospec=True)
@@ -0,0 +1,98 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import gc
+import os
+from unittest import mock
+import weakref
+
+import fixtures
+
+from sushy.resources.registry import registry_cache
+from sushy.tests.unit import base
+
+
+class RegistryCacheTestCase(base.TestCase):
+
+    def setUp(self):
+        super(RegistryCacheTestCase, self).setUp()
+        self.directory = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'registries')
+        self.cache = registry_cache.RegistryCache(self.directory)
+        self.key = ['MessageRegistry', 'Test', 'Test.1.0', 'en', 'Contoso',
+                    'BMC', '1.6.0']
+        self.json_doc = {'Id': 'Test.1.0.0', 'Messages': {'Meow': {}}}
+
+    def test_get_missing(self):
+        self.assertIsNone(self.cache.get(self.key))
+
+    def test_put_get(self):
+        self.cache.put(self.key, '/redfish/v1/Registries/Test.json',
+                       self.json_doc)
+
+        self.assertEqual(('/redfish/v1/Registries/Test.json', self.json_doc),
+                         self.cache.get(self.key))
+        # another cache object can use the same directory
+        self.assertEqual(
+            ('/redfish/v1/Registries/Test.json', self.json_doc),
+            registry_cache.RegistryCache(self.directory).get(self.key))
+        self.assertIsNone(self.cache.get(self.key[:-1] + ['1.7.0']))
+        self.assertEqual(1, len(os.listdir(self.directory)))
+
+    @mock.patch.object(registry_cache, 'LOG', autospec=True)
+    def test_get_corrupted(self, mock_log):
+        self.cache.put(self.key, 'path', self.json_doc)
+        file_path = self.cache._get_file_path(self.key)
+        with open(file_path, 'wb') as fp:
+            fp.write(b'meow')
+
+        self.assertIsNone(self.cache.get(self.key))
+        self.assertTrue(mock_log.warning.called)
+
+    @mock.patch.object(registry_cache, 'LOG', autospec=True)
+    def test_put_failure(self, mock_log):
+        with open(self.directory, 'w'):
+            pass
+
+        self.cache.put(self.key, 'path', self.json_doc)
+
+        self.assertTrue(mock_log.warning.called)
+        self.assertIsNone(self.cache.get(self.key))
+
+
+class InternedRegistriesTestCase(base.TestCase):
+
+    def setUp(self):
+        super(InternedRegistriesTestCase, self).setUp()
+        interned = mock.patch.object(registry_cache, '_interned',
+                                     weakref.WeakValueDictionary())
+        interned.start()
+        self.addCleanup(interned.stop)
+        self.key = ('provided', 'Test', 'Test.1.0', 'en')
+
+    def test_intern(self):
+        registry = mock.Mock()
+
+        self.assertIsNone(registry_cache.get_interned_registry(self.key))
+        self.assertIs(registry,
+                      registry_cache.intern_registry(self.key, registry))
+        self.assertIs(registry,
+                      registry_cache.get_interned_registry(self.key))
+        # the first registry wins
+        self.assertIs(registry,
+                      registry_cache.intern_registry(self.key, mock.Mock()))
+
+    def test_intern_released(self):
+        registry_cache.intern_registry(self.key, mock.Mock())
+        gc.collect()
+
+        self.assertIsNone(registry_cache.get_interned_registry(self.key))
@@ -0,0 +1,99 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from unittest import mock
+
+from sushy.resources.registry import registry_index
+from sushy.tests.unit import base
+
+
+class RegistryIndexTestCase(base.TestCase):
+
+    def setUp(self):
+        super(RegistryIndexTestCase, self).setUp()
+        self.base_msg = mock.Mock()
+        self.oem_msg = mock.Mock()
+        self.base = mock.Mock(identity='Base.1.3.0', language='en',
+                              messages={'Success': self.base_msg})
+        self.oem = mock.Mock(identity='Oem.1.0.0', language='en-US',
+                             messages={'Oops': self.oem_msg})
+        self.bios = mock.Mock(identity='BiosRegistry.1.0', language='en',
+                              spec=['identity', 'language'])
+        self.registries = registry_index.RegistryDict({
+            'Base.1.3': self.base,
+            'Oem.1.0': self.oem,
+            'Messages': self.oem,
+            'BiosRegistry.1.0': self.bios,
+            'Broken': None,
+        })
+        self.index = self.registries.registry_index
+
+    def test_get_registry(self):
+        self.assertIs(self.base, self.index.get_registry('Base.1.3', 'en'))
+        self.assertIs(self.base, self.index.get_registry('Base.1.3.0', 'EN'))
+        self.assertIs(self.bios,
+                      self.index.get_registry('BiosRegistry.1.0', 'en'))
+        self.assertIsNone(self.index.get_registry('Base.1.3', 'fr'))
+        self.assertIsNone(self.index.get_registry('Broken', 'en'))
+
+    def test_get_registry_region(self):
+        self.assertIs(self.oem, self.index.get_registry('Oem.1.0', 'en'))
+        self.assertIs(self.oem, self.index.get_registry('Messages', 'en-US'))
+        self.assertIsNone(self.index.get_registry('Oem.1.0', 'en-GB'))
+
+    def test_get_message(self):
+        self.assertIs(self.base_msg,
+                      self.index.get_message('Base.1.3.Success'))
+        self.assertIs(self.oem_msg, self.index.get_message('Oem.1.0.Oops'))
+        self.assertIsNone(self.index.get_message('Base.1.3.Oops'))
+        self.assertIsNone(self.index.get_message('Bad.1.0.Success'))
+
+    def test_get_message_loads_one_registry(self):
+        other = mock.Mock(identity='Other.1.0.0', language='en')
+        other_messages = mock.PropertyMock(return_value={})
+        type(other).messages = other_messages
+        self.registries['Other.1.0'] = other
+
+        self.assertIs(self.base_msg,
+                      self.registries.registry_index.get_message(
+                          'Base.1.3.Success'))
+        other_messages.assert_not_called()
+
+    def test_get_message_fallback(self):
+        self.assertIs(self.oem_msg, self.index.get_message('Oops'))
+        self.assertIsNone(self.index.get_message('Success'))
+
+        self.registries['BaseMessages'] = self.base
+        index = self.registries.registry_index
+        self.assertIs(self.base_msg, index.get_message('Success'))
+
+    def test_changes_drop_index(self):
+        new = mock.Mock(identity='New.1.0.0', language='en')
+
+        self.registries['New.1.0'] = new
+        self.assertIsNot(self.index, self.registries.registry_index)
+        self.assertIs(new, self.registries.registry_index.get_registry(
+            'New.1.0', 'en'))
+
+        self.registries.update({'Other': new})
+        self.assertIs(new, self.registries.registry_index.get_registry(
+            'Other', 'en'))
+
+        del self.registries['New.1.0']
+        self.registries.pop('Other')
+        self.assertIsNone(self.registries.registry_index.get_registry(
+            'New.1.0.0', 'en'))
+
+    def test_get_index(self):
+        self.assertIs(self.index, registry_index.get_index(self.registries))
+        self.assertIsNone(registry_index.get_index({'Base.1.3': self.base}))
+        self.assertIsNone(registry_index.get_index(mock.Mock()))
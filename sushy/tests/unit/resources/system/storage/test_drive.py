@@ -84,6 +84,7 @@ class DriveTestCase(base.TestCase):
 
     def test_set_indicator_led(self):
         self.conn.get.return_value.headers = {'ETag': 'a3b01b63f80a4913'}
+        self.stor_drive.refresh()
         with mock.patch.object(
                 self.stor_drive, 'invalidate',
                 autospec=True) as invalidate_mock:
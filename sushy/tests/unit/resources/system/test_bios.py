@@ -23,6 +23,7 @@ from sushy import exceptions
 from sushy.resources import constants as res_cons
 from sushy.resources.registry import attribute_registry
 from sushy.resources.registry import message_registry
+from sushy.resources.registry import registry_index
 from sushy.resources import settings
 from sushy.resources.system import bios
 from sushy.tests.unit import base
@@ -179,6 +180,79 @@ class BiosTestCase(base.TestCase):
                       'MaintenanceWindowDurationInSeconds': 600}},
             etag='9234ac83b9700123cc32')
 
+    def test_set_attributes_validate(self):
+        self.conn.get.return_value.json.side_effect = [
+            self.bios_json]
+
+        self.sys_bios.set_attributes({'ProcVirtualization': 'Disabled'},
+                                     validate=True)
+        self.sys_bios._conn.patch.assert_called_once_with(
+            '/redfish/v1/Systems/437XR1138R2/BIOS/Settings',
+            data={'Attributes': {'ProcVirtualization': 'Disabled'}},
+            etag='9234ac83b9700123cc32')
+
+    def test_set_attributes_validate_invalid(self):
+        exc = self.assertRaises(
+            exceptions.InvalidAttributesError,
+            self.sys_bios.set_attribute, 'ProcVirtualization', 'Maybe',
+            validate=True)
+        self.assertEqual(['ProcVirtualization'], list(exc.errors))
+        self.assertIn('ProcVirtualization', str(exc))
+        self.sys_bios._conn.patch.assert_not_called()
+
+    def test_validate_attributes_no_registry(self):
+        self.assertRaisesRegex(
+            exceptions.MissingAttributeError, 'AttributeRegistry',
+            self.sys_bios.validate_attributes,
+            {'ProcVirtualization': 'Disabled'}, language='zh')
+
+    def test_apply_attributes(self):
+        self.conn.get.return_value.json.side_effect = [
+            self.bios_settings_json]
+
+        update = self.sys_bios.apply_attributes(
+            {'BootMode': 'Uefi', 'ProcTurboMode': 'Disabled',
+             'EmbeddedSata': 'Raid', 'UsbControl': 'UsbDisabled',
+             'NewAttribute': 1})
+
+        self.assertTrue(update.requested)
+        self.assertEqual({'EmbeddedSata': ('Raid', 'Raid'),
+                          'UsbControl': ('UsbEnabled', 'UsbDisabled'),
+                          'NewAttribute': (None, 1)}, update.changed)
+        self.assertEqual({'ProcTurboMode': 'Disabled'}, update.pending)
+        self.assertEqual(['BootMode'], update.unchanged)
+        self.sys_bios._conn.patch.assert_called_once_with(
+            '/redfish/v1/Systems/437XR1138R2/BIOS/Settings',
+            data={'Attributes': {'EmbeddedSata': 'Raid',
+                                 'UsbControl': 'UsbDisabled',
+                                 'NewAttribute': 1}},
+            etag='9234ac83b9700123cc32')
+
+    def test_apply_attributes_no_changes(self):
+        self.conn.get.return_value.json.side_effect = [
+            self.bios_settings_json]
+
+        update = self.sys_bios.apply_attributes(
+            {'BootMode': 'Uefi', 'ProcTurboMode': 'Disabled'})
+
+        self.assertFalse(update.requested)
+        self.assertEqual({}, update.changed)
+        self.assertEqual({'ProcTurboMode': 'Disabled'}, update.pending)
+        self.assertEqual(['BootMode'], update.unchanged)
+        self.sys_bios._conn.patch.assert_not_called()
+
+    def test_apply_attributes_validates_changes_only(self):
+        self.conn.get.return_value.json.side_effect = [
+            self.bios_settings_json]
+        self.sys_bios.attributes['SystemModelName'] = 'Model'
+
+        self.assertRaisesRegex(
+            exceptions.InvalidAttributesError, 'ProcVirtualization',
+            self.sys_bios.apply_attributes,
+            {'SystemModelName': 'Model', 'ProcVirtualization': 'Maybe'},
+            validate=True)
+        self.sys_bios._conn.patch.assert_not_called()
+
     def test_set_attributes_on_refresh(self):
         self.conn.get.return_value.json.side_effect = [
             self.bios_settings_json,
@@ -350,6 +424,14 @@ class BiosTestCase(base.TestCase):
         self.assertIsNotNone(registry)
         self.assertEqual(registry.name, 'BIOS Attribute Registry')
 
+    def test_get_attribute_registry_indexed(self):
+        self.sys_bios._registries = registry_index.RegistryDict(
+            self.sys_bios._registries)
+
+        registry = self.sys_bios.get_attribute_registry()
+        self.assertIs(self.bios_reg, registry)
+        self.assertIsNone(self.sys_bios.get_attribute_registry(language='zh'))
+
     def test_get_attribute_registry_no_lang(self):
 
         registry = self.sys_bios.get_attribute_registry(language='zh')
@@ -446,3 +528,10 @@ class BiosZTTestCase(base.TestCase):
                          attribute_type,
                          registry2.registry_entries.attributes[0].
                          attribute_type)
+
+    def test_apply_attributes_no_settings(self):
+        update = self.sys_bios.apply_attributes({'ACPI002': False})
+
+        self.assertFalse(update.requested)
+        self.assertEqual(['ACPI002'], update.unchanged)
+        self.sys_bios._conn.patch.assert_not_called()
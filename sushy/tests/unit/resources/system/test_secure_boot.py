@@ -83,6 +83,15 @@ class SecureBootTestCase(base.TestCase):
             data={'SecureBootEnable': True},
             etag='b26ae716a2c1f39f')
 
+    def test_set_enabled_consecutive(self):
+        self.secure_boot.set_enabled(True)
+        self.conn.get.return_value.headers = {'ETag': 'c3f6e5a7b1d2e4f8'}
+        self.secure_boot.set_enabled(False)
+
+        self.assertEqual(['b26ae716a2c1f39f', 'c3f6e5a7b1d2e4f8'],
+                         [call[1]['etag']
+                          for call in self.conn.patch.call_args_list])
+
     def test_set_enabled_wrong_type(self):
         self.assertRaises(exceptions.InvalidParameterValueError,
                           self.secure_boot.set_enabled, 'banana')
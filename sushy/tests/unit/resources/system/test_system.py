@@ -297,6 +297,24 @@ class SystemTestCase(base.TestCase):
                            'BootSourceOverrideMode': 'UEFI'}},
             etag='81802dbf61beb0bd')
 
+    def test_set_system_boot_options_consecutive(self):
+        self.conn.get.return_value.headers = {'ETag': '"e1"'}
+        self.sys_inst = system.System(
+            self.conn, '/redfish/v1/Systems/437XR1138R2',
+            redfish_version='1.0.2')
+
+        self.sys_inst.set_system_boot_options(
+            sushy.BootSource.PXE,
+            enabled=sushy.BootSourceOverrideEnabled.ONCE)
+        self.conn.get.return_value.headers = {'ETag': '"e2"'}
+        self.sys_inst.set_system_boot_options(
+            sushy.BootSource.HDD,
+            enabled=sushy.BootSourceOverrideEnabled.ONCE)
+
+        self.assertEqual(['"e1"', '"e2"'],
+                         [call[1]['etag']
+                          for call in self.conn.patch.call_args_list])
+
     def test_set_system_boot_options_no_mode_specified(self):
         self.sys_inst.set_system_boot_options(
             sushy.BootSource.HDD,
@@ -430,6 +448,7 @@ class SystemTestCase(base.TestCase):
             etag='"3d7b838291941d"')
 
     def test_set_system_boot_options_settings_resource_lenovo(self):
+        self.conn.get.return_value.headers = {'ETag': '"222"'}
         self.sys_inst = system.System(
             self.conn, '/redfish/v1/Systems/1',
             redfish_version='1.0.2')
@@ -447,13 +466,13 @@ class SystemTestCase(base.TestCase):
 
         get_settings = mock.MagicMock(headers={'ETag': '"3d7b838291941d"'})
         get_settings.json.return_value = settings_body
-        get_system = mock.MagicMock(headers={'ETag': '"222"'})
-        self.conn.get.side_effect = [get_settings, get_system]
+        self.conn.get.side_effect = [get_settings]
 
         self.sys_inst.set_system_boot_options(
             target=sushy.BootSource.CD,
             enabled=sushy.BootSourceOverrideEnabled.ONCE)
 
+        # the ETag received when loading the system is reused
         self.sys_inst._conn.patch.assert_called_once_with(
             '/redfish/v1/Systems/1',
             data={'Boot': {'BootSourceOverrideEnabled': 'Once',
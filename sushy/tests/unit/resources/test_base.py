@@ -24,6 +24,7 @@ import zipfile
 from sushy import exceptions
 from sushy.resources import base as resource_base
 from sushy.tests.unit import base
+from sushy import utils
 
 
 BASE_RESOURCE_JSON = {
@@ -103,6 +104,97 @@ class ResourceBaseTestCase(base.TestCase):
         self.base_resource.invalidate(force_refresh=True)
         self.conn.get.assert_called_once_with(path='/Foo')
 
+    def test_refresh_returns_changed(self):
+        self.assertTrue(self.base_resource.refresh())
+        self.assertFalse(self.base_resource.refresh(force=False))
+
+    def test_refresh_conditional_not_modified(self):
+        self.conn.get.return_value.headers = {'ETag': '"1"'}
+        self.base_resource.refresh()
+        self.conn.reset_mock()
+        self.conn.get.return_value.status_code = http_client.NOT_MODIFIED
+        self.base_resource.invalidate()
+
+        with mock.patch.object(self.base_resource, '_parse_attributes',
+                               autospec=True) as mock_parse:
+            self.assertFalse(self.base_resource.refresh())
+
+        self.conn.get.assert_called_once_with(
+            path='/Foo', headers={'If-None-Match': '"1"'})
+        mock_parse.assert_not_called()
+        self.assertFalse(self.base_resource._is_stale)
+        self.assertEqual(BASE_RESOURCE_JSON, self.base_resource.json)
+        self.assertEqual('"1"', self.base_resource._get_etag())
+
+    def test_refresh_conditional_modified(self):
+        self.conn.get.return_value.headers = {'ETag': '"1"'}
+        self.base_resource.refresh()
+        self.conn.get.return_value.status_code = http_client.OK
+        self.conn.get.return_value.headers = {'ETag': '"2"'}
+        self.conn.get.return_value.json.return_value = {'Id': 'new'}
+
+        self.assertTrue(self.base_resource.refresh())
+
+        self.conn.get.assert_called_with(
+            path='/Foo', headers={'If-None-Match': '"1"'})
+        self.assertEqual({'Id': 'new'}, self.base_resource.json)
+        self.assertEqual('"2"', self.base_resource._get_etag())
+
+    def test_refresh_not_conditional_without_etag(self):
+        self.conn.get.return_value.headers = {}
+        self.base_resource.refresh()
+
+        self.base_resource.refresh()
+
+        self.conn.get.assert_called_with(path='/Foo')
+
+    def test__get_headers_from_refresh(self):
+        self.conn.get.return_value.headers = {'ETag': '"1"',
+                                              'Allow': 'GET, PATCH'}
+        self.base_resource.refresh()
+        self.conn.reset_mock()
+
+        self.assertEqual('"1"', self.base_resource._get_etag())
+        self.assertTrue(self.base_resource._allow_patch())
+        self.conn.get.assert_not_called()
+
+    def test__get_headers_revalidate(self):
+        self.conn.get.return_value.headers = {'ETag': '"1"'}
+        self.base_resource.refresh()
+        self.conn.get.return_value.headers = {'ETag': '"2"'}
+
+        self.assertEqual('"2"', self.base_resource._get_etag(revalidate=True))
+        self.assertEqual('"2"', self.base_resource._get_etag())
+        self.assertFalse(self.base_resource._allow_patch())
+        self.assertEqual(2, self.conn.get.call_count)
+
+    def test__get_headers_after_write(self):
+        self.conn.write_count = 0
+        self.conn.get.return_value.headers = {'ETag': '"1"'}
+        self.base_resource.refresh()
+        self.assertEqual('"1"', self.base_resource._get_etag())
+        self.conn.write_count = 1
+        self.conn.get.return_value.headers = {'ETag': '"2"'}
+
+        self.assertEqual('"2"', self.base_resource._get_etag())
+        self.assertEqual('"2"', self.base_resource._get_etag())
+        self.assertEqual(2, self.conn.get.call_count)
+
+    def test__get_headers_stale(self):
+        self.conn.get.return_value.headers = {'ETag': '"1"'}
+        self.base_resource.refresh()
+        self.conn.get.return_value.headers = {'ETag': '"2"'}
+        self.base_resource.invalidate()
+
+        self.assertEqual('"2"', self.base_resource._get_etag())
+
+    def test__get_headers_json_doc(self):
+        self.base_resource.refresh(json_doc={'Id': '1'})
+        self.conn.get.return_value.headers = {'ETag': '"2"'}
+
+        self.assertEqual('"2"', self.base_resource._get_etag())
+        self.conn.get.assert_called_once_with(path='/Foo')
+
     def test_refresh_archive(self):
         mock_response = mock.Mock(
             headers={'content-type': 'application/zip'})
@@ -195,12 +287,19 @@ class TestResource(resource_base.ResourceBase):
             used in any resource that needs registries to parse messages.
         """
         super(TestResource, self).__init__(connector, 'Fakes/%s' % identity,
-                                           redfish_version, registries, root)
+                                           redfish_version, registries,
+                                           root=root)
         self.identity = identity
 
     def _parse_attributes(self, json_doc):
         pass
 
+    @property
+    @utils.cache_it
+    def sub(self):
+        return BaseResource(self._conn, self._path + '/Sub',
+                            root=self._root)
+
 
 class TestResourceCollection(resource_base.ResourceCollectionBase):
     """A concrete Test Resource Collection to test against"""
@@ -307,6 +406,125 @@ class ResourceCollectionBaseTestCase(base.TestCase):
         result = self._validate_get_members_result(('1', '2'))
         self.assertIs(result, self.test_resource_collection.get_members())
 
+    def test_get_members_concurrently(self):
+        member_ids = tuple(str(i) for i in range(8))
+        self.test_resource_collection.members_identities = member_ids
+
+        result = self.test_resource_collection.get_members(max_workers=4)
+
+        self.assertEqual(list(member_ids), [m.identity for m in result])
+        self.assertEqual(8, self.conn.get.call_count)
+        self.assertIs(result, self.test_resource_collection.get_members())
+
+    def test_get_members_workers_from_root(self):
+        self.test_resource_collection._root = mock.Mock(
+            _member_fetch_workers=3)
+        self.test_resource_collection.members_identities = ('1', '2')
+
+        with mock.patch.object(
+                resource_base.utils, 'map_concurrently',
+                autospec=True) as mock_map:
+            self.test_resource_collection.get_members()
+
+        mock_map.assert_called_once_with(
+            self.test_resource_collection.get_member, ('1', '2'), 3)
+
+    def test_get_members_concurrently_error(self):
+        self.test_resource_collection.members_identities = ('1', '2', '3')
+        self.conn.get.side_effect = exceptions.ResourceNotFoundError(
+            method='GET', url='http://foo.bar:8000/redfish/v1/Fakes/2',
+            response=mock.MagicMock(status_code=http_client.NOT_FOUND))
+
+        self.assertRaises(exceptions.ResourceNotFoundError,
+                          self.test_resource_collection.get_members,
+                          max_workers=2)
+        self.assertIsNone(
+            getattr(self.test_resource_collection, '_cache_get_members',
+                    None))
+
+
+class ResourceCollectionExpandTestCase(base.TestCase):
+
+    def setUp(self):
+        super(ResourceCollectionExpandTestCase, self).setUp()
+        self.conn = mock.MagicMock()
+        self.root = mock.Mock(_expand_query='$expand=.($levels=2)')
+        self.member_doc = {
+            '@odata.id': 'Fakes/1', '@odata.type': '#Fake.v1_0_0.Fake',
+            'Id': '1',
+            'Sub': {'@odata.id': 'Fakes/1/Sub',
+                    '@odata.type': '#Sub.v1_0_0.Sub', 'Id': 'Sub'},
+            'Links': {'Other': {'@odata.id': 'Others/1'}},
+            'Parts': [{'@odata.id': 'Fakes/1#/Parts/0',
+                       '@odata.type': '#Part.v1_0_0.Part', 'Id': '0'}]}
+        self.conn.get.return_value.json.return_value = {
+            '@odata.id': 'Fakes', '@odata.type': '#FakeCollection',
+            'Members': [self.member_doc]}
+
+    def test_expand(self):
+        collection = TestResourceCollection(self.conn, root=self.root)
+
+        self.conn.get.assert_called_once_with(
+            path='Fakes?$expand=.($levels=2)')
+        self.assertEqual(('Fakes/1',), collection.members_identities)
+        self.assertEqual(['Fakes/1', 'Fakes/1/Sub'],
+                         sorted(collection._prefetched_docs))
+
+        member = collection.get_member('1')
+
+        self.assertEqual(1, self.conn.get.call_count)
+        self.assertEqual(self.member_doc, member.json)
+        self.assertNotIn('Fakes/1', collection._prefetched_docs)
+        self.assertIs(collection._prefetched_docs, member._prefetched_docs)
+
+        # prefetched documents are only used for the first load
+        member.refresh()
+        self.conn.get.assert_called_with(path='Fakes/1')
+        self.assertIsNone(member._prefetched_docs)
+
+    def test_expand_sub_resource(self):
+        collection = TestResourceCollection(self.conn, root=self.root)
+        member = collection.get_member('1')
+
+        sub = member.sub
+
+        self.assertEqual(1, self.conn.get.call_count)
+        self.assertEqual('Sub', sub.json['Id'])
+
+    def test_expand_not_used_outside_collection(self):
+        collection = TestResourceCollection(self.conn, root=self.root)
+
+        member = TestResource(self.conn, '1', root=self.root)
+
+        self.conn.get.assert_called_with(path='Fakes/1')
+        self.assertIsNone(member._prefetched_docs)
+        self.assertIn('Fakes/1', collection._prefetched_docs)
+
+    def test_expand_reload(self):
+        collection = TestResourceCollection(self.conn, root=self.root)
+        member = collection.get_member('1')
+        self.conn.get.reset_mock()
+
+        collection.refresh()
+        member.refresh()
+
+        self.assertEqual([mock.call(path='Fakes?$expand=.($levels=2)'),
+                          mock.call(path='Fakes/1')],
+                         self.conn.get.call_args_list)
+
+    def test_expand_disabled(self):
+        self.root._expand_query = None
+
+        collection = TestResourceCollection(self.conn, root=self.root)
+
+        self.conn.get.assert_called_once_with(path='Fakes')
+        self.assertIsNone(collection._prefetched_docs)
+
+    def test_expand_without_root(self):
+        TestResourceCollection(self.conn)
+
+        self.conn.get.assert_called_once_with(path='Fakes')
+
 
 TEST_JSON = {
     'String': 'a string',
@@ -421,6 +639,26 @@ class FieldTestCase(base.TestCase):
                          self.test_resource.enum_mapped_list)
         self.assertIsNone(self.test_resource.non_existing_enum_mapped)
 
+    def test_compact_values(self):
+        element = self.test_resource.field_list[0]
+        self.assertIsInstance(element, TestListField)
+        self.assertIsNot(TestListField, type(element))
+        self.assertEqual('a third string', element['string'])
+        # Sub-fields are kept in slots, not in a dictionary per element
+        self.assertEqual({}, vars(element))
+        self.assertEqual(['ListField'], element._path)
+        self.assertIs(type(element), type(self.test_resource.field_list[1]))
+
+        value = self.test_resource.dictionary['key1']
+        self.assertIsInstance(value, TestDictionaryField)
+        self.assertEqual({}, vars(value))
+
+        nested = self.test_resource.nested
+        self.assertIsInstance(nested, NestedTestField)
+        self.assertEqual(
+            {'string', 'integer', 'nested_field', 'mapped', 'non_existing'},
+            set(nested))
+
     def test_missing_required(self):
         del self.json['String']
         self.assertRaisesRegex(
@@ -453,6 +691,58 @@ class FieldTestCase(base.TestCase):
             'attribute Nested/Integer is malformed.*invalid literal for int',
             self.test_resource.refresh, force=True)
 
+    def test_attribute_values_not_built_without_debug(self):
+        with mock.patch.object(ComplexResource, '_get_value',
+                               autospec=True) as mock_get_value:
+            with mock.patch.object(resource_base.LOG, 'isEnabledFor',
+                                   autospec=True, return_value=False):
+                self.test_resource.refresh()
+
+        mock_get_value.assert_not_called()
+
+    def test_attribute_values(self):
+        attributes = self.test_resource._parse_attributes(self.json)
+
+        self.assertEqual('a string', attributes['string'])
+        self.assertEqual({'string': 'another string', 'integer': 0,
+                          'nested_field': 'field value', 'mapped': 'real',
+                          'non_existing': 3.14}, attributes['nested'])
+        self.assertIn("'integer': 42", str(attributes))
+
+    def test_malformed_list_int(self):
+        self.json['ListField'][1]['Integer'] = 'banana'
+        self.assertRaisesRegex(
+            exceptions.MalformedAttributeError,
+            'attribute ListField/Integer is malformed',
+            self.test_resource.refresh, force=True)
+
+    def test_field_table_cached(self):
+        table = resource_base._collect_fields(self.test_resource)
+
+        self.assertIs(table, resource_base._collect_fields(
+            ComplexResource(self.conn, redfish_version='1.0.x')))
+        self.assertIn(('nested', ComplexResource.nested), table)
+        self.assertNotIn('json', dict(table))
+        # subclasses get their own table
+        self.assertIsNot(table, resource_base._get_field_table(
+            type('SubResource', (ComplexResource,), {})))
+
+    def test_sub_field_instances_independent(self):
+        first, second = self.test_resource.field_list
+
+        self.assertEqual('a third string', first.string)
+        self.assertEqual(2, second.integer)
+        self.assertIsInstance(ComplexResource.field_list.string,
+                              resource_base.Field)
+
+    def test__nested_path(self):
+        self.assertEqual(['A', 'B', 'C'],
+                         resource_base._nested_path(((None, ['A']), ['B']),
+                                                    ['C']))
+        self.assertEqual(['A', 'B'],
+                         resource_base._nested_path(['A'], ['B']))
+        self.assertEqual(['B'], resource_base._nested_path(None, ['B']))
+
     def test_mapping_missing(self):
         self.json['Nested']['Mapped'] = 'banana'
         self.json['Enum'] = 'banana'
@@ -491,6 +781,129 @@ class PartialKeyResource(resource_base.ResourceBase):
         lambda key, value, **context: key == 'Integer' and int(value) < 42)
 
 
+class RefreshFieldsTestCase(base.TestCase):
+
+    def setUp(self):
+        super(RefreshFieldsTestCase, self).setUp()
+        self.conn = mock.Mock()
+        self.conn.get.return_value.json.return_value = copy.deepcopy(
+            TEST_JSON)
+        self.root = mock.Mock(_select_supported=True)
+        self.test_resource = ComplexResource(self.conn, root=self.root)
+        self.conn.reset_mock()
+        self.conn.get.return_value.json.return_value = {
+            'Integer': '43', 'Nested': {'String': 'new string',
+                                        'Object': {'Field': 'new'}}}
+
+    def test_refresh_fields(self):
+        self.test_resource.refresh_fields('integer', 'nested')
+
+        self.conn.get.assert_called_once_with(
+            path='?$select=Integer,Nested')
+        self.assertEqual(43, self.test_resource.integer)
+        self.assertEqual('new string', self.test_resource.nested.string)
+        # other fields are not touched
+        self.assertEqual('a string', self.test_resource.string)
+        self.assertEqual('a string', self.test_resource.json['String'])
+        self.assertEqual('43', self.test_resource.json['Integer'])
+        self.assertFalse(self.test_resource._is_stale)
+
+    def test_refresh_fields_select_not_supported(self):
+        self.root._select_supported = False
+
+        self.test_resource.refresh_fields('integer')
+
+        self.conn.get.assert_called_once_with(path='')
+        self.assertEqual(43, self.test_resource.integer)
+        self.assertEqual('a string', self.test_resource.string)
+
+    def test_refresh_fields_missing_property(self):
+        self.test_resource.refresh_fields('dictionary')
+
+        self.assertIsNone(self.test_resource.dictionary)
+        self.assertNotIn('Dictionary', self.test_resource.json)
+
+    def test_refresh_fields_drops_headers(self):
+        partial_json = self.conn.get.return_value.json.return_value
+        self.conn.get.return_value.json.return_value = copy.deepcopy(
+            TEST_JSON)
+        self.conn.get.return_value.headers = {'ETag': '"1"'}
+        self.conn.get.return_value.status_code = http_client.OK
+        self.test_resource.refresh()
+        self.conn.get.return_value.json.return_value = partial_json
+        self.conn.get.return_value.headers = {'ETag': '"2"'}
+        self.test_resource.refresh_fields('integer')
+        self.conn.get.return_value.json.return_value = copy.deepcopy(
+            TEST_JSON)
+        self.conn.reset_mock()
+
+        self.test_resource.refresh()
+
+        # the ETag of the whole document is not used for the merged one
+        self.conn.get.assert_called_with(path='')
+        self.assertEqual('"2"', self.test_resource._get_etag())
+
+    def test_refresh_fields_unknown(self):
+        self.assertRaisesRegex(ValueError, 'no fields json, meow',
+                               self.test_resource.refresh_fields,
+                               'integer', 'meow', 'json')
+        self.conn.get.assert_not_called()
+
+
+class LazyFieldsTestCase(base.TestCase):
+
+    def setUp(self):
+        super(LazyFieldsTestCase, self).setUp()
+        self.conn = mock.Mock()
+        self.json = copy.deepcopy(TEST_JSON)
+        self.conn.get.return_value.json.return_value = self.json
+        self.root = mock.Mock(_lazy_fields=True)
+        self.test_resource = ComplexResource(self.conn, root=self.root)
+
+    def test_loaded_on_access(self):
+        self.assertNotIn('integer', self.test_resource.__dict__)
+
+        self.assertEqual(42, self.test_resource.integer)
+        self.assertEqual('another string', self.test_resource.nested.string)
+        self.assertEqual(2, self.test_resource.field_list[1].integer)
+        self.assertEqual(42, self.test_resource.__dict__['integer'])
+        self.assertNotIn('string', self.test_resource.__dict__)
+
+    @mock.patch.object(ComplexResource.integer, '_load', autospec=True)
+    def test_memoized_until_refresh(self, mock_load):
+        mock_load.return_value = 42
+
+        self.assertEqual(42, self.test_resource.integer)
+        self.assertEqual(42, self.test_resource.integer)
+        self.assertEqual(1, mock_load.call_count)
+
+        self.test_resource.refresh()
+        mock_load.return_value = 43
+
+        self.assertEqual(43, self.test_resource.integer)
+        self.assertEqual(2, mock_load.call_count)
+
+    def test_error_on_access(self):
+        del self.json['String']
+        self.test_resource.refresh()
+
+        self.assertRaises(exceptions.MissingAttributeError,
+                          getattr, self.test_resource, 'string')
+        self.assertEqual(42, self.test_resource.integer)
+
+    def test_resource_setting_overrides_root(self):
+        with mock.patch.object(ComplexResource, '_lazy_fields', False):
+            test_resource = ComplexResource(self.conn, root=self.root)
+
+        self.assertEqual(42, test_resource.__dict__['integer'])
+
+    def test_eager_by_default(self):
+        test_resource = ComplexResource(self.conn)
+
+        self.assertEqual(42, test_resource.__dict__['integer'])
+        self.assertIsInstance(ComplexResource.integer, resource_base.Field)
+
+
 class FieldPartialKeyTestCase(base.TestCase):
     def setUp(self):
         super(FieldPartialKeyTestCase, self).setUp()
@@ -21,6 +21,7 @@ from sushy import auth
 from sushy import connector
 from sushy import exceptions
 from sushy import main
+from sushy import session_store
 from sushy.tests.unit import base
 
 
@@ -212,6 +213,128 @@ class SessionAuthTestCase(base.TestCase):
         auth_close.assert_called_once_with(session_auth)
 
 
+class SessionAuthStoreTestCase(base.TestCase):
+
+    @mock.patch.object(main, 'Sushy', autospec=True)
+    @mock.patch.object(connector, 'Connector', autospec=True)
+    def setUp(self, mock_connector, mock_root):
+        super(SessionAuthStoreTestCase, self).setUp()
+        self.sess_key = 'TestingKey'
+        self.sess_uri = '/redfish/v1/SessionService/Sessions/testing'
+        self.store = session_store.MemorySessionStore()
+        self.sess_auth = auth.SessionOrBasicAuth('TestUsername', 'password',
+                                                 session_store=self.store)
+        self.conn = mock_connector.return_value
+        self.conn._url = 'http://foo.bar:1234'
+        self.conn._session = mock.Mock(spec=requests.Session)
+        self.conn._session.headers = {}
+        self.conn._session.auth = None
+        self.root = mock_root.return_value
+        self.root.create_session.return_value = (self.sess_key,
+                                                 self.sess_uri)
+        self.sess_auth.set_context(self.root, self.conn)
+        self.store_key = session_store.get_session_key(
+            'http://foo.bar:1234', 'TestUsername', 'password')
+
+    def test_authenticate_stores_session(self):
+        self.sess_auth.authenticate()
+
+        self.root.create_session.assert_called_once_with('TestUsername',
+                                                         'password')
+        self.assertEqual((self.sess_key, self.sess_uri),
+                         self.store.get(self.store_key))
+
+    def test_authenticate_reuses_stored_session(self):
+        self.store.put(self.store_key, 'StoredKey', '/Sessions/stored')
+
+        self.sess_auth.authenticate()
+
+        self.assertFalse(self.root.create_session.called)
+        self.assertEqual('StoredKey', self.sess_auth.get_session_key())
+        self.assertEqual('/Sessions/stored',
+                         self.sess_auth.get_session_resource_id())
+        self.assertTrue(self.sess_auth.can_refresh_session())
+        self.conn.set_http_session_auth.assert_called_once_with('StoredKey')
+
+    def test_authenticate_other_credentials(self):
+        self.store.put(self.store_key, 'StoredKey', '/Sessions/stored')
+        sess_auth = auth.SessionAuth('TestUsername', 'other',
+                                     session_store=self.store)
+        sess_auth.set_context(self.root, self.conn)
+
+        sess_auth.authenticate()
+
+        self.assertEqual(self.sess_key, sess_auth.get_session_key())
+
+    def test_refresh_drops_rejected_session(self):
+        self.store.put(self.store_key, 'StoredKey', '/Sessions/stored')
+        self.sess_auth.authenticate()
+
+        self.sess_auth.refresh_session()
+
+        self.root.create_session.assert_called_once_with('TestUsername',
+                                                         'password')
+        self.assertEqual(self.sess_key, self.sess_auth.get_session_key())
+        self.assertEqual((self.sess_key, self.sess_uri),
+                         self.store.get(self.store_key))
+
+    def test_reauthenticate_drops_rejected_session_without_uri(self):
+        self.store.put(self.store_key, 'StoredKey', None)
+        self.sess_auth.authenticate()
+        self.assertFalse(self.sess_auth.can_refresh_session())
+
+        # NOTE: the connector authenticates again when the stored session
+        # is rejected and cannot be refreshed
+        self.sess_auth.authenticate()
+
+        self.root.create_session.assert_called_once_with('TestUsername',
+                                                         'password')
+        self.assertEqual(self.sess_key, self.sess_auth.get_session_key())
+        self.assertEqual((self.sess_key, self.sess_uri),
+                         self.store.get(self.store_key))
+        self.conn.set_http_session_auth.assert_called_with(self.sess_key)
+
+    def test_reauthenticate_new_session_without_uri(self):
+        self.root.create_session.return_value = (self.sess_key, None)
+        self.sess_auth.authenticate()
+        self.root.create_session.return_value = ('NewKey', None)
+
+        self.sess_auth.authenticate()
+
+        self.assertEqual(2, self.root.create_session.call_count)
+        self.assertEqual('NewKey', self.sess_auth.get_session_key())
+        self.assertEqual(('NewKey', None), self.store.get(self.store_key))
+
+    @mock.patch.object(session_store.MemorySessionStore, 'delete',
+                       autospec=True)
+    def test_reauthenticate_ignores_rejected_session(self, mock_delete):
+        self.store.put(self.store_key, 'StoredKey', None)
+        self.sess_auth.authenticate()
+        self.root.create_session.side_effect = exceptions.AccessError(
+            method='POST', url='/Sessions', response=mock.Mock(
+                spec=requests.Response, status_code=401))
+
+        self.assertRaises(exceptions.AccessError,
+                          self.sess_auth.authenticate)
+        mock_delete.assert_called_once_with(self.store, self.store_key,
+                                            token='StoredKey')
+
+        # the entry could not be deleted, it is still never reused
+        self.assertRaises(exceptions.AccessError,
+                          self.sess_auth.authenticate)
+        self.assertEqual(2, self.root.create_session.call_count)
+
+    def test_close_keeps_stored_session(self):
+        self.sess_auth.authenticate()
+
+        self.sess_auth.close()
+
+        self.conn.delete.assert_not_called()
+        self.assertIsNone(self.sess_auth.get_session_key())
+        self.assertEqual((self.sess_key, self.sess_uri),
+                         self.store.get(self.store_key))
+
+
 class SessionOrBasicAuthTestCase(base.TestCase):
 
     @mock.patch.object(main, 'Sushy', autospec=True)
@@ -0,0 +1,223 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+import time
+from unittest import mock
+
+from sushy import batch
+from sushy import exceptions
+from sushy import main
+from sushy.tests.unit import base
+
+
+class BatchExecutorTestCase(base.TestCase):
+
+    def setUp(self):
+        super(BatchExecutorTestCase, self).setUp()
+        self.client_factory = mock.Mock(
+            side_effect=lambda target: mock.Mock(base_url=target.base_url))
+        self.targets = [
+            batch.BatchTarget('https://bmc%d' % (i % 3), username='admin',
+                              system_id=str(i))
+            for i in range(9)
+        ]
+
+    def test_run(self):
+        executor = batch.BatchExecutor(max_workers=4,
+                                       client_factory=self.client_factory)
+
+        results = executor.run(
+            self.targets,
+            lambda client, target: (client.base_url, target.system_id))
+
+        self.assertEqual(
+            [('https://bmc%d' % (i % 3), str(i)) for i in range(9)],
+            [r.result for r in results])
+        self.assertTrue(all(r.succeeded for r in results))
+        self.assertEqual(self.targets, [r.target for r in results])
+        for result in results:
+            self.assertIsNotNone(result.started_at)
+            self.assertGreaterEqual(result.duration, 0)
+        # one client per host
+        self.assertEqual(3, self.client_factory.call_count)
+
+    def test_run_reuses_clients(self):
+        executor = batch.BatchExecutor(client_factory=self.client_factory)
+
+        executor.run(self.targets, mock.Mock())
+        executor.run(self.targets, mock.Mock())
+        self.assertEqual(3, self.client_factory.call_count)
+
+        executor.close()
+        executor.run(self.targets[:1], mock.Mock())
+        self.assertEqual(4, self.client_factory.call_count)
+
+    def test_run_other_credentials(self):
+        executor = batch.BatchExecutor(client_factory=self.client_factory)
+        targets = [batch.BatchTarget('https://bmc0', username='admin',
+                                     password=password)
+                   for password in ('secret', 'other', 'secret')]
+
+        results = executor.run(targets, lambda client, target: client)
+
+        self.assertEqual(2, self.client_factory.call_count)
+        self.assertIsNot(results[0].result, results[1].result)
+        self.assertIs(results[0].result, results[2].result)
+        self.assertNotIn('secret', repr(targets[0].host_key))
+
+    def test_close(self):
+        executor = batch.BatchExecutor(client_factory=self.client_factory)
+        executor.run(self.targets, mock.Mock())
+        clients = [host['client'] for host in executor._hosts.values()]
+        clients[0].close.side_effect = exceptions.ConnectionError(
+            url='https://bmc0', error='boom')
+
+        with mock.patch.object(batch, 'LOG', autospec=True) as mock_log:
+            executor.close()
+
+        for client in clients:
+            client.close.assert_called_once_with()
+        self.assertTrue(mock_log.warning.called)
+        self.assertEqual({}, executor._hosts)
+
+    def test_close_context(self):
+        with batch.BatchExecutor(
+                client_factory=self.client_factory) as executor:
+            executor.run(self.targets[:1], mock.Mock())
+            client = executor._hosts[self.targets[0].host_key]['client']
+
+        client.close.assert_called_once_with()
+
+    def test_run_errors(self):
+        error = exceptions.ConnectionError(url='https://bmc1', error='boom')
+
+        def _operation(client, target):
+            if client.base_url == 'https://bmc1':
+                raise error
+            return 42
+
+        results = batch.BatchExecutor(
+            client_factory=self.client_factory).run(self.targets, _operation)
+
+        for result in results:
+            if result.target.base_url == 'https://bmc1':
+                self.assertFalse(result.succeeded)
+                self.assertIs(error, result.error)
+                self.assertIsNone(result.result)
+            else:
+                self.assertTrue(result.succeeded)
+                self.assertEqual(42, result.result)
+
+    def test_run_connection_error(self):
+        self.client_factory.side_effect = exceptions.AccessError(
+            'POST', 'https://bmc', mock.MagicMock())
+        operation = mock.Mock()
+
+        results = batch.BatchExecutor(
+            client_factory=self.client_factory).run(self.targets, operation)
+
+        self.assertFalse(any(r.succeeded for r in results))
+        operation.assert_not_called()
+
+    def test_run_concurrency_limits(self):
+        lock = threading.Lock()
+        running = {}
+        peaks = {'global': 0}
+
+        def _operation(client, target):
+            with lock:
+                running[target.base_url] = running.get(target.base_url, 0) + 1
+                peaks[target.base_url] = max(peaks.get(target.base_url, 0),
+                                             running[target.base_url])
+                peaks['global'] = max(peaks['global'], sum(running.values()))
+            time.sleep(0.01)
+            with lock:
+                running[target.base_url] -= 1
+
+        executor = batch.BatchExecutor(max_workers=2, max_per_host=2,
+                                       client_factory=self.client_factory)
+        executor.run(self.targets * 2, _operation)
+
+        self.assertLessEqual(peaks.pop('global'), 2)
+        for peak in peaks.values():
+            self.assertLessEqual(peak, 2)
+
+    def test_run_per_host_serialized(self):
+        lock = threading.Lock()
+        running = set()
+        overlaps = []
+
+        def _operation(client, target):
+            with lock:
+                if target.base_url in running:
+                    overlaps.append(target)
+                running.add(target.base_url)
+            time.sleep(0.005)
+            with lock:
+                running.discard(target.base_url)
+
+        batch.BatchExecutor(max_workers=8, client_factory=self.client_factory
+                            ).run(self.targets, _operation)
+
+        self.assertEqual([], overlaps)
+
+    @mock.patch.object(batch.time, 'sleep', autospec=True)
+    def test_run_rate_limit(self, mock_sleep):
+        executor = batch.BatchExecutor(max_workers=1, max_rate=10,
+                                       client_factory=self.client_factory)
+
+        executor.run(self.targets[:3], mock.Mock())
+
+        self.assertEqual(2, mock_sleep.call_count)
+        for call in mock_sleep.call_args_list:
+            self.assertLessEqual(call[0][0], 0.2)
+
+    def test_run_empty(self):
+        self.assertEqual([], batch.BatchExecutor().run([], mock.Mock()))
+
+    def test_invalid_limits(self):
+        self.assertRaises(ValueError, batch.BatchExecutor, max_workers=0)
+        self.assertRaises(ValueError, batch.BatchExecutor, max_per_host=0)
+
+    @mock.patch.object(main, 'Sushy', autospec=True)
+    def test_default_client_factory(self, mock_sushy):
+        target = batch.BatchTarget('https://bmc', username='admin',
+                                   password='secret', verify=False,
+                                   language='fr')
+
+        results = batch.BatchExecutor().run([target], mock.Mock())
+
+        self.assertTrue(results[0].succeeded)
+        mock_sushy.assert_called_once_with(
+            'https://bmc', username='admin', password='secret', verify=False,
+            language='fr')
+
+    def test_reset_system(self):
+        client = mock.Mock()
+
+        batch.reset_system('ForceOff')(client, self.targets[1])
+
+        client.get_system.assert_called_once_with('1')
+        client.get_system.return_value.reset_system.assert_called_once_with(
+            'ForceOff')
+
+    def test_set_system_boot_options(self):
+        client = mock.Mock()
+
+        batch.set_system_boot_options(target='Pxe', enabled='Once')(
+            client, self.targets[2])
+
+        client.get_system.assert_called_once_with('2')
+        system = client.get_system.return_value
+        system.set_system_boot_options.assert_called_once_with(
+            target='Pxe', enabled='Once')
@@ -154,6 +154,16 @@ class ConnectorMethodsTestCase(base.TestCase):
         self.conn.close()
         session.close.assert_called_once_with()
 
+    def test_init_connection_close_by_default(self):
+        self.assertEqual('close', self.conn._session.headers['Connection'])
+
+    def test_init_keep_alive(self):
+        conn = connector.Connector('http://foo.bar:1234', keep_alive=True,
+                                   keep_alive_pool_size=2)
+        self.assertNotEqual('close', conn._session.headers['Connection'])
+        adapter = conn._session.get_adapter('https://foo.bar:1234')
+        self.assertEqual(2, adapter._pool_maxsize)
+
 
 class ConnectorOpTestCase(base.TestCase):
 
@@ -180,6 +190,13 @@ class ConnectorOpTestCase(base.TestCase):
             'GET', 'http://foo.bar:1234/fake/path',
             headers=self.headers, json=None, verify=True, timeout=60)
 
+    def test_write_count(self):
+        self.conn._op('GET', path='fake/path')
+        self.assertEqual(0, self.conn.write_count)
+        self.conn._op('PATCH', path='fake/path', data={'Foo': 'bar'})
+        self.conn._op('POST', path='fake/path', data={'Foo': 'bar'})
+        self.assertEqual(2, self.conn.write_count)
+
     def test_ok_get_with_headers(self):
         self.conn._op('GET', path='fake/path', headers={'answer': '42'})
         self.request.assert_called_once_with(
@@ -395,6 +412,60 @@ class ConnectorOpTestCase(base.TestCase):
         self.request.side_effect = requests.exceptions.ConnectionError
         self.assertRaises(exceptions.ConnectionError, self.conn._op, 'GET')
 
+    def _connection_reset(self):
+        return requests.exceptions.ConnectionError(
+            ConnectionResetError(104, 'Connection reset by peer'))
+
+    def test_keep_alive_connection_reset_fallback(self):
+        self.conn._keep_alive = True
+        self.session.headers = {}
+        self.request.side_effect = [self._connection_reset(),
+                                    mock.Mock(status_code=http_client.OK)]
+
+        response = self.conn._op('GET', path='fake/path')
+
+        self.assertEqual(http_client.OK, response.status_code)
+        self.assertEqual(2, self.request.call_count)
+        self.assertFalse(self.conn._keep_alive)
+        self.assertEqual('close', self.session.headers['Connection'])
+        self.session.close.assert_called_once_with()
+
+    def test_keep_alive_connection_reset_not_idempotent(self):
+        self.conn._keep_alive = True
+        self.session.headers = {}
+        self.request.side_effect = self._connection_reset()
+
+        self.assertRaises(exceptions.ConnectionError, self.conn._op, 'POST',
+                          path='fake/path', data=self.data)
+        self.assertEqual(1, self.request.call_count)
+        self.assertFalse(self.conn._keep_alive)
+
+    def test_connection_reset_without_keep_alive(self):
+        self.request.side_effect = self._connection_reset()
+
+        self.assertRaises(exceptions.ConnectionError, self.conn._op, 'GET')
+        self.assertEqual(1, self.request.call_count)
+
+    def test_keep_alive_max_requests(self):
+        self.conn._keep_alive = True
+        self.conn._keep_alive_max_requests = 2
+
+        for _ in range(5):
+            self.conn._op('GET', path='fake/path')
+
+        self.assertEqual(2, self.session.close.call_count)
+
+    @mock.patch.object(connector.time, 'monotonic', autospec=True)
+    def test_keep_alive_idle_timeout(self, mock_monotonic):
+        self.conn._keep_alive = True
+        self.conn._keep_alive_idle_timeout = 30
+        mock_monotonic.side_effect = [100, 120, 200]
+
+        for _ in range(3):
+            self.conn._op('GET', path='fake/path')
+
+        self.session.close.assert_called_once_with()
+
     def test_unknown_http_error(self):
         self.request.return_value.status_code = http_client.CONFLICT
         self.request.return_value.json.side_effect = ValueError('no json')
@@ -905,3 +976,61 @@ class ConnectorOpTestCase(base.TestCase):
                           'PATCH', target_uri, data,
                           self.headers,
                           blocking=False, timeout=60)
+
+
+class ConnectorRegistryTestCase(base.TestCase):
+
+    def setUp(self):
+        super(ConnectorRegistryTestCase, self).setUp()
+        self.registry = connector.ConnectorRegistry()
+        self.conn = mock.Mock()
+        self.auth = mock.Mock()
+        self.create = mock.Mock(return_value=(self.conn, self.auth))
+
+    def test_acquire_shares_entries(self):
+        entry = self.registry.acquire('key', self.create)
+        self.assertIs(entry, self.registry.acquire('key', self.create))
+        self.create.assert_called_once_with()
+        self.assertIs(self.conn, entry.connector)
+        self.assertIs(self.auth, entry.auth)
+        self.assertFalse(entry.authenticated)
+        self.assertEqual(2, entry.references)
+        self.assertEqual(1, len(self.registry))
+
+    def test_acquire_different_keys(self):
+        self.registry.acquire('key1', self.create)
+        self.registry.acquire('key2', self.create)
+        self.assertEqual(2, self.create.call_count)
+        self.assertEqual(2, len(self.registry))
+
+    def test_release(self):
+        self.registry.acquire('key', self.create)
+        self.registry.acquire('key', self.create)
+
+        self.registry.release('key')
+        self.assertEqual(1, len(self.registry))
+        self.assertFalse(self.auth.close.called)
+        self.assertFalse(self.conn.close.called)
+
+        self.registry.release('key')
+        self.assertEqual(0, len(self.registry))
+        self.auth.close.assert_called_once_with()
+        self.conn.close.assert_called_once_with()
+
+        entry = self.registry.acquire('key', self.create)
+        self.assertEqual(2, self.create.call_count)
+        self.assertEqual(1, entry.references)
+
+    @mock.patch.object(connector, 'LOG', autospec=True)
+    def test_release_auth_close_fails(self, mock_log):
+        self.auth.close.side_effect = exceptions.ConnectionError(
+            url='http://foo.bar', error='boom')
+        self.registry.acquire('key', self.create)
+
+        self.registry.release('key')
+        self.assertTrue(mock_log.warning.called)
+        self.conn.close.assert_called_once_with()
+
+    def test_release_unknown(self):
+        self.registry.release('key')
+        self.assertEqual(0, len(self.registry))
@@ -0,0 +1,182 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import collections
+import json
+import threading
+import time
+
+from sushy import exceptions
+from sushy import inventory
+from sushy import snapshot
+from sushy.tests.unit import base
+
+SYSTEM_PATH = '/redfish/v1/Systems/437XR1138R2'
+
+DOCUMENTS = {
+    '/redfish/v1/': 'root.json',
+    '/redfish/v1/Systems': 'system_collection.json',
+    SYSTEM_PATH: 'system.json',
+    SYSTEM_PATH + '/Bios': 'bios.json',
+    SYSTEM_PATH + '/Processors': 'processor_collection.json',
+    SYSTEM_PATH + '/Processors/CPU1': 'processor.json',
+    SYSTEM_PATH + '/Processors/CPU2': 'processor2.json',
+    '/redfish/v1/Chassis': 'chassis_collection.json',
+    '/redfish/v1/Chassis/Blade1': 'chassis.json',
+    '/redfish/v1/Managers': 'manager_collection.json',
+    '/redfish/v1/Managers/BMC': 'manager.json',
+}
+
+
+class CountingConnector(snapshot.SnapshotConnector):
+
+    def __init__(self, snapshot, delay=0):
+        super(CountingConnector, self).__init__(snapshot)
+        self.delay = delay
+        self.requests = collections.Counter()
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def get(self, path='', *args, **kwargs):
+        with self._lock:
+            self.requests[path] += 1
+            self.running += 1
+            self.max_running = max(self.running, self.max_running)
+        try:
+            time.sleep(self.delay)
+            return super(CountingConnector, self).get(path, *args, **kwargs)
+        finally:
+            with self._lock:
+                self.running -= 1
+
+
+class InventoryCrawlerTestCase(base.TestCase):
+
+    def setUp(self):
+        super(InventoryCrawlerTestCase, self).setUp()
+        self.documents = {}
+        for path, file_name in DOCUMENTS.items():
+            with open('sushy/tests/unit/json_samples/' + file_name) as f:
+                self.documents[path] = json.load(f)
+
+    def _get_root(self, documents=None, delay=0):
+        root = snapshot.Snapshot(documents or self.documents).restore()
+        root._conn = CountingConnector(snapshot.Snapshot(
+            documents or self.documents), delay=delay)
+        return root
+
+    def test_crawl(self):
+        root = self._get_root()
+        crawler = inventory.InventoryCrawler(max_workers=1, max_per_host=1)
+
+        items = list(crawler.crawl([root]))
+
+        found = {item.path: item for item in items if item.error is None}
+        self.assertEqual(
+            {'/redfish/v1/Systems', SYSTEM_PATH, SYSTEM_PATH + '/Bios',
+             SYSTEM_PATH + '/Processors', SYSTEM_PATH + '/Processors/CPU1',
+             SYSTEM_PATH + '/Processors/CPU2', '/redfish/v1/Chassis',
+             '/redfish/v1/Chassis/Blade1', '/redfish/v1/Managers',
+             '/redfish/v1/Managers/BMC'}, set(found))
+        self.assertEqual('Processor',
+                         found[SYSTEM_PATH + '/Processors/CPU1'].resource_type)
+        self.assertIs(root, found[SYSTEM_PATH].root)
+        self.assertEqual(self.documents[SYSTEM_PATH],
+                         found[SYSTEM_PATH].json)
+        # every resource is requested once, even when linked several times
+        self.assertEqual({1}, set(root._conn.requests.values()))
+        self.assertEqual(len(items), len(root._conn.requests))
+
+    def test_crawl_breadth_first(self):
+        root = self._get_root()
+        crawler = inventory.InventoryCrawler(max_workers=1, max_per_host=1)
+
+        paths = [item.path for item in crawler.crawl([root])]
+
+        self.assertEqual(['/redfish/v1/Systems', '/redfish/v1/Chassis',
+                          '/redfish/v1/Managers'], paths[:3])
+        self.assertLess(paths.index(SYSTEM_PATH),
+                        paths.index(SYSTEM_PATH + '/Processors'))
+        self.assertLess(paths.index(SYSTEM_PATH + '/Processors'),
+                        paths.index(SYSTEM_PATH + '/Processors/CPU1'))
+
+    def test_crawl_errors(self):
+        root = self._get_root()
+        crawler = inventory.InventoryCrawler()
+
+        errors = {item.path: item for item in crawler.crawl([root])
+                  if item.error is not None}
+
+        self.assertIn('/redfish/v1/Chassis/Blade2', errors)
+        item = errors['/redfish/v1/Chassis/Blade2']
+        self.assertIsInstance(item.error, exceptions.ResourceNotFoundError)
+        self.assertIsNone(item.json)
+        self.assertIsNone(item.resource_type)
+
+    def test_crawl_start_exclude(self):
+        root = self._get_root()
+        crawler = inventory.InventoryCrawler(start=('Systems',),
+                                             exclude=('Processors',))
+
+        paths = {item.path for item in crawler.crawl([root])}
+
+        self.assertIn(SYSTEM_PATH + '/Bios', paths)
+        self.assertNotIn('/redfish/v1/Managers/BMC', paths)
+        self.assertNotIn(SYSTEM_PATH + '/Processors', paths)
+        self.assertNotIn(SYSTEM_PATH + '/Processors/CPU1', paths)
+
+    def test_crawl_expanded(self):
+        documents = dict(self.documents)
+        collection = dict(documents[SYSTEM_PATH + '/Processors'])
+        collection['Members'] = [
+            documents[SYSTEM_PATH + '/Processors/CPU1'],
+            documents[SYSTEM_PATH + '/Processors/CPU2']]
+        documents[SYSTEM_PATH + '/Processors'] = collection
+        root = self._get_root(documents)
+        crawler = inventory.InventoryCrawler()
+
+        items = {item.path: item for item in crawler.crawl([root])}
+
+        self.assertEqual('Processor',
+                         items[SYSTEM_PATH + '/Processors/CPU2'].resource_type)
+        self.assertNotIn(SYSTEM_PATH + '/Processors/CPU1',
+                         root._conn.requests)
+        self.assertNotIn(SYSTEM_PATH + '/Processors/CPU2',
+                         root._conn.requests)
+
+    def test_crawl_concurrency(self):
+        roots = [self._get_root(delay=0.01) for _i in range(3)]
+        crawler = inventory.InventoryCrawler(max_workers=4, max_per_host=2)
+
+        items = list(crawler.crawl(roots))
+
+        for root in roots:
+            self.assertLessEqual(root._conn.max_running, 2)
+            self.assertEqual(
+                len(root._conn.requests),
+                len([item for item in items if item.root is root]))
+        self.assertEqual(2, max(root._conn.max_running for root in roots))
+
+    def test_crawl_stop(self):
+        root = self._get_root()
+        crawler = inventory.InventoryCrawler(max_workers=1, max_per_host=1)
+
+        crawl = crawler.crawl([root])
+        self.assertEqual('/redfish/v1/Systems', next(crawl).path)
+        crawl.close()
+
+        self.assertLess(len(root._conn.requests), 3)
+
+    def test_invalid_limits(self):
+        self.assertRaises(ValueError, inventory.InventoryCrawler,
+                          max_per_host=0)
@@ -13,8 +13,11 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import gc
 import json
+import os
 from unittest import mock
+import weakref
 
 from sushy import auth
 from sushy import connector
@@ -25,7 +28,10 @@ from sushy.resources.compositionservice import compositionservice
 from sushy.resources.eventservice import eventservice
 from sushy.resources.fabric import fabric
 from sushy.resources.manager import manager
+from sushy.resources.registry import attribute_registry
 from sushy.resources.registry import message_registry_file
+from sushy.resources.registry import registry_cache
+from sushy.resources.registry import registry_index
 from sushy.resources.sessionservice import session
 from sushy.resources.sessionservice import sessionservice
 from sushy.resources.system import system
@@ -41,6 +47,14 @@ class MainTestCase(base.TestCase):
     @mock.patch.object(sessionservice, 'SessionService', autospec=True)
     def setUp(self, mock_session_service, mock_connector, mock_auth):
         super(MainTestCase, self).setUp()
+        interned = mock.patch.object(registry_cache, '_interned',
+                                     weakref.WeakValueDictionary())
+        interned.start()
+        self.addCleanup(interned.stop)
+        attribute_files = mock.patch.object(main, '_attribute_registry_files',
+                                            set())
+        attribute_files.start()
+        self.addCleanup(attribute_files.stop)
         self.conn = mock.Mock()
         self.sess_serv = mock.Mock()
         self.sess_serv.create_session.return_value = (None, None)
@@ -81,6 +95,38 @@ class MainTestCase(base.TestCase):
         self.assertEqual('/redfish/v1/CompositionService',
                          self.root._composition_service_path)
 
+    def test__select_supported(self):
+        self.assertFalse(self.root._select_supported)
+        self.root.protocol_features_supported.select_query = True
+        self.assertTrue(self.root._select_supported)
+
+    def test__expand_query_disabled(self):
+        self.root.protocol_features_supported.expand_query = True
+        self.assertIsNone(self.root._expand_query)
+
+    def test__expand_query_not_supported(self):
+        self.root._expand_levels = 2
+        self.assertIsNone(self.root._expand_query)
+
+    def test__expand_query(self):
+        self.root._expand_levels = 3
+        self.root.protocol_features_supported.expand_query = {
+            'ExpandAll': True, 'Levels': True, 'Links': True,
+            'NoLinks': True, 'MaxLevels': 2}
+        self.assertEqual('$expand=.($levels=2)', self.root._expand_query)
+
+    def test__expand_query_no_levels(self):
+        self.root._expand_levels = 3
+        self.root.protocol_features_supported.expand_query = {
+            'Levels': False, 'NoLinks': True}
+        self.assertEqual('$expand=.', self.root._expand_query)
+
+    def test__expand_query_no_links_unsupported(self):
+        self.root._expand_levels = 3
+        self.root.protocol_features_supported.expand_query = {
+            'ExpandAll': True, 'Levels': True, 'NoLinks': False}
+        self.assertIsNone(self.root._expand_query)
+
     @mock.patch.object(connector, 'Connector', autospec=True)
     def test__init_throws_exception(self, mock_Connector):
         self.assertRaises(
@@ -461,6 +507,186 @@ class MainTestCase(base.TestCase):
         self.assertEqual(5, len(registries))
         self.assertIn('Base.1.3.0', {r.identity for r in registries})
 
+    def test__get_standard_message_registry_collection_lazy(self):
+        registries = self.root._get_standard_message_registry_collection()
+
+        registry = [r for r in registries if r.identity == 'Base.1.3.0'][0]
+        self.assertIsInstance(registry, main._StandardMessageRegistry)
+        self.assertNotIn('messages', vars(registry))
+        self.assertNotIn('Messages', registry.json)
+        self.assertEqual('Success',
+                         registry.messages['Success'].message[:7])
+        self.assertIn('Messages', registry.json)
+
+    @mock.patch.object(main, '_load_standard_registry_index', autospec=True)
+    def test__get_standard_message_registry_collection_no_index(
+            self, mock_load_index):
+        mock_load_index.return_value = {}
+
+        registries = self.root._get_standard_message_registry_collection()
+
+        self.assertEqual(5, len(registries))
+        mock_load_index.assert_called_once_with()
+        for registry in registries:
+            self.assertNotIsInstance(registry, main._StandardMessageRegistry)
+            self.assertIn('messages', vars(registry))
+
+    def test_standard_registry_index_up_to_date(self):
+        index = main._load_standard_registry_index()
+
+        registry_dir = os.path.join('sushy', main.STANDARD_REGISTRY_PATH)
+        self.assertEqual(sorted(os.listdir(registry_dir)), sorted(index))
+        for name, summary in index.items():
+            with open(os.path.join(registry_dir, name)) as f:
+                json_doc = json.load(f)
+                del json_doc['Messages']
+                self.assertEqual(
+                    json_doc, summary,
+                    'Run tools/build-standard-registries-index.py to update '
+                    '%s' % main.STANDARD_REGISTRY_INDEX)
+
+    def test__get_standard_message_registry_collection_interned(self):
+        registries = self.root._get_standard_message_registry_collection()
+        other = self.root._get_standard_message_registry_collection()
+
+        for registry, other_registry in zip(registries, other):
+            self.assertIs(registry, other_registry)
+
+    @mock.patch.object(main.Sushy, 'get_manager_collection', autospec=True)
+    @mock.patch.object(main.Sushy, 'get_system_collection', autospec=True)
+    def test__get_platform_identity(self, mock_systems, mock_managers):
+        mock_systems.return_value.get_members.return_value = [
+            mock.Mock(json={'Model': 'S2', 'BiosVersion': '2.1'}),
+            mock.Mock(json={'Model': 'S1', 'BiosVersion': '2.0'})]
+        mock_managers.return_value.get_members.return_value = [
+            mock.Mock(json={'Model': 'BMC', 'FirmwareVersion': '1.0'})]
+
+        self.assertEqual(
+            ('manager/BMC/1.0', 'system/S1/2.0', 'system/S2/2.1'),
+            self.root._get_platform_identity())
+        self.root._get_platform_identity()
+        mock_systems.assert_called_once_with(self.root)
+
+    @mock.patch.object(main.Sushy, 'get_manager_collection', autospec=True)
+    @mock.patch.object(main.Sushy, 'get_system_collection', autospec=True)
+    def test__get_platform_identity_unknown(self, mock_systems,
+                                            mock_managers):
+        mock_managers.side_effect = exceptions.MissingAttributeError(
+            attribute='Managers/@odata.id', resource='/redfish/v1/')
+
+        self.assertIsNone(self.root._get_platform_identity())
+        self.assertIsNone(self.root._get_platform_identity())
+        mock_managers.assert_called_once_with(self.root)
+
+    @mock.patch.object(main.Sushy, '_get_platform_identity', autospec=True)
+    def test__get_provided_registry_message_no_platform(self, mock_platform):
+        mock_msg_reg_file = mock.Mock(identity='Messages',
+                                      registry='RegistryB.1.0')
+
+        self.root._get_provided_registry(mock_msg_reg_file)
+
+        mock_platform.assert_not_called()
+        mock_msg_reg_file.get_attribute_registry.assert_not_called()
+
+    def test__get_provided_registry_interned(self):
+        mock_msg_reg = mock.Mock()
+        mock_msg_reg_file = mock.Mock(identity='Messages',
+                                      registry='RegistryB.1.0')
+        mock_msg_reg_file.get_message_registry.return_value = mock_msg_reg
+
+        self.assertIs(mock_msg_reg,
+                      self.root._get_provided_registry(mock_msg_reg_file))
+        self.assertIs(mock_msg_reg,
+                      self.root._get_provided_registry(mock_msg_reg_file))
+        mock_msg_reg_file.get_message_registry.assert_called_once_with(
+            'en', self.root._public_connector)
+
+        # another version of the service
+        self.root.redfish_version = '1.6.0'
+        self.root._get_provided_registry(mock_msg_reg_file)
+        self.assertEqual(
+            2, mock_msg_reg_file.get_message_registry.call_count)
+
+    @mock.patch.object(main.Sushy, '_get_platform_identity', autospec=True)
+    def test__get_provided_registry_attribute_platform(self, mock_platform):
+        mock_attr_reg = mock.Mock()
+        mock_reg_file = mock.Mock(identity='BiosAttributeRegistry',
+                                  registry='BiosAttributeRegistry.1.0')
+        mock_reg_file.get_message_registry.return_value = None
+        mock_reg_file.get_attribute_registry.return_value = mock_attr_reg
+        mock_platform.return_value = ('system/S1/1.0',)
+
+        self.assertIs(mock_attr_reg,
+                      self.root._get_provided_registry(mock_reg_file))
+        self.assertIs(mock_attr_reg,
+                      self.root._get_provided_registry(mock_reg_file))
+        self.assertEqual(
+            1, mock_reg_file.get_attribute_registry.call_count)
+        # known to be an attribute registry, not downloaded to check again
+        self.assertEqual(
+            1, mock_reg_file.get_message_registry.call_count)
+
+        # another model of the same vendor and product
+        mock_platform.return_value = ('system/S2/1.0',)
+        self.root._get_provided_registry(mock_reg_file)
+        self.assertEqual(
+            2, mock_reg_file.get_attribute_registry.call_count)
+
+    @mock.patch.object(main.Sushy, '_get_platform_identity', autospec=True)
+    def test__get_provided_registry_attribute_unknown_platform(
+            self, mock_platform):
+        mock_reg_file = mock.Mock(identity='BiosAttributeRegistry',
+                                  registry='BiosAttributeRegistry.1.0')
+        mock_reg_file.get_message_registry.return_value = None
+        mock_attr_reg = mock_reg_file.get_attribute_registry.return_value
+        mock_platform.return_value = None
+
+        self.assertIs(mock_attr_reg,
+                      self.root._get_provided_registry(mock_reg_file))
+        self.root._get_provided_registry(mock_reg_file)
+        self.assertEqual(
+            2, mock_reg_file.get_attribute_registry.call_count)
+        self.assertEqual(0, len(registry_cache._interned))
+
+    @mock.patch.object(main.Sushy, '_get_platform_identity', autospec=True)
+    def test__get_provided_registry_detached(self, mock_platform):
+        mock_platform.return_value = ('system/S1/1.0',)
+        with open('sushy/tests/unit/json_samples/'
+                  'bios_attribute_registry.json') as f:
+            json_doc = json.load(f)
+        other_conn = mock.Mock()
+        registry = attribute_registry.AttributeRegistry(
+            other_conn, '/redfish/v1/Registries/BiosAttributeRegistry.json',
+            json_doc=json_doc, redfish_version='1.0.2')
+        mock_reg_file = mock.Mock(identity='BiosAttributeRegistry',
+                                  registry='BiosAttributeRegistry.1.0')
+        mock_reg_file.get_message_registry.return_value = None
+        mock_reg_file.get_attribute_registry.return_value = registry
+
+        shared = self.root._get_provided_registry(mock_reg_file)
+
+        self.assertIsInstance(shared, attribute_registry.AttributeRegistry)
+        self.assertIsNot(registry, shared)
+        self.assertIsNone(shared._conn)
+        self.assertEqual(registry.path, shared.path)
+        self.assertEqual(registry.json, shared.json)
+        self.assertEqual(registry.identity, shared.identity)
+        other_conn.get.assert_not_called()
+
+    def test__get_provided_registry_interned_released(self):
+        mock_msg_reg_file = mock.Mock(identity='Messages',
+                                      registry='RegistryB.1.0')
+        mock_msg_reg_file.get_message_registry.return_value = mock.Mock()
+
+        self.root._get_provided_registry(mock_msg_reg_file)
+        mock_msg_reg_file.get_message_registry.return_value = None
+        gc.collect()
+
+        self.assertEqual(0, len(registry_cache._interned))
+        self.root._get_provided_registry(mock_msg_reg_file)
+        self.assertEqual(
+            2, mock_msg_reg_file.get_message_registry.call_count)
+
     @mock.patch('sushy.Sushy._get_standard_message_registry_collection',
                 autospec=True)
     @mock.patch('sushy.Sushy._get_registry_collection', autospec=True)
@@ -484,6 +710,9 @@ class MainTestCase(base.TestCase):
         self.assertEqual({'RegistryA.2.0': mock_msg_reg1,
                           'RegistryB.1.0': mock_msg_reg2,
                           'Messages': mock_msg_reg2}, registries)
+        self.assertIsInstance(registries, registry_index.RegistryDict)
+        self.assertIs(registries.registry_index,
+                      self.root.lazy_registries.registry_index)
 
     @mock.patch('sushy.Sushy._get_standard_message_registry_collection',
                 autospec=True)
@@ -558,6 +787,117 @@ class MainTestCase(base.TestCase):
             self.root.redfish_version, self.root.lazy_registries)
 
 
+class SharedConnectionTestCase(base.TestCase):
+
+    def setUp(self):
+        super(SharedConnectionTestCase, self).setUp()
+        registry = mock.patch.object(connector, 'shared_connectors',
+                                     connector.ConnectorRegistry())
+        self.registry = registry.start()
+        self.addCleanup(registry.stop)
+        connector_patch = mock.patch.object(connector, 'Connector',
+                                            autospec=True)
+        self.mock_connector = connector_patch.start()
+        self.addCleanup(connector_patch.stop)
+        auth_patch = mock.patch.object(auth, 'SessionOrBasicAuth',
+                                       autospec=True)
+        self.mock_auth = auth_patch.start()
+        self.addCleanup(auth_patch.stop)
+
+        with open('sushy/tests/unit/json_samples/root.json') as f:
+            self.mock_connector.return_value.get.return_value.json\
+                .return_value = json.load(f)
+
+    def _create(self, **kwargs):
+        kwargs.setdefault('username', 'admin')
+        kwargs.setdefault('password', 'secret')
+        return main.Sushy('http://foo.bar:1234', share_connection=True,
+                          **kwargs)
+
+    def test_share(self):
+        root1 = self._create()
+        root2 = self._create()
+
+        self.mock_connector.assert_called_once_with(
+            'http://foo.bar:1234', verify=True, server_side_retries=10,
+            server_side_retries_delay=3)
+        self.mock_auth.assert_called_once_with(username='admin',
+                                               password='secret',
+                                               session_store=None)
+        self.assertIs(root1._conn, root2._conn)
+        self.assertIs(root1._auth, root2._auth)
+        self.mock_auth.return_value.authenticate.assert_called_once_with()
+        self.assertEqual(1, len(self.registry))
+
+    def test_not_shared_different_credentials(self):
+        roots = [self._create(), self._create(password='other'),
+                 self._create(verify=False)]
+
+        self.assertEqual(3, self.mock_connector.call_count)
+        self.assertEqual(3, self.mock_auth.call_count)
+        self.assertEqual(3, len(self.registry))
+        self.assertEqual(3, len(roots))
+
+    def test_share_auth_object(self):
+        mock_auth = mock.MagicMock()
+        root1 = self._create(auth=mock_auth, username=None, password=None)
+        root2 = self._create(auth=mock_auth, username=None, password=None)
+
+        self.assertIs(root1._conn, root2._conn)
+        self.assertIs(mock_auth, root2._auth)
+        mock_auth.authenticate.assert_called_once_with()
+        self.assertFalse(self.mock_auth.called)
+
+    def test_not_shared_with_connector(self):
+        mock_conn = self.mock_connector.return_value
+        self._create(connector=mock_conn)
+
+        self.assertEqual(0, len(self.registry))
+        self.assertFalse(self.mock_connector.called)
+
+    def test_close(self):
+        root1 = self._create()
+        root2 = self._create()
+        mock_auth = root1._auth
+
+        root1.close()
+        self.assertFalse(mock_auth.close.called)
+        self.assertIsNone(root1._auth)
+        self.assertEqual(1, len(self.registry))
+        # The session is refreshed with the remaining Sushy object
+        root, conn = mock_auth.set_context.call_args[0]
+        self.assertEqual(root2.identity, root.identity)
+
+        root2.close()
+        mock_auth.close.assert_called_once_with()
+        self.mock_connector.return_value.close.assert_called_once_with()
+        self.assertEqual(0, len(self.registry))
+
+        root2.close()
+        mock_auth.close.assert_called_once_with()
+
+    def test_released_when_collected(self):
+        root = self._create()
+        mock_auth = root._auth
+
+        del root
+        gc.collect()
+        mock_auth.close.assert_called_once_with()
+        self.assertEqual(0, len(self.registry))
+
+    def test_authentication_failure(self):
+        self.mock_auth.return_value.authenticate.side_effect = (
+            exceptions.AccessError(method='POST', url='http://foo.bar:1234',
+                                   response=mock.MagicMock()))
+        self.assertRaises(exceptions.AccessError, self._create)
+        self.assertEqual(0, len(self.registry))
+
+        self.mock_auth.return_value.authenticate.side_effect = None
+        root = self._create()
+        self.assertEqual(1, len(self.registry))
+        self.assertIsNotNone(root._auth)
+
+
 class BareMinimumMainTestCase(base.TestCase):
 
     def setUp(self):
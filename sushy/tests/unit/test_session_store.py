@@ -0,0 +1,168 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import hashlib
+import json
+import os
+import stat
+from unittest import mock
+
+import fixtures
+
+from sushy import session_store
+from sushy.tests.unit import base
+
+
+class GetSessionKeyTestCase(base.TestCase):
+
+    def test_get_session_key(self):
+        key = session_store.get_session_key('http://foo.bar', 'admin',
+                                            'secret')
+        self.assertEqual('http://foo.bar', key[0])
+        self.assertEqual('admin', key[1])
+        self.assertNotIn('secret', key[2])
+        self.assertNotEqual(
+            key, session_store.get_session_key('http://foo.bar', 'admin',
+                                               'other'))
+
+
+class MemorySessionStoreTestCase(base.TestCase):
+
+    def setUp(self):
+        super(MemorySessionStoreTestCase, self).setUp()
+        self.store = session_store.MemorySessionStore()
+        self.key = ('http://foo.bar', 'admin', 'digest')
+
+    def test_get_missing(self):
+        self.assertIsNone(self.store.get(self.key))
+
+    def test_put_get(self):
+        self.store.put(self.key, 'token', '/redfish/v1/Sessions/1')
+        self.assertEqual(('token', '/redfish/v1/Sessions/1'),
+                         self.store.get(self.key))
+
+    def test_delete(self):
+        self.store.put(self.key, 'token', '/redfish/v1/Sessions/1')
+        self.store.delete(self.key, token='other')
+        self.assertIsNotNone(self.store.get(self.key))
+        self.store.delete(self.key, token='token')
+        self.assertIsNone(self.store.get(self.key))
+        self.store.delete(self.key)
+
+    @mock.patch.object(session_store.time, 'time', autospec=True)
+    def test_max_age(self, mock_time):
+        store = session_store.MemorySessionStore(max_age=60)
+        mock_time.return_value = 1000
+        store.put(self.key, 'token', '/redfish/v1/Sessions/1')
+        mock_time.return_value = 1060
+        self.assertIsNotNone(store.get(self.key))
+        mock_time.return_value = 1061
+        self.assertIsNone(store.get(self.key))
+
+
+class FileSessionStoreTestCase(base.TestCase):
+
+    def setUp(self):
+        super(FileSessionStoreTestCase, self).setUp()
+        self.directory = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'sessions')
+        self.store = session_store.FileSessionStore(self.directory)
+        self.key = ('http://foo.bar', 'admin', 'digest')
+
+    def _get_file_name(self):
+        files = [name for name in os.listdir(self.directory)
+                 if name.endswith('.json')]
+        self.assertEqual(1, len(files))
+        return files[0]
+
+    def test_get_missing(self):
+        self.assertIsNone(self.store.get(self.key))
+        self.assertFalse(os.path.exists(self.directory))
+
+    def test_put_get(self):
+        self.store.put(self.key, 'token', '/redfish/v1/Sessions/1')
+
+        store = session_store.FileSessionStore(self.directory)
+        self.assertEqual(('token', '/redfish/v1/Sessions/1'),
+                         store.get(self.key))
+        self.assertIsNone(store.get(('http://foo.bar', 'admin', 'other')))
+
+    def test_put_private(self):
+        self.store.put(self.key, 'token', '/redfish/v1/Sessions/1')
+
+        self.assertEqual(
+            0o700, stat.S_IMODE(os.stat(self.directory).st_mode))
+        self.assertEqual(['.secret', self._get_file_name()],
+                         sorted(os.listdir(self.directory)))
+        for name in os.listdir(self.directory):
+            self.assertEqual(0o600, stat.S_IMODE(
+                os.stat(os.path.join(self.directory, name)).st_mode))
+
+    def test_put_no_key(self):
+        self.store.put(self.key, 'token', '/redfish/v1/Sessions/1')
+
+        file_name = self._get_file_name()
+        self.assertNotIn(hashlib.sha256(
+            json.dumps(list(self.key)).encode('utf-8')).hexdigest(),
+            file_name)
+        with open(os.path.join(self.directory, file_name)) as fp:
+            content = fp.read()
+        self.assertNotIn('digest', content)
+        self.assertNotIn('admin', content)
+
+    def test_secret_per_store(self):
+        self.store.put(self.key, 'token', '/redfish/v1/Sessions/1')
+        other_directory = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'sessions')
+        other = session_store.FileSessionStore(other_directory)
+        other.put(self.key, 'token', '/redfish/v1/Sessions/1')
+
+        self.assertNotEqual(self._get_file_name(),
+                            [name for name in os.listdir(other_directory)
+                             if name.endswith('.json')][0])
+
+    def test_delete(self):
+        self.store.put(self.key, 'token', '/redfish/v1/Sessions/1')
+        self.store.delete(self.key, token='other')
+        self.assertIsNotNone(self.store.get(self.key))
+        self.store.delete(self.key, token='token')
+        self.assertIsNone(self.store.get(self.key))
+        self.store.delete(self.key)
+
+    @mock.patch.object(session_store.time, 'time', autospec=True)
+    def test_max_age(self, mock_time):
+        store = session_store.FileSessionStore(self.directory, max_age=60)
+        mock_time.return_value = 1000
+        store.put(self.key, 'token', '/redfish/v1/Sessions/1')
+        mock_time.return_value = 1061
+        self.assertIsNone(store.get(self.key))
+
+    @mock.patch.object(session_store, 'LOG', autospec=True)
+    def test_get_corrupted(self, mock_log):
+        self.store.put(self.key, 'token', '/redfish/v1/Sessions/1')
+        file_path = os.path.join(self.directory, self._get_file_name())
+        with open(file_path, 'w') as fp:
+            fp.write('{"broken')
+
+        self.assertIsNone(self.store.get(self.key))
+        self.assertTrue(mock_log.warning.called)
+
+    @mock.patch.object(session_store, 'LOG', autospec=True)
+    def test_put_fails(self, mock_log):
+        file_path = self.useFixture(fixtures.TempDir()).path + '/file'
+        with open(file_path, 'w') as fp:
+            fp.write('not a directory')
+        store = session_store.FileSessionStore(file_path)
+
+        store.put(self.key, 'token', '/redfish/v1/Sessions/1')
+        self.assertTrue(mock_log.warning.called)
+        self.assertIsNone(store.get(self.key))
@@ -0,0 +1,149 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import gzip
+import json
+import os
+from unittest import mock
+
+import fixtures
+
+from sushy import connector
+from sushy import exceptions
+from sushy import snapshot
+from sushy.tests.unit import base
+
+SYSTEM_PATH = '/redfish/v1/Systems/437XR1138R2'
+
+DOCUMENTS = {
+    '/redfish/v1/': 'root.json',
+    '/redfish/v1/Systems': 'system_collection.json',
+    SYSTEM_PATH: 'system.json',
+    SYSTEM_PATH + '/Bios': 'bios.json',
+    SYSTEM_PATH + '/Processors': 'processor_collection.json',
+    SYSTEM_PATH + '/Processors/CPU1': 'processor.json',
+    SYSTEM_PATH + '/Processors/CPU2': 'processor2.json',
+    '/redfish/v1/Chassis': 'chassis_collection.json',
+    '/redfish/v1/Chassis/Blade1': 'chassis.json',
+    '/redfish/v1/Managers': 'manager_collection.json',
+    '/redfish/v1/Managers/BMC': 'manager.json',
+}
+
+
+class SnapshotTestCase(base.TestCase):
+
+    def setUp(self):
+        super(SnapshotTestCase, self).setUp()
+        documents = {}
+        for path, file_name in DOCUMENTS.items():
+            with open('sushy/tests/unit/json_samples/' + file_name) as f:
+                documents[path] = json.load(f)
+        self.snapshot = snapshot.Snapshot(documents,
+                                          base_url='http://foo.bar:1234',
+                                          created_at=1234)
+        self.directory = self.useFixture(fixtures.TempDir()).path
+
+    @mock.patch.object(connector, 'Connector', autospec=True)
+    def test_restore(self, mock_connector):
+        root = self.snapshot.restore()
+
+        self.assertEqual('RootService', root.identity)
+        system = root.get_system(SYSTEM_PATH)
+        self.assertEqual('437XR1138R2', system.identity)
+        self.assertEqual('Uefi', system.bios.attributes['BootMode'])
+        self.assertEqual(2, len(system.processors.get_members()))
+        self.assertFalse(mock_connector.called)
+
+    def test_restore_missing(self):
+        root = self.snapshot.restore()
+        self.assertRaises(exceptions.ResourceNotFoundError,
+                          root.get_chassis, '/redfish/v1/Chassis/Blade2')
+
+    def test_restore_read_only(self):
+        bios = self.snapshot.restore().get_system(SYSTEM_PATH).bios
+        self.assertRaisesRegex(exceptions.ConnectionError, 'snapshot',
+                               bios.set_attribute, 'BootMode', 'Bios')
+
+    def test_get_document(self):
+        self.assertEqual(
+            '437XR1138R2',
+            self.snapshot.get_document(SYSTEM_PATH + '/')['Id'])
+        self.assertEqual(
+            'RootService',
+            self.snapshot.get_document('http://foo.bar:1234/redfish/v1')['Id'])
+        self.assertIsNone(self.snapshot.get_document('/redfish/v1/Fabrics'))
+
+    def test_create_snapshot(self):
+        root = self.snapshot.restore()
+
+        taken = snapshot.create_snapshot(root)
+
+        self.assertEqual(self.snapshot.documents, taken.documents)
+        self.assertEqual('http://foo.bar:1234', taken.base_url)
+        self.assertEqual('/redfish/v1/', taken.root_prefix)
+
+    def test_create_snapshot_extra_resources(self):
+        documents = dict(self.snapshot.documents)
+        documents['/redfish/v1/Managers/BMC/NICs'] = {
+            '@odata.id': '/redfish/v1/Managers/BMC/NICs',
+            'Name': 'Ethernet Interfaces',
+            'Members': []}
+        del documents['/redfish/v1/Chassis']
+        root = snapshot.Snapshot(documents).restore()
+        manager = root.get_manager('/redfish/v1/Managers/BMC')
+
+        taken = snapshot.create_snapshot(
+            root, resources=[manager.ethernet_interfaces])
+
+        self.assertIn('/redfish/v1/Managers/BMC/NICs',
+                      taken.documents)
+        self.assertNotIn('/redfish/v1/Chassis/Blade1', taken.documents)
+        self.assertIn(SYSTEM_PATH + '/Bios', taken.documents)
+
+    def test_create_snapshot_registries(self):
+        documents = dict(self.snapshot.documents)
+        for path, file_name in (
+                ('/redfish/v1/Registries',
+                 'message_registry_file_collection.json'),
+                ('/redfish/v1/Registries/Test', 'message_registry_file.json'),
+                ('/redfish/v1/Registries/Test/Test.1.0.json',
+                 'message_registry.json')):
+            with open('sushy/tests/unit/json_samples/' + file_name) as f:
+                documents[path] = json.load(f)
+        root = snapshot.Snapshot(documents).restore()
+
+        taken = snapshot.create_snapshot(root)
+
+        self.assertEqual(documents, taken.documents)
+        registries = taken.restore().registries
+        self.assertEqual('Test', registries['Test.1.0'].registry_prefix)
+        self.assertIn('Base.1.0', registries)
+
+    def test_dump_load(self):
+        path = os.path.join(self.directory, 'snapshot.json.gz')
+        self.snapshot.dump(path)
+
+        loaded = snapshot.Snapshot.load(path)
+
+        self.assertEqual(self.snapshot.documents, loaded.documents)
+        self.assertEqual('http://foo.bar:1234', loaded.base_url)
+        self.assertEqual(1234, loaded.created_at)
+        self.assertEqual('Uefi', loaded.restore().get_system(
+            SYSTEM_PATH).bios.attributes['BootMode'])
+
+    def test_load_invalid(self):
+        path = os.path.join(self.directory, 'snapshot.json.gz')
+        with gzip.open(path, 'wt') as fp:
+            json.dump({'version': 42, 'documents': {}}, fp)
+
+        self.assertRaisesRegex(ValueError, 'not a supported snapshot',
+                               snapshot.Snapshot.load, path)
@@ -11,8 +11,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent import futures
 from http import client as http_client
 import json
+import threading
 from unittest import mock
 
 import requests
@@ -172,6 +174,30 @@ class TaskMonitorTestCase(base.TestCase):
             'Fri, 31 Dec 1999 23:59:59 GMT'
         self.assertEqual(0, self.task_monitor.sleep_for)
 
+    def test_sleep_for_retry_after_digit_string(self):
+        self.task_monitor._response.headers["Retry-After"] = '7'
+        self.assertEqual(7, self.task_monitor.sleep_for)
+
+    @mock.patch.object(taskmonitor.parser, 'parse', autospec=True,
+                       side_effect=taskmonitor.parser.parse)
+    def test_sleep_for_retry_after_date_parsed_once(self, mock_parse):
+        self.task_monitor._response.headers["Retry-After"] =\
+            'Fri, 31 Dec 1999 23:59:59 GMT'
+        self.assertEqual(0, self.task_monitor.sleep_for)
+        self.assertEqual(0, self.task_monitor.sleep_for)
+        self.assertIsNotNone(self.task_monitor.retry_after)
+        mock_parse.assert_called_once_with('Fri, 31 Dec 1999 23:59:59 GMT')
+
+        self.task_monitor._response.headers["Retry-After"] = 3
+        self.assertEqual(3, self.task_monitor.sleep_for)
+
+    def test_retry_after(self):
+        self.assertEqual(20.0, self.task_monitor.retry_after)
+
+    def test_retry_after_empty(self):
+        self.task_monitor._response.headers["Retry-After"] = None
+        self.assertIsNone(self.task_monitor.retry_after)
+
     def test_not_cancellable_no_header(self):
         response = mock.Mock()
         response.status_code = http_client.ACCEPTED
@@ -260,6 +286,87 @@ class TaskMonitorTestCase(base.TestCase):
 
         self.assertRaises(exceptions.ConnectionError,
                           self.task_monitor.wait, -10)
+        self.assertEqual(1, self.conn.get.call_count)
+        mock_time.assert_not_called()
+
+    @mock.patch('time.sleep', autospec=True)
+    @mock.patch('time.time', autospec=True)
+    def test_wait_timeout_sleeps_until_deadline(self, mock_time, mock_sleep):
+        mock_time.side_effect = [100, 100, 108, 110]
+        response1 = mock.MagicMock(spec=requests.Response)
+        response1.status_code = http_client.ACCEPTED
+        response1.headers = {'Retry-After': 5}
+        response1.json.return_value = {'Id': 3, 'Name': 'Test'}
+        self.conn.get.side_effect = [response1, response1, response1]
+
+        self.assertRaises(exceptions.ConnectionError,
+                          self.task_monitor.wait, 10)
+
+        # one GET per poll, the last one at the deadline
+        self.assertEqual(3, self.conn.get.call_count)
+        mock_sleep.assert_has_calls([mock.call(5), mock.call(2)])
+
+    def test_wait_no_poll(self):
+        self.conn.reset_mock()
+        response1 = mock.MagicMock(spec=requests.Response)
+        response1.status_code = http_client.ACCEPTED
+        response1.headers = {'Retry-After': 1}
+        response1.json.return_value = {'Id': '545', 'Name': 'Test'}
+        response2 = mock.MagicMock(spec=requests.Response)
+        response2.status_code = http_client.OK
+        response2.headers = {}
+        self.conn.get.side_effect = [response1, response2]
+
+        def _deliver():
+            self.assertFalse(self.task_monitor.handle_event(
+                {'Events': [{'MessageId': 'TaskEvent.1.0.TaskStarted',
+                             'MessageArgs': ['545']}]}))
+            self.assertTrue(self.task_monitor.handle_event(
+                {'Events': [{'MessageId': 'TaskEvent.1.0.TaskCompletedOK',
+                             'MessageArgs': ['545']}]}))
+
+        timer = threading.Timer(0.05, _deliver)
+        timer.start()
+        self.addCleanup(timer.cancel)
+        self.task_monitor.wait(60, poll=False)
+
+        self.assertFalse(self.task_monitor.is_processing)
+        self.assertEqual(2, self.conn.get.call_count)
+
+    @mock.patch('time.sleep', autospec=True)
+    def test_wait_no_poll_timeout(self, mock_sleep):
+        self.conn.get.return_value = self.response
+
+        self.assertRaises(exceptions.ConnectionError,
+                          self.task_monitor.wait, 0.01, poll=False)
+        self.assertEqual(2, self.conn.get.call_count)
+        mock_sleep.assert_not_called()
+
+    def test_handle_event(self):
+        self.assertTrue(self.task_monitor.handle_event(
+            {'MessageId': 'TaskEvent.1.0.TaskAborted',
+             'OriginOfCondition': {'@odata.id': '/Task/545'}}))
+        self.assertTrue(self.task_monitor.handle_event(
+            {'Events': [{'MessageId': 'TaskEvent.1.0.TaskCompletedWarning',
+                         'OriginOfCondition': {
+                             '@odata.id': '/redfish/v1/TaskService/Tasks/545'
+                         }}]}))
+        self.assertTrue(self.task_monitor.handle_event(
+            {'Events': [{'MessageId': 'TaskCancelled',
+                         'MessageArgs': ['545']}]}))
+
+    def test_handle_event_other(self):
+        self.assertFalse(self.task_monitor.handle_event(
+            {'Events': [{'MessageId': 'TaskEvent.1.0.TaskCompletedOK',
+                         'MessageArgs': ['546']},
+                        {'MessageId': 'TaskEvent.1.0.TaskCompletedOK',
+                         'OriginOfCondition': {
+                             '@odata.id': '/redfish/v1/TaskService/Tasks/5'
+                         }},
+                        {'MessageId': 'TaskEvent.1.0.TaskProgressChanged',
+                         'MessageArgs': ['545']},
+                        'garbage']}))
+        self.assertFalse(self.task_monitor._task_ended.is_set())
 
     def test_from_response_no_content(self):
         self.conn.reset_mock()
@@ -322,3 +429,107 @@ class TaskMonitorTestCase(base.TestCase):
         self.assertEqual('/Task/545', tm.task_monitor_uri)
         self.assertIsNotNone(tm.task)
         self.assertEqual('545', tm.task.identity)
+
+
+class TaskPollSchedulerTestCase(base.TestCase):
+
+    def setUp(self):
+        super(TaskPollSchedulerTestCase, self).setUp()
+        self.scheduler = taskmonitor.TaskPollScheduler(
+            max_workers=2, min_interval=0.01, max_interval=0.04, jitter=0)
+        self.addCleanup(self.scheduler.shutdown)
+
+    def _monitor(self, processing, retry_after=None):
+        monitor = mock.Mock(spec=taskmonitor.TaskMonitor,
+                            task_monitor_uri='/taskmon/1',
+                            retry_after=retry_after)
+        check = mock.PropertyMock(side_effect=processing)
+        type(monitor).check_is_processing = check
+        return monitor, check
+
+    def test_submit(self):
+        monitor, check = self._monitor([True, True, False])
+        other, other_check = self._monitor([False])
+
+        future = self.scheduler.submit(monitor)
+        other_future = self.scheduler.submit(other, timeout_sec=10)
+
+        self.assertIs(monitor, future.result(timeout=10))
+        self.assertIs(other, other_future.result(timeout=10))
+        self.assertEqual(3, check.call_count)
+        self.assertEqual(1, other_check.call_count)
+
+    def test_submit_timeout(self):
+        monitor, check = self._monitor(lambda: True)
+        monitor._timeout_error.return_value = exceptions.ConnectionError(
+            url='/taskmon/1', error='timeout')
+
+        future = self.scheduler.submit(monitor, timeout_sec=0.05)
+
+        self.assertRaises(exceptions.ConnectionError, future.result,
+                          timeout=10)
+        self.assertGreater(check.call_count, 1)
+        monitor._timeout_error.assert_called_once_with(0.05)
+
+    def test_submit_error(self):
+        monitor, check = self._monitor(
+            exceptions.ConnectionError(url='/taskmon/1', error='boom'))
+
+        future = self.scheduler.submit(monitor)
+
+        self.assertRaises(exceptions.ConnectionError, future.result,
+                          timeout=10)
+
+    def test_shutdown_cancels(self):
+        polled = threading.Event()
+
+        def _processing():
+            polled.set()
+            return True
+
+        monitor, check = self._monitor(_processing, retry_after=60)
+        future = self.scheduler.submit(monitor)
+        self.assertTrue(polled.wait(10))
+
+        self.scheduler.shutdown()
+
+        self.assertTrue(future.cancelled())
+        self.assertEqual(1, check.call_count)
+        self.assertRaises(RuntimeError, self.scheduler.submit, monitor)
+
+    def test_cancel(self):
+        monitor, check = self._monitor(lambda: True, retry_after=60)
+
+        future = self.scheduler.submit(monitor)
+
+        self.assertTrue(future.cancel())
+        self.assertRaises(futures.CancelledError, future.result)
+
+    def test__get_interval_retry_after(self):
+        monitor, _check = self._monitor([], retry_after=5)
+        entry = taskmonitor._PollEntry(monitor, futures.Future(), None)
+        entry.attempt = 3
+
+        self.assertEqual(5, self.scheduler._get_interval(entry))
+
+    def test__get_interval_backoff(self):
+        monitor, _check = self._monitor([])
+        entry = taskmonitor._PollEntry(monitor, futures.Future(), None)
+
+        intervals = []
+        for attempt in range(4):
+            entry.attempt = attempt
+            intervals.append(self.scheduler._get_interval(entry))
+
+        self.assertEqual([0.01, 0.02, 0.04, 0.04], intervals)
+
+    @mock.patch.object(taskmonitor.random, 'uniform', autospec=True)
+    def test__get_interval_jitter(self, mock_uniform):
+        mock_uniform.return_value = 0.05
+        scheduler = taskmonitor.TaskPollScheduler(min_interval=2, jitter=0.1)
+        self.addCleanup(scheduler.shutdown)
+        monitor, _check = self._monitor([], retry_after=10)
+        entry = taskmonitor._PollEntry(monitor, futures.Future(), None)
+
+        self.assertAlmostEqual(10.5, scheduler._get_interval(entry))
+        mock_uniform.assert_called_once_with(0, 0.1)
@@ -15,6 +15,8 @@
 
 import datetime
 import json
+import threading
+import time
 from unittest import mock
 
 import sushy
@@ -235,6 +237,18 @@ class CacheTestCase(base.TestCase):
         self.assertEqual('b', self.res._cache_get_b)
         self.assertFalse(self.res._cache_nested_resource._is_stale)
 
+    def test_cache_it_passes_arguments(self):
+        mock_method = mock.Mock(return_value='c')
+        res = self.res
+
+        @utils.cache_it
+        def get_c(res_selfie, *args, **kwargs):
+            return mock_method(*args, **kwargs)
+
+        self.assertEqual('c', get_c(res, 1, foo='bar'))
+        self.assertEqual('c', get_c(res, 2))
+        mock_method.assert_called_once_with(1, foo='bar')
+
     def test_cache_clear_failure(self):
         self.assertRaises(
             TypeError, utils.cache_clear, self.res, False, only_these=10)
@@ -247,6 +261,40 @@ class CacheTestCase(base.TestCase):
         self.assertEqual(expected, utils.sanitize(orig))
 
 
+class MapConcurrentlyTestCase(base.TestCase):
+
+    def test_sequential(self):
+        self.assertEqual([2, 4, 6],
+                         utils.map_concurrently(lambda x: x * 2, [1, 2, 3],
+                                                None))
+
+    def test_concurrent_preserves_order(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def func(x):
+            # all three calls have to be in flight at the same time
+            barrier.wait()
+            return x * 2
+
+        self.assertEqual([2, 4, 6],
+                         utils.map_concurrently(func, [1, 2, 3], 3))
+
+    def test_first_error_in_order_is_raised(self):
+        def func(x):
+            if x == 1:
+                time.sleep(0.05)
+                raise ValueError('first')
+            if x == 2:
+                raise KeyError('second')
+            return x
+
+        self.assertRaisesRegex(ValueError, 'first',
+                               utils.map_concurrently, func, [0, 1, 2], 3)
+
+    def test_empty(self):
+        self.assertEqual([], utils.map_concurrently(mock.Mock(), [], 4))
+
+
 class ProcessApplyTimeTestCase(base.TestCase):
 
     def test_process_apply_time_input(self):
@@ -14,6 +14,9 @@
 #    under the License.
 
 import collections
+from concurrent import futures
+import contextlib
+import contextvars
 import functools
 import logging
 import threading
@@ -160,6 +163,39 @@ def setdefaultattr(obj, name, default):
     return default
 
 
+_prefetched_documents = contextvars.ContextVar('prefetched_documents',
+                                               default=None)
+
+
+@contextlib.contextmanager
+def prefetched_documents(documents):
+    """Make prefetched documents available to the resources loaded within.
+
+    Resources loaded for the first time within the block take their JSON
+    document from ``documents`` if it is there instead of fetching it.
+    Outer prefetched documents are not available within the block.
+
+    :param documents: dict of the resource paths, without trailing slash,
+        and their parsed JSON documents, or None.
+    """
+    if not isinstance(documents, dict):
+        documents = None
+    token = _prefetched_documents.set(documents)
+    try:
+        yield
+    finally:
+        _prefetched_documents.reset(token)
+
+
+def get_prefetched_documents():
+    """Get the prefetched documents made available by the caller.
+
+    :returns: dict of the resource paths and their parsed JSON documents
+        or None, see `prefetched_documents`.
+    """
+    return _prefetched_documents.get()
+
+
 def cache_it(res_accessor_method):
     """Utility decorator to cache the return value of the decorated method.
 
@@ -216,6 +252,9 @@ def cache_it(res_accessor_method):
           # selective attribute clearing
           cache_clear(self, force, only_these=['nested_resource'])
 
+    Arguments passed to the decorated method are only used when the value is
+    not cached yet, they are not part of the cache key.
+
     Do note that this is not thread safe. So guard your code to protect it
     from any kind of concurrency issues while using this decorator.
 
@@ -225,12 +264,17 @@ def cache_it(res_accessor_method):
     cache_attr_name = '_cache_' + res_accessor_method.__name__
 
     @functools.wraps(res_accessor_method)
-    def func_wrapper(res_selfie):
+    def func_wrapper(res_selfie, *args, **kwargs):
 
         cache_attr_val = getattr(res_selfie, cache_attr_name, None)
         if cache_attr_val is None:
 
-            cache_attr_val = res_accessor_method(res_selfie)
+            # NOTE: resources created by the accessor may be loaded from the
+            # documents prefetched along with this resource.
+            with prefetched_documents(
+                    getattr(res_selfie, '_prefetched_docs', None)):
+                cache_attr_val = res_accessor_method(res_selfie, *args,
+                                                     **kwargs)
             setattr(res_selfie, cache_attr_name, cache_attr_val)
 
             # Note(deray): Each resource instance maintains a collection of
@@ -250,6 +294,7 @@ def cache_it(res_accessor_method):
 
         return cache_attr_val
 
+    func_wrapper.cached_resource_accessor = True
     return func_wrapper
 
 
@@ -343,6 +388,35 @@ def synchronized(wrapped):
     return wrapper
 
 
+def map_concurrently(func, items, max_workers):
+    """Call a function on every item using a bounded pool of threads.
+
+    Behaves like ``list(map(func, items))``: results are returned in the
+    order of ``items`` and the exception raised for the first failing item
+    (in that order) is propagated. Calls that have not started yet are
+    cancelled once a failure is detected.
+
+    :param func: callable accepting a single item.
+    :param items: a sequence of items.
+    :param max_workers: maximum number of concurrent calls. The calls are
+        made sequentially in the calling thread if it is lower than 2.
+    :returns: a list of results.
+    """
+    items = list(items)
+    if not max_workers or max_workers < 2 or len(items) < 2:
+        return [func(item) for item in items]
+
+    with futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(items))) as executor:
+        pending = [executor.submit(func, item) for item in items]
+        try:
+            return [future.result() for future in pending]
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+
+
 _REMOVE = frozenset(['password', 'x-auth-token'])
 
 
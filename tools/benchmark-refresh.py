@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Measure the CPU cost of refreshing resources.
+
+No BMC is needed: the resources are loaded from the JSON samples of the
+unit tests. For every resource the script reports the time per refresh:
+
+* with DEBUG logging disabled (the attribute/value walk is skipped),
+* with the attribute/value walk forced, as done before it was skipped,
+* in the lazy mode, reading a single field after every refresh.
+
+Run it from the root of the source tree::
+
+    python tools/benchmark-refresh.py --number 2000
+"""
+
+import argparse
+import json
+import logging
+import os
+import timeit
+
+from sushy.resources import base
+from sushy.resources.chassis.power import power
+from sushy.resources.registry import message_registry
+from sushy.resources.system import bios
+from sushy.resources.system import system
+
+SAMPLES = os.path.join('sushy', 'tests', 'unit', 'json_samples')
+
+RESOURCES = [
+    (system.System, 'system.json', 'power_state'),
+    (power.Power, 'power.json', 'power_supplies'),
+    (bios.Bios, 'bios.json', 'attributes'),
+    (message_registry.MessageRegistry, 'message_registry.json', 'messages'),
+]
+
+
+class FakeResponse(object):
+
+    status_code = 200
+
+    def __init__(self, json_doc):
+        self._json_doc = json_doc
+        self.content = b'{}'
+        self.headers = {}
+
+    def json(self):
+        return self._json_doc
+
+
+class FakeConnector(object):
+    """Always returns the same document without any I/O."""
+
+    def __init__(self, json_doc):
+        self._response = FakeResponse(json_doc)
+
+    def get(self, path='', **kwargs):
+        return self._response
+
+
+class FakeRoot(object):
+
+    _lazy_fields = False
+
+
+def _measure(resource, number, walk=False, field=None):
+    attrs = [attr for attr, _field in base._collect_fields(resource)]
+
+    def _run():
+        resource.invalidate()
+        resource.refresh(force=False)
+        if walk:
+            # NOTE: what refresh used to do for every resource regardless of
+            # the logging level.
+            dict(base._AttributeValues(resource, attrs))
+        if field is not None:
+            getattr(resource, field)
+
+    return timeit.timeit(_run, number=number) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=1000,
+                        help='number of refreshes per measurement')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+
+    print('%-20s %12s %12s %12s' % ('resource', 'no walk, us', 'walk, us',
+                                    'lazy, us'))
+    for resource_class, sample, field in RESOURCES:
+        with open(os.path.join(SAMPLES, sample)) as fp:
+            json_doc = json.load(fp)
+
+        root = FakeRoot()
+        resource = resource_class(FakeConnector(json_doc), '/redfish/v1/Foo',
+                                  redfish_version='1.0.2', root=root)
+        no_walk = _measure(resource, args.number)
+        walk = _measure(resource, args.number, walk=True)
+        root._lazy_fields = True
+        lazy = _measure(resource, args.number, field=field)
+
+        print('%-20s %12.1f %12.1f %12.1f' % (resource_class.__name__,
+                                              no_walk, walk, lazy))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Regenerate the index of the packaged standard registries.
+
+The index lists all documents from sushy/standard_registries in a single
+compact file together with their summary, i.e. all their properties but
+the messages. Sushy creates the registries from it and only reads the
+separate documents when their messages are used. Every document is
+validated before it is written to the index.
+
+Run it from the root of the source tree after changing the standard
+registries::
+
+    python tools/build-standard-registries-index.py
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from sushy import main as sushy_main
+from sushy.resources.registry import message_registry
+
+PACKAGE = 'sushy'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--check', action='store_true',
+                        help='only check that the index is up to date')
+    args = parser.parse_args()
+
+    registry_dir = os.path.join(PACKAGE, sushy_main.STANDARD_REGISTRY_PATH)
+    index_path = os.path.join(PACKAGE, sushy_main.STANDARD_REGISTRY_INDEX)
+
+    documents = {}
+    for name in sorted(os.listdir(registry_dir)):
+        path = os.path.join(registry_dir, name)
+        if not os.path.isfile(path):
+            continue
+
+        with open(path, encoding='utf-8') as fp:
+            json_doc = json.load(fp)
+
+        try:
+            message_registry.MessageRegistry(None, path, json_doc=json_doc)
+        except Exception as exc:
+            sys.exit(f"Registry {path} is invalid: {exc}")
+
+        documents[name] = {key: value for key, value in json_doc.items()
+                           if key != 'Messages'}
+
+    content = json.dumps({'Registries': documents}, sort_keys=True,
+                         separators=(',', ':'), ensure_ascii=False)
+
+    if args.check:
+        try:
+            with open(index_path, encoding='utf-8') as fp:
+                current = fp.read()
+        except FileNotFoundError:
+            current = None
+        if current != content + '\n':
+            sys.exit(f"{index_path} is outdated, run {sys.argv[0]}")
+        return
+
+    with open(index_path, 'w', encoding='utf-8') as fp:
+        fp.write(content + '\n')
+    print(f"Wrote {len(documents)} registries to {index_path}")
+
+
+if __name__ == '__main__':
+    main()